@@ -0,0 +1,199 @@
+"""PDF 생성 파이프라인 벤치마크 (디스플레이 없이 실행)
+
+N명 x M장의 가짜 오답 이미지와 템플릿을 만들어 generate_pdfs 를 실행하고
+pages/s, 전체 시간, 단계별 시간, 최대 메모리(RSS)를 JSON 으로 저장한다.
+
+예)
+    cd app
+    python benchmarks/bench_pdf_generator.py --students 50 --notes 20 --output bench.json
+    python benchmarks/bench_pdf_generator.py --students 50 --notes 20 --compare bench.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PIL import Image, ImageDraw  # noqa: E402
+from reportlab.lib.pagesizes import A4  # noqa: E402
+from reportlab.pdfgen import canvas  # noqa: E402
+
+import services.pdf_generator as pdf_generator  # noqa: E402
+from config import DEFAULT_CONFIG  # noqa: E402
+from utils.trace_utils import Tracer  # noqa: E402
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def peak_rss_mb():
+    """(현재 프로세스, 종료된 자식 프로세스 중 가장 큰 것) 최대 RSS (MB), 지원하지 않는 OS 는 (None, None)
+
+    자식 값은 종료되어 회수된 프로세스만 반영되므로 프로세스 풀을 wait=True 로 닫은 뒤 호출해야 한다.
+    """
+    if resource is None:
+        return None, None
+    # ru_maxrss 단위: Linux 는 KB, macOS 는 byte
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return round(own / divisor, 1), round(children / divisor, 1)
+
+
+def make_template(path):
+    c = canvas.Canvas(path, pagesize=A4)
+    page_w, page_h = A4
+    c.setFont("Helvetica-Bold", 18)
+    c.drawString(40, page_h - 50, "Benchmark template")
+    for i in range(40):
+        c.line(20, 20 + i * 20, page_w - 20, 20 + i * 20)
+    c.rect(20, 20, page_w - 40, page_h - 90)
+    c.save()
+
+
+def make_images(source_dir, count, width, height, seed):
+    rng = random.Random(seed)
+    os.makedirs(source_dir, exist_ok=True)
+    for n in range(count):
+        img = Image.new("RGB", (width, height), "white")
+        draw = ImageDraw.Draw(img)
+        # 실제 스캔처럼 압축이 덜 되도록 선/글자 비슷한 잡음을 그림
+        for _ in range(200):
+            x, y = rng.randrange(width), rng.randrange(height)
+            draw.line((x, y, x + rng.randrange(-200, 200), y + rng.randrange(-20, 20)), fill=(0, 0, 0), width=3)
+        img.save(os.path.join(source_dir, f"{1000 + n}.jpg"), quality=90)
+
+
+def make_users(students, notes, image_count, seed):
+    rng = random.Random(seed)
+    return [
+        {
+            "name": f"student{i:04d}",
+            "note_title": "bench",
+            "note_numbers": [str(1000 + rng.randrange(image_count)) for _ in range(notes)],
+        }
+        for i in range(students)
+    ]
+
+
+def run_once(config, users, jobs):
+    logs = []
+    # 단계별 시간은 pdf_generator 의 내장 추적(Tracer)으로 수집 (워커 프로세스 포함)
+    tracer = Tracer(enabled=True)
+    start = time.perf_counter()
+    success, failed = pdf_generator.generate_pdfs(config, users, logs.append, workers=jobs, tracer=tracer)
+    wall = time.perf_counter() - start
+    stages = {name: ms / 1000 for name, (_count, ms) in tracer.stage_totals().items() if name != "student"}
+
+    out_bytes = 0
+    for root, _dirs, files in os.walk(config["target_dir"]):
+        for name in files:
+            path = os.path.join(root, name)
+            out_bytes += os.path.getsize(path)
+    pages = tracer.counters.get("pages", 0)
+    return {
+        "wall_s": round(wall, 4),
+        "pages": pages,
+        "pages_per_s": round(pages / wall, 2) if wall else None,
+        "students_ok": success,
+        "students_failed": failed,
+        "output_mb": round(out_bytes / 1024 / 1024, 2),
+        "stages_s": {k: round(v, 4) for k, v in sorted(stages.items())},
+        "counters": dict(tracer.counters),
+        "warnings": sum(1 for line in logs if line.startswith(("⚠️", "❌"))),
+    }
+
+
+def compare(result, baseline_path):
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)
+    for label, new, old in (
+        ("cold", result["runs"][0], baseline["runs"][0]),
+        ("warm", result["runs"][-1], baseline["runs"][-1]),
+    ):
+        ratio = old["wall_s"] / new["wall_s"] if new["wall_s"] else float("inf")
+        print(f"{label}: {old['wall_s']}s -> {new['wall_s']}s (x{ratio:.2f})")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="PDF 생성 벤치마크")
+    parser.add_argument("--students", type=int, default=20)
+    parser.add_argument("--notes", type=int, default=20, help="학생당 오답 이미지 수")
+    parser.add_argument("--images", type=int, default=100, help="서로 다른 원본 이미지 수")
+    parser.add_argument("--width", type=int, default=2000, help="원본 이미지 가로(px)")
+    parser.add_argument("--height", type=int, default=1100, help="원본 이미지 세로(px)")
+    parser.add_argument("--jobs", type=int, default=1, help="동시 작업 수")
+    parser.add_argument("--repeat", type=int, default=2, help="실행 횟수 (첫 실행은 이미지 캐시가 빈 상태)")
+    parser.add_argument("--template", help="사용할 템플릿 PDF (기본: 합성 템플릿)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--workdir", help="작업 폴더 (기본: 임시 폴더, 종료 시 삭제)")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON")
+    args = parser.parse_args(argv)
+
+    workdir = args.workdir or tempfile.mkdtemp(prefix="copycopywa-bench-")
+    os.makedirs(workdir, exist_ok=True)
+    try:
+        source_dir = os.path.join(workdir, "src")
+        template_path = args.template or os.path.join(workdir, "template.pdf")
+        setup_start = time.perf_counter()
+        if not args.template:
+            make_template(template_path)
+        make_images(source_dir, args.images, args.width, args.height, args.seed)
+        setup_s = time.perf_counter() - setup_start
+
+        users = make_users(args.students, args.notes, args.images, args.seed)
+        config = dict(
+            DEFAULT_CONFIG,
+            source_dir=source_dir,
+            template_dir=template_path,
+            image_cache_dir=os.path.join(workdir, "cache"),
+            # 매 실행 전체 생성 시간을 재기 위해 변경 없음 건너뛰기는 끔
+            pdf_incremental=False,
+        )
+
+        runs = []
+        for i in range(args.repeat):
+            config["target_dir"] = os.path.join(workdir, f"out{i}")
+            run = run_once(config, users, args.jobs)
+            runs.append(run)
+            print(f"run {i + 1}: {run['wall_s']}s, {run['pages_per_s']} pages/s, stages={run['stages_s']}")
+        # 워커가 회수되어야 RUSAGE_CHILDREN 에 메모리가 잡힘
+        pdf_generator.shutdown_executor(wait=True)
+        main_rss, worker_rss = peak_rss_mb()
+
+        result = {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "params": {k: v for k, v in vars(args).items() if k not in ("output", "compare", "workdir")},
+            "env": {"python": platform.python_version(), "platform": platform.platform(), "cpus": os.cpu_count()},
+            "setup_s": round(setup_s, 2),
+            "runs": runs,
+            # --jobs 1 은 메인 프로세스에서 생성하고, 그 외에는 워커 하나의 최대값 (워커 합계가 아님)
+            "peak_rss_mb": max(main_rss, worker_rss) if main_rss is not None else None,
+            "peak_main_rss_mb": main_rss,
+            "peak_worker_rss_mb": worker_rss,
+        }
+        print(f"peak RSS: main {main_rss} MB / worker {worker_rss} MB")
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                json.dump(result, f, indent=2, ensure_ascii=False)
+        if args.compare:
+            compare(result, args.compare)
+        return 0
+    finally:
+        if not args.workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,133 @@
+"""오답노트 PDF 일괄 생성 (GUI 없이 실행, PySide6 를 import 하지 않음)
+
+예)
+    python cli.py                                   # 저장된(students.db) 모든 학생
+    python cli.py --excel students.xlsx --jobs 4
+    python cli.py --stdin < students.tsv             # 이름<TAB>제목<TAB>번호 또는 JSON 배열
+"""
+
+import argparse
+import logging
+import multiprocessing
+import sys
+
+from config import load_previous_config
+from services.page_layout import MAX_GRID_COLS, MAX_GRID_ROWS
+from services.pdf_generator import generate_pdfs, shutdown_executor, validate_template
+from services.student_io import parse_note_numbers, read_students_file, read_students_text
+from services.student_store import open_student_store
+from utils.trace_utils import Tracer, is_trace_enabled
+
+EXIT_OK = 0
+EXIT_PARTIAL_FAILURE = 1
+EXIT_USAGE_ERROR = 2
+
+logger = logging.getLogger("copycopyWA")
+
+
+def parse_grid(text):
+    """'3x2' -> (3, 2)"""
+    try:
+        rows, cols = (int(v) for v in text.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"세로칸x가로칸 형식이어야 합니다: {text}") from None
+    if not (1 <= rows <= MAX_GRID_ROWS and 1 <= cols <= MAX_GRID_COLS):
+        raise argparse.ArgumentTypeError(f"칸 수 범위: 세로 1~{MAX_GRID_ROWS}, 가로 1~{MAX_GRID_COLS}")
+    return rows, cols
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="오답노트 PDF 일괄 생성 (헤드리스)")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--excel", help="학생 목록 엑셀(.xlsx) 또는 CSV 파일")
+    source.add_argument("--stdin", action="store_true", help="표준입력에서 학생 목록 읽기")
+    parser.add_argument("--name", action="append", default=[], help="이 이름의 학생만 생성 (여러 번 지정 가능)")
+    parser.add_argument("--jobs", "-j", type=int, default=None, help="동시 작업 수 (기본: 설정값, 0 = CPU 코어 수)")
+    parser.add_argument("--source-dir", help="원본 이미지 폴더 (설정값 대신 사용)")
+    parser.add_argument("--target-dir", help="PDF 저장 폴더 (설정값 대신 사용)")
+    parser.add_argument("--template", help="PDF 템플릿 파일 (설정값 대신 사용)")
+    parser.add_argument("--grid", type=parse_grid, help="페이지당 이미지 배치 (세로칸x가로칸, 예: 3x2)")
+    parser.add_argument("--force", action="store_true", help="입력이 바뀌지 않은 학생도 PDF 를 다시 생성")
+    parser.add_argument("--trace", metavar="FILE", help="단계별 시간을 요약하고 Chrome trace JSON 으로 저장")
+    parser.add_argument("--quiet", "-q", action="store_true", help="경고/오류만 출력")
+    return parser
+
+
+def load_users(args):
+    if args.excel:
+        users = read_students_file(args.excel)
+    elif args.stdin:
+        users = read_students_text(sys.stdin.read())
+    else:
+        # 명령행 옵션이 반영된 config 는 넘기지 않음 (실행 옵션이 설정 파일에 저장되지 않도록)
+        store = open_student_store(load_previous_config())
+        try:
+            users = store.load_all()
+        finally:
+            store.close()
+    if args.name:
+        wanted = set(args.name)
+        users = [u for u in users if u.get("name") in wanted]
+    return [
+        {"name": u["name"], "note_title": u.get("note_title", ""), "note_numbers": numbers}
+        for u in users
+        if u.get("name") and (numbers := parse_note_numbers(u.get("note_numbers", "")))
+    ]
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(
+        level=logging.WARNING if args.quiet else logging.INFO,
+        format="[%(asctime)s] %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+
+    config = load_previous_config()
+    for key, value in (
+        ("source_dir", args.source_dir),
+        ("target_dir", args.target_dir),
+        ("template_dir", args.template),
+    ):
+        if value:
+            config[key] = value
+    if args.jobs is not None:
+        config["pdf_workers"] = args.jobs
+    if args.grid:
+        config["grid_rows"], config["grid_cols"] = args.grid
+    if args.force:
+        config["pdf_incremental"] = False
+
+    if not validate_template(config):
+        logger.error("❌ 템플릿 경로가 없습니다: %s", config.get("template_dir", ""))
+        return EXIT_USAGE_ERROR
+
+    try:
+        users = load_users(args)
+    except Exception as e:
+        logger.error("❌ 학생 목록 읽기 실패: %s", e)
+        return EXIT_USAGE_ERROR
+    if not users:
+        logger.error("❌ PDF로 저장할 학생이 없습니다.")
+        return EXIT_USAGE_ERROR
+
+    def log_callback(message):
+        level = logging.WARNING if message.startswith(("⚠️", "❌")) else logging.INFO
+        logger.log(level, message)
+
+    tracer = Tracer(bool(args.trace) or is_trace_enabled(config))
+    try:
+        success_count, fail_count = generate_pdfs(config, users, log_callback, tracer=tracer)
+    finally:
+        shutdown_executor()
+    if tracer.enabled:
+        for line in tracer.summary_lines():
+            logger.info(line)
+        logger.info("📈 trace 저장: %s", tracer.dump_chrome_trace(args.trace or None, prefix="pdf_export"))
+    logger.info("📄 PDF 생성 종료: 성공 %d명 / 실패 %d명", success_count, fail_count)
+    return EXIT_OK if fail_count == 0 else EXIT_PARTIAL_FAILURE
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    sys.exit(main())
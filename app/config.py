@@ -1,48 +1,153 @@
+import atexit
 import json
 import os
+import threading
 
 CONFIG_FILE = "prevConfig.json"
+STUDENT_DB_FILE = "students.db"
 DEFAULT_SRC = "C:/Users/Public/Pictures"
 DEFAULT_DST = "C:/Users/Public/Desktop"
+DEFAULT_IMAGE_CACHE_DIR = "cache/images"
+DEFAULT_MANIFEST_DIR = "cache/manifests"
+DEFAULT_THUMBNAIL_DIR = "cache/thumbnails"
 
 
 DEFAULT_CONFIG = {
     "source_dir": DEFAULT_SRC,
     "target_dir": DEFAULT_DST,
     "template_dir": "",
-    "users": [],
     "h_margin": 20,
     "v_margin": 20,
     "target_w": 300,
     "target_h": 160,
+    "grid_rows": 2,
+    "grid_cols": 1,
     "x_offset1": -5,
     "y_offset1": 104,
     "x_offset2": 0,
     "y_offset2": 154,
+    "slot_offsets_grid": "2x1",  # 칸별 오프셋을 맞춘 배치 (다른 배치에서는 오프셋 0)
+    "pdf_workers": 0,
+    "image_dpi": 200,
+    "image_cache_dir": DEFAULT_IMAGE_CACHE_DIR,
+    "pdf_streaming": True,
+    "pdf_incremental": True,
+    "manifest_dir": DEFAULT_MANIFEST_DIR,
+    "thumbnail_cache_dir": DEFAULT_THUMBNAIL_DIR,
+    "note_preview_visible": True,
+    "trace_enabled": False,
     "configured": False,
 }
 
+# PDF 결과물에 영향을 주는 레이아웃 설정 (값이 바뀌면 해당 학생 PDF 를 다시 생성)
+# 칸별 오프셋은 3번째 칸부터 x_offset3, y_offset3 ... (없으면 0), slot_offsets_grid 배치에서만 적용
+LAYOUT_KEYS = (
+    "grid_rows",
+    "grid_cols",
+    "h_margin",
+    "v_margin",
+    "target_w",
+    "target_h",
+    "x_offset1",
+    "y_offset1",
+    "x_offset2",
+    "y_offset2",
+    "image_dpi",
+)
+
+
+CONFIG_SAVE_DELAY = 0.3  # 초, 연속 저장을 한 번의 파일 쓰기로 묶음
+
+# 설정 파일 내용을 메모리에 한 벌만 유지 (파일 mtime/크기가 바뀌었을 때만 다시 읽음)
+_config_lock = threading.RLock()
+_config_data = None  # 파일에 저장된(또는 저장 예정인) 값, DEFAULT_CONFIG 병합 전
+_config_stamp = None
+_save_timer = None
+
+
+def _file_stamp():
+    try:
+        st = os.stat(CONFIG_FILE)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _read_config_file():
+    try:
+        with open(CONFIG_FILE, encoding="utf-8") as f:
+            data = json.load(f)
+    except Exception:
+        return None
+    return data if isinstance(data, dict) else None
+
 
 def load_previous_config():
-    if os.path.exists(CONFIG_FILE):
-        try:
-            with open(CONFIG_FILE, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                if isinstance(data, dict):
-                    config = DEFAULT_CONFIG.copy()
-                    config.update(data)
-                    config["configured"] = True
-                    return config
-        except Exception:
-            pass
-
-    # prevConfig.json 파일이 없는 경우, 디스크에 파일을 미리 쓰지 않고 configured=False 인 딕셔너리만 반환
-    default_config = DEFAULT_CONFIG.copy()
-    default_config["configured"] = False
-    return default_config
+    """설정 사본 반환 (DEFAULT_CONFIG 위에 저장된 값), 파일이 바뀌지 않았으면 다시 파싱하지 않음"""
+    global _config_data, _config_stamp
+    with _config_lock:
+        # 아직 쓰지 않은 변경이 있으면 메모리 값이 최신
+        if _save_timer is None:
+            stamp = _file_stamp()
+            if _config_data is None or stamp != _config_stamp:
+                _config_data = _read_config_file() if stamp else None
+                _config_stamp = stamp
+        config = DEFAULT_CONFIG.copy()
+        if _config_data is not None:
+            config.update(_config_data)
+            config["configured"] = True
+        else:
+            # prevConfig.json 파일이 없는 경우, 디스크에 파일을 미리 쓰지 않고 configured=False 인 딕셔너리만 반환
+            config["configured"] = False
+        return config
+
+
+def _schedule_save():
+    global _save_timer
+    if _save_timer is not None:
+        _save_timer.cancel()
+    _save_timer = threading.Timer(CONFIG_SAVE_DELAY, flush_config)
+    _save_timer.daemon = True
+    _save_timer.start()
 
 
 def save_config(config):
-    with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-        json.dump(config, f, indent=2, ensure_ascii=False)
+    """설정 일부/전체를 기존 값에 병합하고, 잠시 뒤(CONFIG_SAVE_DELAY) 한 번에 파일로 저장"""
+    global _config_data
+    with _config_lock:
+        if _config_data is None:
+            load_previous_config()
+        _config_data = {**(_config_data or {}), **config}
+        _schedule_save()
+
+
+def remove_config_keys(keys):
+    """저장된 설정에서 키 삭제 (병합 저장으로는 지울 수 없으므로 따로 둠), 지운 키가 있을 때만 저장 예약"""
+    global _config_data
+    with _config_lock:
+        if _config_data is None:
+            load_previous_config()
+        if not _config_data or not any(key in _config_data for key in keys):
+            return
+        _config_data = {key: value for key, value in _config_data.items() if key not in keys}
+        _schedule_save()
+
+
+def flush_config():
+    """저장 대기 중인 설정을 즉시 파일에 씀 (임시 파일에 쓴 뒤 교체해서 쓰다가 중단돼도 기존 파일 유지)"""
+    global _config_stamp, _save_timer
+    with _config_lock:
+        if _save_timer is None:
+            return
+        _save_timer.cancel()
+        _save_timer = None
+        tmp_path = f"{CONFIG_FILE}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(_config_data, f, indent=2, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, CONFIG_FILE)
+        _config_stamp = _file_stamp()
+
 
+atexit.register(flush_config)
@@ -1,11 +1,14 @@
+import multiprocessing
 import os
+import sqlite3
+import subprocess
 import sys
-from functools import partial
+import time
 
-import openpyxl
 from PySide6.QtCore import QTimer, Qt
-from PySide6.QtGui import QAction, QColor, QIcon
+from PySide6.QtGui import QAction, QIcon
 from PySide6.QtWidgets import (
+    QAbstractItemView,
     QApplication,
     QCheckBox,
     QComboBox,
@@ -14,16 +17,16 @@ from PySide6.QtWidgets import (
     QFrame,
     QHeaderView,
     QHBoxLayout,
+    QInputDialog,
     QLabel,
     QMainWindow,
     QMessageBox,
+    QProgressBar,
     QPushButton,
     QSplitter,
     QStatusBar,
     QStyle,
-    QTableWidget,
-    QTableWidgetItem,
-    QTextEdit,
+    QTableView,
     QVBoxLayout,
     QWidget,
     QLineEdit,
@@ -33,13 +36,29 @@ from config import (
     CONFIG_FILE,
     DEFAULT_DST,
     DEFAULT_SRC,
+    DEFAULT_THUMBNAIL_DIR,
+    flush_config,
     load_previous_config,
     save_config,
 )
 from ui.dialogs.pdf_config_dialog import DialogPdfConfig
 from ui.dialogs.dialogs import PathDialog
-from utils.log_utils import append_log
-from services.pdf_generator import save_images_to_pdf_for_dialog_users
+from ui.student_table import COL_NUMBERS, COL_STATUS, NoteNumberDelegate, StudentTableModel
+from ui.log_panel import LogPanel
+from ui.note_preview import NotePreviewPanel
+from ui.thumbnail_loader import ThumbnailLoader
+from utils.log_utils import append_log, close_log_writer
+from services.pdf_generator import shutdown_executor, validate_template
+from services.jobs import (
+    STATUS_CANCELLED,
+    STATUS_QUEUED,
+    STATUS_RUNNING,
+    JobQueue,
+    PdfExportJob,
+    StudentExportJob,
+)
+from services.student_io import iter_students_file, parse_note_numbers, read_students_file
+from services.student_store import open_student_store
 
 
 class WrongAnswerManager(QMainWindow):
@@ -58,11 +77,11 @@ class WrongAnswerManager(QMainWindow):
             self.setWindowIcon(QIcon(icon_path))
 
         # 설정 로드
-        self.config = load_previous_config() or {"users": []}
-        self.users = self.config.get("users", [])
-        self.modified_rows = set()
+        self.config = load_previous_config()
+        self.student_store = open_student_store(self.config)
         self.modified = False
         self.is_first_update = True
+        self.jobs = JobQueue(self)
 
         # --- 메뉴, 상태바, 타이머 ---
         self.setup_menus()
@@ -96,9 +115,23 @@ class WrongAnswerManager(QMainWindow):
         checkbox_layout.setContentsMargins(10, 0, 0, 5)
         table_layout.addLayout(checkbox_layout)
 
-        self.table = QTableWidget(0, 4)
+        self.table_model = StudentTableModel(self)
+        self.table = QTableView()
         self.setup_table()
-        table_layout.addWidget(self.table)
+
+        # 표 오른쪽: 선택하거나 마우스를 올린 학생의 오답노트 썸네일 (디코딩은 백그라운드)
+        self.thumbnails = ThumbnailLoader(
+            self, cache_dir=self.config.get("thumbnail_cache_dir") or DEFAULT_THUMBNAIL_DIR
+        )
+        self.note_preview = NotePreviewPanel(self.thumbnails)
+        self.note_preview.setVisible(self.note_preview_action.isChecked())
+        table_splitter = QSplitter(Qt.Horizontal)
+        table_splitter.addWidget(self.table)
+        table_splitter.addWidget(self.note_preview)
+        table_splitter.setStretchFactor(0, 3)
+        table_splitter.setStretchFactor(1, 1)
+        table_splitter.setSizes([560, 220])
+        table_layout.addWidget(table_splitter)
 
         splitter.addWidget(table_container)
 
@@ -117,8 +150,7 @@ class WrongAnswerManager(QMainWindow):
         log_header_layout.addWidget(self.clear_log_btn)
         log_layout.addLayout(log_header_layout)
 
-        self.log_output = QTextEdit()
-        self.log_output.setReadOnly(True)
+        self.log_output = LogPanel()
         log_layout.addWidget(self.log_output)
 
         splitter.addWidget(log_container)
@@ -143,13 +175,24 @@ class WrongAnswerManager(QMainWindow):
         settings_menu = menu_bar.addMenu("설정")
         path_config_action = QAction("경로 설정 열기", self)
         pdf_config_action = QAction("PDF 설정", self)
+        self.trace_action = QAction("성능 추적 기록", self)
+        self.trace_action.setCheckable(True)
+        self.trace_action.setChecked(self.config.get("trace_enabled", False))
+        self.trace_action.setToolTip("PDF 생성/복사 단계별 시간을 로그에 요약하고 trace 폴더에 저장합니다.")
+        self.note_preview_action = QAction("오답노트 미리보기", self)
+        self.note_preview_action.setCheckable(True)
+        self.note_preview_action.setChecked(self.config.get("note_preview_visible", True))
         close_action = QAction("닫기", self)
         settings_menu.addAction(path_config_action)
         settings_menu.addAction(pdf_config_action)
+        settings_menu.addAction(self.trace_action)
+        settings_menu.addAction(self.note_preview_action)
         settings_menu.addSeparator()
         settings_menu.addAction(close_action)
         path_config_action.triggered.connect(self.open_path_dialog)
         pdf_config_action.triggered.connect(self.open_config_dialog)
+        self.trace_action.toggled.connect(self.toggle_trace)
+        self.note_preview_action.toggled.connect(self.toggle_note_preview)
         close_action.triggered.connect(self.close)
         info_menu = menu_bar.addMenu("정보")
         info_action = QAction("버전확인", self)
@@ -158,6 +201,16 @@ class WrongAnswerManager(QMainWindow):
 
     def setup_status_bar(self):
         self.setStatusBar(QStatusBar(self))
+        # 백그라운드 작업 표시 (작업이 없을 때는 숨김)
+        self.job_label = QLabel()
+        self.job_progress = QProgressBar()
+        self.job_progress.setMaximumWidth(200)
+        self.job_progress.setFormat("%v/%m")
+        self.job_cancel_btn = QPushButton("취소")
+        self.job_cancel_btn.setToolTip("진행 중인 작업 취소 (이미 만들고 있는 파일은 마저 만듦)")
+        for widget in (self.job_label, self.job_progress, self.job_cancel_btn):
+            widget.setVisible(False)
+            self.statusBar().addPermanentWidget(widget)
         self.row_count_label = QLabel("총 0개")
         self.statusBar().addPermanentWidget(self.row_count_label)
 
@@ -165,6 +218,12 @@ class WrongAnswerManager(QMainWindow):
         self.search_timer = QTimer(self)
         self.search_timer.setSingleShot(True)
         self.search_timer.timeout.connect(self.filter_table)
+        # 마우스가 행 위를 지나갈 때마다가 아니라 잠시 머문 행만 미리보기
+        self.hover_timer = QTimer(self)
+        self.hover_timer.setSingleShot(True)
+        self.hover_timer.setInterval(150)
+        self.hover_timer.timeout.connect(lambda: self.show_note_preview(self.hover_row))
+        self.hover_row = -1
 
     def setup_buttons(self, parent_layout):
         btn_layout_1 = QHBoxLayout()
@@ -203,15 +262,24 @@ class WrongAnswerManager(QMainWindow):
         parent_layout.addLayout(search_layout)
 
     def setup_table(self):
-        self.table.setHorizontalHeaderLabels(["", "이름", "오답노트 제목", "오답노트 번호"])
+        self.table.setModel(self.table_model)
+        self.note_delegate = NoteNumberDelegate(self.table)
+        self.table.setItemDelegateForColumn(COL_NUMBERS, self.note_delegate)
         self.table.verticalHeader().setVisible(False)
+        # 처음에는 설정 파일 순서 그대로 보이도록 정렬 표시 없이 정렬 기능만 켬
+        self.table.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
         self.table.setSortingEnabled(True)
         self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
         self.table.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)
         self.table.horizontalHeader().setSectionResizeMode(3, QHeaderView.Stretch)
+        self.table.horizontalHeader().setSectionResizeMode(COL_STATUS, QHeaderView.ResizeToContents)
         self.table.horizontalHeader().resizeSection(0, 40)
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.table.setSelectionMode(QTableWidget.SingleSelection)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.table.setMouseTracking(True)  # 마우스를 올린 행의 오답노트 미리보기
+        self.table.setEditTriggers(
+            QAbstractItemView.DoubleClicked | QAbstractItemView.SelectedClicked | QAbstractItemView.AnyKeyPressed
+        )
 
     def connect_signals(self):
         self.add_btn.clicked.connect(self.add_row)
@@ -222,8 +290,15 @@ class WrongAnswerManager(QMainWindow):
         self.excel_export_btn.clicked.connect(self.export_excel)
         self.excel_import_btn.clicked.connect(self.import_excel)
         self.clear_log_btn.clicked.connect(self.log_output.clear)
-        self.table.cellChanged.connect(self.on_cell_changed)
-        self.table.cellClicked.connect(self.on_cell_click_row)
+        self.table_model.student_edited.connect(self.on_student_edited)
+        self.table_model.check_changed.connect(self.update_select_all_state)
+        self.note_delegate.folder_clicked.connect(self.select_note_images_for_row)
+        self.table.selectionModel().currentRowChanged.connect(lambda current, _: self.show_note_preview(current.row()))
+        self.table.entered.connect(self.on_table_hovered)
+        self.jobs.job_started.connect(self.on_job_started)
+        self.jobs.job_progress.connect(self.on_job_progress)
+        self.jobs.queue_changed.connect(self.update_job_status)
+        self.job_cancel_btn.clicked.connect(self.cancel_current_job)
         self.search_input.returnPressed.connect(self.filter_table)
         self.search_input.textChanged.connect(lambda: self.search_timer.start(100))
         self.search_column_combo.currentIndexChanged.connect(self.filter_table)
@@ -233,8 +308,8 @@ class WrongAnswerManager(QMainWindow):
         append_log(self.log_output, message)
 
     def update_row_count(self):
-        total_rows = self.table.rowCount()
-        visible_rows = sum(1 for r in range(total_rows) if not self.table.isRowHidden(r))
+        total_rows = self.table_model.total_count()
+        visible_rows = self.table_model.visible_count()
 
         search_text = self.search_input.text()
         log_this_update = False
@@ -259,37 +334,21 @@ class WrongAnswerManager(QMainWindow):
         if self.select_all_checkbox.isTristate():
             return
 
-        check_state = Qt.CheckState(state)
-        for row in range(self.table.rowCount()):
-            # 보이는 행에 대해서만 체크박스 상태 변경
-            if not self.table.isRowHidden(row):
-                widget = self.table.cellWidget(row, 0)
-                if widget:
-                    checkbox = widget.findChild(QCheckBox)
-                    if checkbox:
-                        checkbox.setCheckState(check_state)
+        # 보이는 행에 대해서만 체크 상태 변경
+        self.table_model.set_visible_checked(Qt.CheckState(state) == Qt.Checked)
 
     # 전체체크
     def update_select_all_state(self):
-        visible_rows = [r for r in range(self.table.rowCount()) if not self.table.isRowHidden(r)]
-        if not visible_rows:
-            self.select_all_checkbox.setCheckState(Qt.Unchecked)
-            return
-
-        checked_count = 0
-        for row in visible_rows:
-            widget = self.table.cellWidget(row, 0)
-            if widget:
-                checkbox = widget.findChild(QCheckBox)
-                if checkbox and checkbox.isChecked():
-                    checked_count += 1
+        # 모델이 유지하는 '보이면서 체크된 행 수'로 바로 판단 (행을 훑지 않음)
+        visible_count = self.table_model.visible_count()
+        checked_count = self.table_model.visible_checked_count()
 
         # 시그널 루프 방지를 위해 상태 변경 전 시그널 블락
         self.select_all_checkbox.blockSignals(True)
         if checked_count == 0:
             self.select_all_checkbox.setTristate(False)
             self.select_all_checkbox.setCheckState(Qt.Unchecked)
-        elif checked_count == len(visible_rows):
+        elif checked_count == visible_count:
             self.select_all_checkbox.setTristate(False)
             self.select_all_checkbox.setCheckState(Qt.Checked)
         else:
@@ -299,93 +358,35 @@ class WrongAnswerManager(QMainWindow):
 
     # -------------------- 검색 --------------------
     def filter_table(self):
-        search_text = self.search_input.text().lower()
-        search_column_index = self.search_column_combo.currentIndex()
-
-        for row in range(self.table.rowCount()):
-            match = False
-            if search_column_index == 0:  # 전체
-                texts_to_check = [
-                    self.table.item(row, 1).text(),
-                    self.table.item(row, 2).text(),
-                    self.table.cellWidget(row, 3).findChild(QLineEdit).text(),
-                ]
-                if any(search_text in t.lower() for t in texts_to_check):
-                    match = True
-            else:  # 특정 컬럼
-                col = search_column_index
-                if col == 3:  # 오답노트 번호 (위젯)
-                    cell_text = self.table.cellWidget(row, col).findChild(QLineEdit).text()
-                else:  # 이름, 제목 (아이템)
-                    cell_text = self.table.item(row, col).text()
-
-                if search_text in cell_text.lower():
-                    match = True
-
-            self.table.setRowHidden(row, not match)
-
+        # 검색 색인(미리 소문자로 바꾼 열 문자열)으로 찾음, 콤보 순서: 전체, 이름, 제목, 번호
+        # 필터링 후 전체 선택 체크박스 상태도 갱신됨
+        self.table_model.set_search(self.search_input.text(), self.search_column_combo.currentIndex())
         self.update_row_count()
-        self.update_select_all_state()  # 필터링 후 전체 선택 체크박스 상태 업데이트
 
     # -------------------- 테이블 관리 --------------------
-    def load_table(self, from_config=True):
-        if from_config:
-            self.search_input.clear()
-            self.search_timer.stop()  # 혹시 모를 타이머 중지
-            self.filter_table()  # 필터 즉시 초기화
-
-            self.config = load_previous_config() or {"users": []}
-            self.users = self.config.get("users", []) if self.config else []
-            self.log("🔄 데이터를 새로고침했습니다.")
-
-        self.table.blockSignals(True)
-        self.table.setRowCount(0)
-        for user in self.users:
-            self.add_table_row(user)
-        self.table.blockSignals(False)
+    def load_table(self):
+        start = time.perf_counter()
+        self.search_timer.stop()  # 혹시 모를 타이머 중지
+        # 검색어 초기화 (textChanged 로 인한 중복 필터링 방지)
+        self.search_input.blockSignals(True)
+        self.search_input.clear()
+        self.search_input.blockSignals(False)
 
-        self.clear_modified_marks()
-        self.filter_table()  # 필터 적용
+        self.config = load_previous_config()
+        users = self.student_store.load_all()
+
+        # 화면 갱신/정렬을 멈춘 상태에서 한 번에 채우고, 검색 필터/개수 계산도 한 번만 수행
+        self.table.setUpdatesEnabled(False)
+        self.table.setSortingEnabled(False)
+        self.table_model.set_students(users, search=("", self.search_column_combo.currentIndex()))
+        self.table.setSortingEnabled(True)  # 정렬 기준 열이 있으면 여기서 한 번 정렬
+        self.table.setUpdatesEnabled(True)
+        self.modified = False
         self.update_row_count()
-        self.update_select_all_state()  # 테이블 로드 후 전체 선택 체크박스 상태 업데이트
-
-    def add_table_row(self, user=None):
-        row = self.table.rowCount()
-        self.table.insertRow(row)
-
-        checkbox = QCheckBox()
-        checkbox.stateChanged.connect(self.update_select_all_state)  # 개별 체크박스 시그널 연결
-        w = QWidget()
-        l = QHBoxLayout(w)
-        l.addWidget(checkbox)
-        l.setAlignment(Qt.AlignCenter)
-        l.setContentsMargins(0, 0, 0, 0)
-        self.table.setCellWidget(row, 0, w)
-
-        name = user.get("name", "") if user else ""
-        title = user.get("note_title", "") if user else ""
-        numbers = user.get("note_numbers", "") if user else ""
-
-        self.table.setItem(row, 1, QTableWidgetItem(name))
-        self.table.setItem(row, 2, QTableWidgetItem(title))
-
-        note_widget = self.create_note_number_widget(numbers, row)
-        self.table.setCellWidget(row, 3, note_widget)
-
-    def create_note_number_widget(self, text, row):
-        widget = QWidget()
-        layout = QHBoxLayout(widget)
-        layout.setContentsMargins(2, 0, 2, 0)
-        line_edit = QLineEdit(text)
-        line_edit.textChanged.connect(lambda: self.on_cell_changed(row, 3))
-        button = QPushButton()
-        button.setIcon(self.style().standardIcon(QStyle.SP_DirIcon))
-        button.setFixedSize(24, 24)
-        button.clicked.connect(partial(self.select_note_images_for_row, row))
-        layout.addWidget(line_edit)
-        layout.addWidget(button)
-        widget.setLayout(layout)
-        return widget
+        self.note_preview.show_student(None, "")
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self.log(f"🔄 데이터를 새로고침했습니다. ({len(users)}명, {elapsed_ms:.0f} ms)")
 
     def select_note_images_for_row(self, row):
         self.config = load_previous_config()
@@ -398,174 +399,274 @@ class WrongAnswerManager(QMainWindow):
         files, _ = QFileDialog.getOpenFileNames(self, "이미지 파일 선택", folder, "Image Files (*.png *.jpg *.bmp)")
         if files:
             names = [os.path.splitext(os.path.basename(f))[0] for f in files]
-            widget = self.table.cellWidget(row, 3)
-            line_edit = widget.findChild(QLineEdit)
-            line_edit.setText(", ".join(names))
+            self.table_model.set_note_numbers(row, ", ".join(names))
             self.log(f"🟢 {len(names)}개 파일 선택됨 (행: {row + 1})")
 
-    def on_cell_changed(self, row, col):
+    def on_student_edited(self, row_id):
         self.modified = True
-        self.modified_rows.add(row)
-        self.mark_row_as_modified(row)
-
-    def mark_row_as_modified(self, row):
-        for col in range(1, 3):
-            item = self.table.item(row, col)
-            if item:
-                item.setBackground(QColor(255, 255, 200))
-        widget = self.table.cellWidget(row, 3)
-        if widget:
-            widget.setStyleSheet("background-color: #FFFFC8;")
+        if self.note_preview.row is not None and self.note_preview.row.id == row_id:
+            self.note_preview.refresh()
+
+    # -------------------- 오답노트 미리보기 --------------------
+    def on_table_hovered(self, index):
+        self.hover_row = index.row()
+        self.hover_timer.start()
+
+    def show_note_preview(self, position):
+        """보이는 행 번호의 학생 썸네일 표시 (같은 학생이면 다시 그리지 않음)"""
+        if not self.note_preview.isVisible() or not 0 <= position < self.table_model.visible_count():
+            return
+        row = self.table_model.row_at(position)
+        if row is self.note_preview.row:
+            return
+        self.note_preview.show_student(row, self.config.get("source_dir", DEFAULT_SRC))
+
+    def toggle_note_preview(self, checked):
+        self.note_preview.setVisible(checked)
+        save_config({"note_preview_visible": checked})
+        if checked:
+            self.show_note_preview(self.table.currentIndex().row())
 
     def clear_modified_marks(self):
-        for row in list(self.modified_rows):
-            if row < self.table.rowCount():
-                for col in range(1, 3):
-                    item = self.table.item(row, col)
-                    if item:
-                        item.setBackground(QColor(255, 255, 255))
-                widget = self.table.cellWidget(row, 3)
-                if widget:
-                    widget.setStyleSheet("")
-        self.modified_rows.clear()
+        self.table_model.clear_modified()
         self.modified = False
 
-    def on_cell_click_row(self, row, col):
-        # col == 0 인 체크박스 열만 클릭에 반응하도록 수정
-        # QCheckBox 위젯은 자체적으로 클릭 이벤트를 처리하므로,
-        # 다른 열을 클릭했을 때 체크박스 상태를 변경하는 기존 로직을 제거합니다.
-        if col == 0:
-            pass
-
     # -------------------- 데이터 관리 --------------------
     def add_row(self):
-        self.add_table_row()
+        row = self.table_model.add_student()
+        self.table.scrollTo(self.table_model.index(row, 1))
         self.modified = True
-        row = self.table.rowCount() - 1
-        self.mark_row_as_modified(row)
         self.update_row_count()
         self.log("➕ 새 행이 추가되었습니다.")
-        self.update_select_all_state()
 
     def delete_selected(self):
-        rows_to_remove = [
-            r for r in range(self.table.rowCount()) if self.table.cellWidget(r, 0).findChild(QCheckBox).isChecked()
-        ]
+        rows_to_remove = self.table_model.checked_rows()
         if not rows_to_remove:
             QMessageBox.information(self, "안내", "삭제할 행을 선택하세요.")
             return
 
-        for row in sorted(rows_to_remove, reverse=True):
-            self.table.removeRow(row)
+        self.table_model.remove_students(rows_to_remove)
+        if self.note_preview.row in rows_to_remove:
+            self.note_preview.show_student(None, "")
         self.modified = True
         self.log(f"🗑️ {len(rows_to_remove)}개 행 삭제됨")
         self.update_row_count()
-        self.update_select_all_state()
 
     def save_all(self, silent=False):
-        new_users = []
-        for row in range(self.table.rowCount()):
-            name_item = self.table.item(row, 1)
-            name = name_item.text().strip() if name_item else ""
-            if name:
-                title_item = self.table.item(row, 2)
-                title = title_item.text().strip() if title_item else ""
-                note_widget = self.table.cellWidget(row, 3)
-                numbers = note_widget.findChild(QLineEdit).text().strip()
-                new_users.append({"name": name, "note_title": title, "note_numbers": numbers})
-
-        self.users = new_users
-        self.config["users"] = self.users
-        save_config(self.config)
+        # 바뀐 행만 저장소에 반영 (이름이 빈 행은 저장하지 않고, 이미 저장된 행이면 삭제)
+        start = time.perf_counter()
+        changed_rows, deleted_ids = self.table_model.pending_changes()
+        rows_to_save = []
+        upserts = []
+        rows_to_delete = []
+        for row in changed_rows:
+            user = {key: value.strip() for key, value in row.to_dict().items()}
+            if user["name"]:
+                rows_to_save.append(row)
+                upserts.append(dict(user, id=row.db_id))
+            elif row.db_id is not None:
+                rows_to_delete.append(row)
+                deleted_ids.add(row.db_id)
+        try:
+            saved_ids = self.student_store.save_changes(upserts, deleted_ids)
+        except sqlite3.Error as e:
+            # 커밋되지 않았으므로 행의 저장소 id 는 그대로 두어 다시 저장할 수 있게 함
+            self.log(f"❌ 학생 저장 실패: {e}")
+            QMessageBox.critical(self, "오류", f"학생 저장 중 오류가 발생했습니다: {e}")
+            return
+        for row, db_id in zip(rows_to_save, saved_ids, strict=True):
+            row.db_id = db_id
+        for row in rows_to_delete:
+            row.db_id = None
+
         self.clear_modified_marks()
-        self.log("💾 모든 변경사항이 저장되었습니다.")
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        counts = f"저장 {len(upserts)}명 / 삭제 {len(deleted_ids)}명"
+        self.log(f"💾 모든 변경사항이 저장되었습니다. ({counts}, {elapsed_ms:.0f} ms)")
         if not silent:
             QMessageBox.information(self, "저장 완료", "모든 변경사항이 저장되었습니다.")
 
+    # -------------------- 백그라운드 작업 --------------------
+    def on_job_started(self, job):
+        # 작업 스레드가 보낸 시작 알림이 같은 작업의 진행률보다 먼저 도착함
+        self.job_progress.setRange(0, 0)  # 첫 진행률이 오기 전까지는 바쁨 표시
+        self.update_job_status()
+
+    def on_job_progress(self, done, total):
+        self.job_progress.setRange(0, max(total, 1))
+        self.job_progress.setValue(done)
+
+    def update_job_status(self, *_):
+        current = self.jobs.current
+        for widget in (self.job_label, self.job_progress, self.job_cancel_btn):
+            widget.setVisible(current is not None)
+        if current is None:
+            return
+        waiting = self.jobs.count() - 1
+        text = current.title + (" 취소 중" if current.is_cancelled() else " 중")
+        self.job_label.setText(f"{text} (대기 {waiting}개)" if waiting else text)
+
+    def cancel_current_job(self):
+        self.jobs.cancel_current()
+        self.update_job_status()
+
     def export_excel(self):
-        file_path, _ = QFileDialog.getSaveFileName(self, "엑셀 파일로 저장", "", "Excel Files (*.xlsx)")
+        # 내보낼 범위: 검색 중이거나 선택한 학생이 있으면 고를 수 있게 함
+        scopes = [(f"전체 ({self.table_model.total_count()}명)", self.table_model.students)]
+        if self.table_model.visible_count() != self.table_model.total_count():
+            scopes.append((f"검색 결과 ({self.table_model.visible_count()}명)", self.table_model.visible_students))
+        if self.table_model.checked_count():
+            scopes.append((f"선택한 학생 ({self.table_model.checked_count()}명)", self.table_model.checked_students))
+        get_users = scopes[0][1]
+        if len(scopes) > 1:
+            label, ok = QInputDialog.getItem(
+                self, "내보낼 범위", "내보낼 학생:", [label for label, _ in scopes], 0, False
+            )
+            if not ok:
+                return
+            get_users = dict(scopes)[label]
+
+        file_path, selected_filter = QFileDialog.getSaveFileName(
+            self, "학생 데이터 내보내기", "", "Excel Files (*.xlsx);;CSV Files (*.csv)"
+        )
         if not file_path:
             return
-        try:
-            wb = openpyxl.Workbook()
-            sheet = wb.active
-            sheet.title = "사용자 데이터"
-            headers = ["이름", "오답노트 제목", "오답노트 번호"]
-            sheet.append(headers)
-            for row in range(self.table.rowCount()):
-                name = self.table.item(row, 1).text()
-                title = self.table.item(row, 2).text()
-                numbers = self.table.cellWidget(row, 3).findChild(QLineEdit).text()
-                sheet.append([name, title, numbers])
-            wb.save(file_path)
-            self.log(f"📄 엑셀 파일로 저장 완료: {file_path}")
-            QMessageBox.information(self, "저장 완료", "엑셀 파일로 성공적으로 저장했습니다.")
-        except Exception as e:
-            self.log(f"❌ 엑셀 저장 실패: {e}")
-            QMessageBox.critical(self, "오류", f"엑셀 저장 중 오류가 발생했습니다: {e}")
+        if not os.path.splitext(file_path)[1]:
+            file_path += ".csv" if "csv" in selected_filter.lower() else ".xlsx"
+
+        # 데이터는 지금 시점의 사본을 넘기고, 파일 쓰기는 작업 큐(백그라운드 스레드)에서 실행
+        job = StudentExportJob(file_path, get_users())
+        job.job_finished.connect(self.on_excel_export_finished)
+        job.job_failed.connect(self.on_excel_export_failed)
+        if self.jobs.is_busy():
+            self.log(f"⏳ 학생 데이터 내보내기 대기 중 (앞선 작업 {self.jobs.count()}개)")
+        self.jobs.submit(job)
+
+    def on_excel_export_finished(self, result):
+        if result is None:
+            self.log("⏹️ 학생 데이터 내보내기 취소")
+            return
+        file_path, count = result
+        self.log(f"📄 학생 데이터 {count}명 저장 완료: {file_path}")
+        self.statusBar().showMessage(f"학생 데이터 {count}명을 저장했습니다.", 5000)
+
+    def on_excel_export_failed(self, error):
+        self.log(f"❌ 엑셀 저장 실패: {error}")
+        QMessageBox.critical(self, "오류", f"엑셀 저장 중 오류가 발생했습니다: {error}")
 
     def import_excel(self):
-        file_path, _ = QFileDialog.getOpenFileName(self, "엑셀 파일 선택", "", "Excel Files (*.xlsx *.xls)")
+        file_path, _ = QFileDialog.getOpenFileName(
+            self,
+            "학생 데이터 파일 선택",
+            "",
+            "학생 데이터 (*.xlsx *.xlsm *.csv);;Excel Files (*.xlsx *.xlsm);;CSV Files (*.csv)",
+        )
         if not file_path:
             return
+        reply = QMessageBox.question(
+            self,
+            "데이터 가져오기",
+            "기존 데이터를 유지하고 파일의 데이터로 추가/갱신하시겠습니까?\n"
+            "(같은 이름은 제목/번호를 갱신합니다. '아니오'를 선택하면 기존 데이터가 삭제됩니다.)",
+            QMessageBox.Yes | QMessageBox.No,
+            QMessageBox.Yes,
+        )
+        start = time.perf_counter()
+        QApplication.setOverrideCursor(Qt.WaitCursor)
         try:
-            wb = openpyxl.load_workbook(file_path)
-            sheet = wb.active
-            imported_users = [
-                {"name": str(row[0]), "note_title": str(row[1] or ""), "note_numbers": str(row[2] or "")}
-                for i, row in enumerate(sheet.iter_rows(values_only=True))
-                if i > 0 and row[0]
-            ]
-            if not imported_users:
-                QMessageBox.warning(self, "안내", "엑셀에서 사용자 데이터를 찾지 못했습니다.")
-                return
-            reply = QMessageBox.question(
-                self,
-                "데이터 가져오기",
-                "기존 데이터를 유지하고 엑셀 데이터를 추가하시겠습니까?\n('아니오'를 선택하면 기존 데이터가 삭제됩니다.)",
-                QMessageBox.Yes | QMessageBox.No,
-                QMessageBox.Yes,
-            )
+            # 파일은 한 행씩 스트리밍으로 읽고, 이름 기준으로 바뀐 행만 테이블에 반영
             if reply == QMessageBox.No:
-                self.users = imported_users
+                imported_users = read_students_file(file_path)
+                if imported_users:
+                    self.table_model.replace_students(imported_users)
+                result = {"added": len(imported_users), "updated": 0, "skipped": 0}
             else:
-                existing_names = {u["name"] for u in self.users}
-                for u in imported_users:
-                    if u["name"] not in existing_names:
-                        self.users.append(u)
-            self.load_table(from_config=False)
-            self.log(f"📊 {len(imported_users)}명의 사용자를 엑셀에서 불러왔습니다.")
-            QMessageBox.information(self, "완료", f"{len(imported_users)}명의 사용자를 불러왔습니다.")
+                result = self.table_model.merge_students(iter_students_file(file_path))
         except Exception as e:
+            QApplication.restoreOverrideCursor()
             self.log(f"❌ 엑셀 불러오기 실패: {e}")
             QMessageBox.critical(self, "오류", f"엑셀 불러오기 실패: {e}")
+            return
+        QApplication.restoreOverrideCursor()
+
+        if not any(result.values()):
+            QMessageBox.warning(self, "안내", "파일에서 사용자 데이터를 찾지 못했습니다.")
+            return
+        if result["added"] or result["updated"]:
+            # 불러온 학생은 '학생 저장' 때 저장소에 반영
+            self.modified = True
+        self.update_row_count()
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        summary = f"추가 {result['added']}명 / 갱신 {result['updated']}명 / 변경 없음 {result['skipped']}명"
+        self.log(f"📊 학생 데이터 불러오기: {summary} ({elapsed_ms:.0f} ms)")
+        QMessageBox.information(self, "완료", f"학생 데이터를 불러왔습니다.\n{summary}")
 
     def export_pdf(self):
         if self.modified:
             self.save_all(silent=True)
             self.log("💾 PDF 저장을 위해 변경사항을 자동으로 저장했습니다.")
         checked_users = []
-        for row in range(self.table.rowCount()):
-            if self.table.cellWidget(row, 0).findChild(QCheckBox).isChecked():
-                name_item = self.table.item(row, 1)
-                name = name_item.text() if name_item else ""
-                title_item = self.table.item(row, 2)
-                title = title_item.text() if title_item else ""
-                note_widget = self.table.cellWidget(row, 3)
-                numbers_text = note_widget.findChild(QLineEdit).text()
-                numbers = [num.strip() for num in numbers_text.split(",") if num.strip()]
-                if name and numbers:
-                    checked_users.append({"name": name, "note_title": title, "note_numbers": numbers})
+        row_ids = []  # 작업의 학생 번호 -> 테이블 행 id
+        for row in self.table_model.checked_rows():
+            numbers = parse_note_numbers(row.note_numbers)
+            if row.name and numbers:
+                checked_users.append({"name": row.name, "note_title": row.note_title, "note_numbers": numbers})
+                row_ids.append(row.id)
         if not checked_users:
             QMessageBox.warning(self, "알림", "PDF로 저장할 사용자를 선택하세요.")
             return
         self.config = load_previous_config()
-        save_images_to_pdf_for_dialog_users(
-            config=self.config,
-            users=checked_users,
-            log_callback=self.log,
-            parent_widget=self,
+        if not validate_template(self.config):
+            self.log("❌ 템플릿 경로가 없습니다.")
+            QMessageBox.warning(self, "경고", "PDF 템플릿 파일이 설정되지 않았습니다.")
+            return
+
+        # PDF 생성은 작업 큐(백그라운드 스레드 + 프로세스 풀)에서 실행, 진행 중이면 뒤에 대기
+        if self.jobs.is_busy():
+            self.log(f"⏳ PDF 생성 대기 중: {len(checked_users)}명 (앞선 작업 {self.jobs.count()}개)")
+        else:
+            self.log(f"📄 PDF 생성 시작: {len(checked_users)}명")
+        for row_id in row_ids:
+            self.table_model.set_status(row_id, STATUS_QUEUED)
+        job = PdfExportJob(self.config, checked_users)
+        job.log_message.connect(self.log)
+        job.item_status.connect(
+            lambda index, state, message: self.table_model.set_status(row_ids[index], state, message)
         )
+        job.job_finished.connect(self.on_pdf_export_finished)
+        job.job_failed.connect(lambda error: self.on_pdf_export_failed(error, row_ids))
+        self.jobs.submit(job)
+
+    def on_pdf_export_finished(self, result):
+        success_count, fail_count = result
+        self.log(f"📄 PDF 생성 종료: 성공 {success_count}명 / 실패 {fail_count}명")
+        self.statusBar().showMessage(f"PDF 생성 완료: 성공 {success_count}명 / 실패 {fail_count}명", 5000)
+        # 다른 작업이 이어서 돌고 있으면 폴더는 마지막 작업 때만 열기
+        if success_count and self.jobs.count() <= 1:
+            self.open_target_folder()
+
+    def on_pdf_export_failed(self, error, row_ids):
+        # 작업 전체가 실패하면 아직 끝나지 않은 학생은 취소로 표시
+        for row_id in row_ids:
+            state, _ = self.table_model.statuses.get(row_id, (None, ""))
+            if state in (STATUS_QUEUED, STATUS_RUNNING):
+                self.table_model.set_status(row_id, STATUS_CANCELLED, error)
+        self.log(f"❌ PDF 생성 중 오류 발생: {error}")
+        QMessageBox.critical(self, "오류", f"PDF 생성 중 오류가 발생했습니다: {error}")
+
+    def open_target_folder(self):
+        # 생성된 파일이 있는 폴더 열기
+        target_dir = os.path.abspath(self.config.get("target_dir", DEFAULT_DST))
+        try:
+            if sys.platform == "win32":
+                os.startfile(target_dir)
+            elif sys.platform == "darwin":
+                subprocess.Popen(["open", target_dir])
+            else:
+                subprocess.Popen(["xdg-open", target_dir])
+            self.log(f"📁 폴더 열기: {target_dir}")
+        except Exception as e:
+            self.log(f"❌ 폴더를 여는 데 실패했습니다: {e}")
 
     # -------------------- 메뉴 액션 및 기타 --------------------
     def open_path_dialog(self):
@@ -573,8 +674,13 @@ class WrongAnswerManager(QMainWindow):
         if dlg.exec():
             self.log("경로 설정 저장 완료!")
 
+    def toggle_trace(self, checked):
+        self.config["trace_enabled"] = checked
+        save_config({"trace_enabled": checked})
+        self.log(f"📈 성능 추적 기록: {'켜짐' if checked else '꺼짐'}")
+
     def open_config_dialog(self):
-        dialog = DialogPdfConfig(self)
+        dialog = DialogPdfConfig(self, self.thumbnails)
         if dialog.exec():
             self.log("PDF 설정 완료!")
 
@@ -609,7 +715,7 @@ class WrongAnswerManager(QMainWindow):
             )
 
             # --- 2단계: PDF 이미지 설정 (DialogPdfConfig) ---
-            pdf_dlg = DialogPdfConfig(self)
+            pdf_dlg = DialogPdfConfig(self, self.thumbnails)
             pdf_dlg.setWindowTitle("PDF 이미지 설정 (2/2단계)")
             if pdf_dlg.exec() == QDialog.Accepted:
                 self.log("🟢 2단계: PDF 이미지 설정이 저장되었습니다.")
@@ -617,9 +723,8 @@ class WrongAnswerManager(QMainWindow):
                 self.log("⚠️ 2단계: PDF 이미지 설정을 건너뛰었습니다.")
 
             # 설정 완료 상태 저장
-            self.config = load_previous_config() or {}
-            self.config["configured"] = True
-            save_config(self.config)
+            save_config({"configured": True})
+            self.config = load_previous_config()
             self.log("🎉 모든 초기 설정 단계가 완료되었습니다.")
 
             # 완료 안내 메시지
@@ -635,6 +740,20 @@ class WrongAnswerManager(QMainWindow):
         QMessageBox.information(self, "버전 정보", "오답노트 관리 프로그램 v1.1.0")
 
     def closeEvent(self, event):
+        if self.jobs.is_busy():
+            reply = QMessageBox.question(
+                self,
+                "작업 진행 중",
+                f"진행 중이거나 대기 중인 작업이 {self.jobs.count()}개 있습니다. 작업을 취소하고 종료하시겠습니까?",
+                QMessageBox.Yes | QMessageBox.No,
+                QMessageBox.No,
+            )
+            if reply != QMessageBox.Yes:
+                event.ignore()
+                return
+            # 지금 만들고 있는 파일까지만 마무리하고 종료 (반쯤 쓰인 파일을 남기지 않음)
+            self.jobs.cancel_all()
+            self.jobs.wait()
         if self.modified:
             reply = QMessageBox.question(
                 self,
@@ -652,9 +771,18 @@ class WrongAnswerManager(QMainWindow):
                 event.ignore()
         else:
             event.accept()
+        if event.isAccepted():
+            self.thumbnails.cancel_pending()
+            self.thumbnails.wait()
+            shutdown_executor()
+            self.student_store.close()
+            flush_config()
+            close_log_writer()
 
 
 if __name__ == "__main__":
+    # PyInstaller(onefile) 빌드에서 PDF 프로세스 풀 워커가 정상 기동되도록 필요
+    multiprocessing.freeze_support()
     app = QApplication(sys.argv)
     window = WrongAnswerManager()
     window.show()
@@ -0,0 +1,65 @@
+import hashlib
+import os
+import threading
+
+from PIL import Image
+
+from config import DEFAULT_IMAGE_CACHE_DIR
+
+PT_PER_INCH = 72
+
+
+def _cache_key(img_file, stat, max_w, max_h, save_format):
+    raw = f"{os.path.abspath(img_file)}|{stat.st_size}|{stat.st_mtime_ns}|{max_w}x{max_h}|{save_format}"
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def downscale_to_cache(img_file, max_w, max_h, cache_dir, jpeg_quality=90, optimize=True, keep_small=True):
+    """원본 이미지를 max_w x max_h(px) 안으로 줄여 디스크 캐시에 저장한 경로 반환 (경로+크기+mtime 기준으로 재사용)
+
+    투명도가 있으면 PNG, 없으면 JPEG(jpeg_quality) 로 저장한다.
+    keep_small 이면 이미 충분히 작은 원본은 저장하지 않고 원본 경로를 그대로 돌려준다.
+    """
+    stat = os.stat(img_file)
+    key = _cache_key(img_file, stat, max_w, max_h, f"q{jpeg_quality}{'o' if optimize else ''}")
+    for ext in (".jpg", ".png"):
+        cached = os.path.join(cache_dir, key[:2], key + ext)
+        if os.path.isfile(cached):
+            return cached
+
+    with Image.open(img_file) as img:
+        iw, ih = img.size
+        ratio = min(max_w / iw, max_h / ih)
+        if ratio >= 1:
+            if keep_small:
+                return img_file
+            ratio = 1
+        size = (max(1, round(iw * ratio)), max(1, round(ih * ratio)))
+        # JPEG 은 디코딩 단계에서 미리 축소 (큰 스캔 파일도 전체 해상도로 풀지 않음)
+        img.draft("RGB", size)
+        has_alpha = img.mode in ("RGBA", "LA", "P")
+        resized = img.convert("RGBA" if has_alpha else "RGB")
+        if resized.size != size:
+            resized = resized.resize(size, Image.LANCZOS)
+
+    ext = ".png" if has_alpha else ".jpg"
+    cached = os.path.join(cache_dir, key[:2], key + ext)
+    os.makedirs(os.path.dirname(cached), exist_ok=True)
+    # 여러 스레드/워커 프로세스가 같은 이미지를 동시에 만들 수 있으므로 임시 파일에 쓰고 교체
+    tmp_path = f"{cached}.{os.getpid()}.{threading.get_ident()}.tmp"
+    if has_alpha:
+        resized.save(tmp_path, "PNG", optimize=optimize)
+    else:
+        resized.save(tmp_path, "JPEG", quality=jpeg_quality, optimize=optimize)
+    os.replace(tmp_path, cached)
+    return cached
+
+
+def prepare_note_image(img_file, target_w, target_h, dpi, cache_dir=DEFAULT_IMAGE_CACHE_DIR):
+    """출력 박스(target_w x target_h pt)에 맞는 해상도로 줄인 이미지 경로 반환 (디스크 캐시 재사용)
+
+    원본이 이미 충분히 작거나 dpi 가 0 이하이면 원본 경로를 그대로 돌려준다.
+    """
+    if not dpi or dpi <= 0:
+        return img_file
+    return downscale_to_cache(img_file, target_w * dpi / PT_PER_INCH, target_h * dpi / PT_PER_INCH, cache_dir)
@@ -0,0 +1,191 @@
+import threading
+from abc import ABCMeta, abstractmethod
+from collections import deque
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+from services.pdf_generator import generate_pdfs
+from services.student_io import write_students_file
+
+# 학생(항목)별 상태
+STATUS_QUEUED = "queued"
+STATUS_RUNNING = "running"
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+STATUS_CANCELLED = "cancelled"
+FINISHED_STATUSES = (STATUS_DONE, STATUS_FAILED, STATUS_CANCELLED)
+
+
+class JobCancelled(Exception):
+    pass
+
+
+class _JobMeta(ABCMeta, type(QObject)):
+    """QObject 와 ABC 를 함께 쓰기 위한 메타클래스"""
+
+
+class Job(QObject, metaclass=_JobMeta):
+    """백그라운드 작업 하나: run() 은 스레드 풀에서 실행하고, 진행/결과는 시그널로 GUI 스레드에 전달"""
+
+    title = "작업"
+
+    job_running = Signal()  # 스레드 풀에서 실제로 실행을 시작함
+    log_message = Signal(str)
+    progress = Signal(int, int)  # 완료 수, 전체 수
+    item_status = Signal(int, str, str)  # 항목 번호, 상태, 메시지
+    job_finished = Signal(object)  # run() 반환값
+    job_failed = Signal(str)
+
+    def __init__(self):
+        # QObject 생성은 ABCMeta 의 추상 메서드 검사를 거치지 않으므로 직접 확인
+        if self.__abstractmethods__:
+            raise TypeError(f"{type(self).__name__} 는 run() 을 구현해야 합니다.")
+        super().__init__()
+        self.cancel_event = threading.Event()
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    def is_cancelled(self):
+        return self.cancel_event.is_set()
+
+    @abstractmethod
+    def run(self):
+        """작업 본문 (스레드 풀에서 실행), 반환값은 job_finished 로 전달"""
+
+    def execute(self):
+        self.job_running.emit()
+        try:
+            result = self.run()
+        except Exception as e:
+            self.job_failed.emit(str(e))
+            return
+        self.job_finished.emit(result)
+
+
+class _JobRunnable(QRunnable):
+    def __init__(self, job):
+        super().__init__()
+        self.job = job
+
+    def run(self):
+        self.job.execute()
+
+
+class JobQueue(QObject):
+    """작업을 넣은 순서대로 하나씩 실행 (실행 중에도 새 작업을 넣을 수 있음)"""
+
+    job_started = Signal(object)  # 스레드 풀에서 실행을 시작한 작업
+    job_progress = Signal(int, int)  # 실행 중인 작업의 진행률 (완료 수, 전체 수)
+    job_done = Signal(object)  # 성공/실패/취소와 상관없이 끝난 작업
+    queue_changed = Signal(int)  # 실행 중 + 대기 중인 작업 수
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        self._pending = deque()
+        self.current = None
+
+    def submit(self, job):
+        """작업 추가, 호출한 쪽의 시그널 연결이 먼저 처리되도록 큐 처리는 마지막에 연결"""
+        job.setParent(self)
+        # 작업 스레드에서 바로 진행률을 보내므로 시작 알림을 받은 뒤가 아니라 여기서 연결
+        job.job_running.connect(lambda job=job: self.job_started.emit(job))
+        job.progress.connect(self.job_progress)
+        job.job_finished.connect(lambda _result, job=job: self._on_job_done(job))
+        job.job_failed.connect(lambda _error, job=job: self._on_job_done(job))
+        self._pending.append(job)
+        self.queue_changed.emit(self.count())
+        self._start_next()
+
+    def count(self):
+        return len(self._pending) + (1 if self.current is not None else 0)
+
+    def is_busy(self):
+        return self.count() > 0
+
+    def cancel_current(self):
+        if self.current is not None:
+            self.current.cancel()
+
+    def cancel_all(self):
+        # 대기 중인 작업도 시작하자마자 취소 처리되도록 표시만 함 (항목 상태 정리는 각 작업이 함)
+        for job in self._pending:
+            job.cancel()
+        self.cancel_current()
+
+    def wait(self):
+        self._pool.waitForDone()
+
+    def _start_next(self):
+        if self.current is not None or not self._pending:
+            return
+        self.current = self._pending.popleft()
+        self.queue_changed.emit(self.count())
+        self._pool.start(_JobRunnable(self.current))
+
+    def _on_job_done(self, job):
+        if job is self.current:
+            self.current = None
+        self.job_done.emit(job)
+        job.deleteLater()
+        self.queue_changed.emit(self.count())
+        self._start_next()
+
+
+class PdfExportJob(Job):
+    """선택한 학생들의 PDF 생성 (결과: (성공 수, 실패 수))"""
+
+    title = "PDF 생성"
+
+    def __init__(self, config, users, workers=None):
+        super().__init__()
+        self.config = config
+        self.users = users
+        self.workers = workers
+
+    def run(self):
+        total = len(self.users)
+        finished = 0
+
+        def on_status(index, state, message=""):
+            nonlocal finished
+            self.item_status.emit(index, state, message)
+            if state in FINISHED_STATUSES:
+                finished += 1
+                self.progress.emit(finished, total)
+
+        self.progress.emit(0, total)
+        return generate_pdfs(
+            self.config,
+            self.users,
+            self.log_message.emit,
+            self.workers,
+            status_callback=on_status,
+            cancel_event=self.cancel_event,
+        )
+
+
+class StudentExportJob(Job):
+    """학생 데이터 엑셀/CSV 내보내기 (결과: (파일 경로, 행 수), 취소되면 None)"""
+
+    title = "학생 데이터 내보내기"
+
+    def __init__(self, file_path, users):
+        super().__init__()
+        self.file_path = file_path
+        self.users = users
+
+    def run(self):
+        def on_progress(done, total):
+            self.progress.emit(done, total)
+            if self.is_cancelled():
+                raise JobCancelled
+
+        try:
+            count = write_students_file(self.file_path, self.users, on_progress)
+        except JobCancelled:
+            # 쓰던 임시 파일은 write_students_file 이 지우고, 기존 파일은 그대로 둠
+            return None
+        return self.file_path, count
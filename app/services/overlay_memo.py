@@ -0,0 +1,80 @@
+import threading
+from collections import OrderedDict
+
+# 프로세스마다 메모에 붙잡아 둘 오버레이 PDF 용량 (워커 프로세스마다 따로 듦)
+OVERLAY_MEMO_BYTES = 24 * 1024 * 1024
+
+
+class OverlayMemo:
+    """이미지 배치만 그린 오버레이 페이지 메모 (LRU, 용량 기준)
+
+    같은 이미지 조합을 같은 위치에 그리는 페이지는 학생이 달라도 결과가 같으므로,
+    한 번 그리고 파싱한 페이지를 재사용한다. 키는 (레이아웃, 페이지에 들어가는 이미지와 칸) 이고
+    템플릿은 페이지를 추가할 때 따로 찍으므로 키에 넣지 않는다.
+    값은 (PdfReader, 페이지) 이며 reader 를 같이 들고 있어야 페이지 객체를 복제할 수 있다.
+    여러 페이지가 한 reader(여러 페이지를 한 번에 그린 PDF)를 공유하므로, 용량은 reader 단위로 세고
+    그 reader 의 페이지가 모두 빠져야 줄어든다.
+    """
+
+    def __init__(self, max_bytes=OVERLAY_MEMO_BYTES):
+        self.max_bytes = max_bytes
+        self._pages = OrderedDict()  # 키 -> (reader, 페이지)
+        self._readers = {}  # id(reader) -> [PDF 크기, 메모에 남은 페이지 수]
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._pages)
+
+    @property
+    def size_bytes(self):
+        return self._bytes
+
+    def get(self, key):
+        with self._lock:
+            entry = self._pages.get(key)
+            if entry is not None:
+                self._pages.move_to_end(key)
+            return entry
+
+    def put(self, key, reader, page, reader_bytes):
+        """reader_bytes: reader 가 파싱한 PDF 크기 (같은 reader 의 페이지끼리는 한 번만 셈)"""
+        if reader_bytes > self.max_bytes:
+            return
+        with self._lock:
+            old = self._pages.pop(key, None)
+            if old is not None:
+                self._release(old[0])
+            self._pages[key] = (reader, page)
+            usage = self._readers.get(id(reader))
+            if usage is None:
+                usage = self._readers[id(reader)] = [reader_bytes, 0]
+                self._bytes += reader_bytes
+            usage[1] += 1
+            while self._bytes > self.max_bytes and self._pages:
+                _key, (old_reader, _page) = self._pages.popitem(last=False)
+                self._release(old_reader)
+
+    def _release(self, reader):
+        usage = self._readers[id(reader)]
+        usage[1] -= 1
+        if usage[1] == 0:
+            del self._readers[id(reader)]
+            self._bytes -= usage[0]
+
+    def clear(self):
+        with self._lock:
+            self._pages.clear()
+            self._readers.clear()
+            self._bytes = 0
+
+
+_memo = None
+
+
+def get_overlay_memo():
+    """프로세스 공용 메모 (프로세스 풀 워커는 재사용되므로 여러 번의 내보내기에 걸쳐 유지)"""
+    global _memo
+    if _memo is None:
+        _memo = OverlayMemo()
+    return _memo
@@ -0,0 +1,107 @@
+from collections import namedtuple
+from functools import lru_cache
+
+from reportlab.lib.pagesizes import A4
+
+from config import DEFAULT_CONFIG
+
+MAX_GRID_ROWS = 4
+MAX_GRID_COLS = 3
+# 예전(칸 배치 도입 전) 배치: 기존 오프셋 값이 이 배치의 칸 왼쪽 아래를 기준으로 맞춰져 있음
+LEGACY_GRID = (2, 1)
+
+# 이미지 박스 (PDF 좌표, 왼쪽 아래 기준, 칸별 오프셋 포함)
+SlotRect = namedtuple("SlotRect", ["x", "y", "width", "height"])
+
+
+def slot_offset_keys(slot):
+    """칸 번호(0부터) -> 설정 키 (x_offset1, y_offset1), ..."""
+    return f"x_offset{slot + 1}", f"y_offset{slot + 1}"
+
+
+def grid_name(rows, cols):
+    """(3, 2) -> '3x2' (칸별 오프셋을 맞춘 배치 기록용, 설정 키 slot_offsets_grid)"""
+    return f"{rows}x{cols}"
+
+
+class PageLayout:
+    """한 페이지에 rows x cols 칸으로 이미지를 배치하는 표 (설정값마다 한 번만 계산)
+
+    칸 순서는 왼쪽 -> 오른쪽, 위 -> 아래. 칸마다 target_w x target_h 박스(칸보다 크면 칸 크기)를
+    칸 가운데에 두고, 이미지는 비율을 유지한 채 박스에 맞춰 가운데 배치한다.
+    예전 2x1 배치만은 기존 오프셋과 결과가 바뀌지 않도록 박스를 칸 왼쪽 아래에 둔다.
+    """
+
+    __slots__ = ("rows", "cols", "page_w", "page_h", "slots", "key")
+
+    def __init__(self, rows, cols, page_w, page_h, slots):
+        self.rows = rows
+        self.cols = cols
+        self.page_w = page_w
+        self.page_h = page_h
+        self.slots = slots
+        self.key = (rows, cols, page_w, page_h, slots)
+
+    @property
+    def per_page(self):
+        return len(self.slots)
+
+    def place(self, slot, image_w, image_h):
+        """이미지 크기(px) -> 박스에 맞춘 (x, y, w, h)"""
+        rect = self.slots[slot]
+        ratio = min(rect.width / image_w, rect.height / image_h)
+        draw_w = image_w * ratio
+        draw_h = image_h * ratio
+        return rect.x + (rect.width - draw_w) / 2, rect.y + (rect.height - draw_h) / 2, draw_w, draw_h
+
+
+def _clamp(value, low, high):
+    return max(low, min(high, value))
+
+
+@lru_cache(maxsize=32)
+def _build_layout(rows, cols, page_w, page_h, h_margin, v_margin, box_w, box_h, offsets):
+    cell_w = (page_w - (cols + 1) * h_margin) / cols
+    cell_h = (page_h - (rows + 1) * v_margin) / rows
+    box_w = min(box_w, cell_w)
+    box_h = min(box_h, cell_h)
+    legacy = (rows, cols) == LEGACY_GRID
+    slots = []
+    for row in range(rows):
+        y = page_h - v_margin - (row + 1) * cell_h - row * v_margin
+        if not legacy:
+            y += (cell_h - box_h) / 2
+        for col in range(cols):
+            x = h_margin + col * (cell_w + h_margin)
+            if not legacy:
+                x += (cell_w - box_w) / 2
+            x_offset, y_offset = offsets[row * cols + col]
+            slots.append(SlotRect(x + x_offset, y + y_offset, box_w, box_h))
+    return PageLayout(rows, cols, page_w, page_h, tuple(slots))
+
+
+def compute_layout(config, page_size=A4):
+    """설정(dict) -> PageLayout, 같은 값이면 캐시된 표를 그대로 반환"""
+
+    def value(key, default=0):
+        return config.get(key, DEFAULT_CONFIG.get(key, default))
+
+    rows = _clamp(int(value("grid_rows", 2)), 1, MAX_GRID_ROWS)
+    cols = _clamp(int(value("grid_cols", 1)), 1, MAX_GRID_COLS)
+    # 칸별 오프셋은 맞춘 배치에서만 적용 (2x1 에 맞춘 값이 다른 배치의 칸을 밀어내지 않도록)
+    if value("slot_offsets_grid", grid_name(*LEGACY_GRID)) == grid_name(rows, cols):
+        offsets = tuple(tuple(value(key) for key in slot_offset_keys(slot)) for slot in range(rows * cols))
+    else:
+        offsets = ((0, 0),) * (rows * cols)
+    page_w, page_h = page_size
+    return _build_layout(
+        rows,
+        cols,
+        page_w,
+        page_h,
+        value("h_margin"),
+        value("v_margin"),
+        value("target_w"),
+        value("target_h"),
+        offsets,
+    )
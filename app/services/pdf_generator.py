@@ -1,117 +1,377 @@
 import io
 import os
-import subprocess
-import sys
-from copy import deepcopy
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
 
 from PyPDF2 import PdfReader, PdfWriter
-from reportlab.lib.pagesizes import A4
+from reportlab import rl_config
 from reportlab.lib.utils import ImageReader
 from reportlab.pdfgen import canvas
-from PySide6.QtWidgets import QMessageBox
 
-from config import DEFAULT_DST
+from config import DEFAULT_DST, DEFAULT_IMAGE_CACHE_DIR, DEFAULT_MANIFEST_DIR
+from services.image_cache import prepare_note_image
+from services.overlay_memo import get_overlay_memo
+from services.page_layout import compute_layout
+from services.pdf_manifest import input_fingerprint, is_up_to_date, template_hash, write_manifest
+from services.pdf_stream_writer import StreamingPdfWriter, release_source
+from services.pdf_template import load_template
+from utils.source_index import IMAGE_EXTENSIONS, get_source_index
+from utils.trace_utils import Tracer, is_trace_enabled, report_trace
 
+# 이미지/내용 스트림을 ASCII85 텍스트로 한 번 더 인코딩하지 않음 (순수 파이썬 인코딩이라 느리고 크기도 25% 커짐)
+rl_config.useA85 = 0
 
-def save_images_to_pdf_for_dialog_users(config, users, log_callback, parent_widget):
-    """Dialog 전용 PDF 생성"""
-    source_dir = config.get("source_dir", "")
+# 스트리밍 모드에서 오버레이 캔버스를 몇 페이지 단위로 끊어 파싱/기록할지 (메모리 상한)
+OVERLAY_CHUNK_PAGES = 16
+
+# 프로세스 풀은 한 번 만들어 두고 재사용 (워커 기동 비용 절약)
+_executor = None
+_executor_workers = 0
+
+
+def resolve_worker_count(config):
+    """설정값(pdf_workers)으로 실제 사용할 워커 수 계산 (0 이하 = CPU 코어 수)"""
+    try:
+        workers = int(config.get("pdf_workers", 0) or 0)
+    except (TypeError, ValueError):
+        workers = 0
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+    return max(1, workers)
+
+
+def get_executor(workers):
+    global _executor, _executor_workers
+    if _executor is None or _executor_workers != workers:
+        shutdown_executor()
+        _executor = ProcessPoolExecutor(max_workers=workers)
+        _executor_workers = workers
+    return _executor
+
+
+def shutdown_executor(wait=False):
+    """프로세스 풀 종료 (wait 이면 워커 프로세스가 끝날 때까지 기다림)"""
+    global _executor, _executor_workers
+    if _executor is not None:
+        _executor.shutdown(wait=wait, cancel_futures=True)
+        _executor = None
+        _executor_workers = 0
+
+
+def validate_template(config):
     template_path = config.get("template_dir", "")
     if not template_path or not os.path.isfile(template_path):
-        log_callback("❌ 템플릿 경로가 없습니다.")
-        QMessageBox.warning(parent_widget, "경고", "PDF 템플릿 파일이 설정되지 않았습니다.")
-        return
+        return None
+    return template_path
 
-    try:
-        template_reader = PdfReader(template_path)
-        template_page = template_reader.pages[0]
-        page_w, page_h = A4
-        cfg = config
-        h_margin = cfg.get("h_margin", 20)
-        v_margin = cfg.get("v_margin", 30)
-        target_w = cfg.get("target_w", 300)
-        target_h = cfg.get("target_h", 160)
-        img_h = (page_h - (2 + 1) * v_margin) / 2
 
-        for user in users:
-            try:
-                user_folder = os.path.join(cfg.get("target_dir", DEFAULT_DST), user["name"])
-                os.makedirs(user_folder, exist_ok=True)
+def output_pdf_path(config, user):
+    """학생 PDF 경로 (대상 폴더/이름/이름_제목.pdf), 다시 생성하면 같은 파일을 덮어씀"""
+    user_folder = os.path.join(config.get("target_dir", DEFAULT_DST), user["name"])
+    return os.path.join(user_folder, f"{user['name']}_{user['note_title']}.pdf")
 
-                base_pdf_name = f"{user['name']}_{user['note_title']}.pdf"
-                pdf_path = os.path.join(user_folder, base_pdf_name)
-                counter = 1
-                while os.path.exists(pdf_path):
-                    pdf_path = os.path.join(user_folder, f"{user['name']}_{user['note_title']}_{counter}.pdf")
-                    counter += 1
 
-                writer = PdfWriter()
+def resolve_note_entries(source_index, note_numbers):
+    """오답노트 번호 -> 원본 색인 항목(SourceEntry, 없으면 None) 목록"""
+    entries = []
+    for note_number in note_numbers:
+        note_number = note_number.strip()
+        entry = source_index.lookup(note_number, IMAGE_EXTENSIONS) if note_number else None
+        entries.append((note_number, entry))
+    return entries
 
-                for i, note_number in enumerate(user["note_numbers"]):
-                    note_number = note_number.strip()
-                    if not note_number:
-                        continue
 
-                    img_file = os.path.join(source_dir, f"{note_number}.jpg")
-                    if not os.path.isfile(img_file):
-                        log_callback(f"⚠️ 이미지 파일 없음: {img_file}")
-                        continue
+def _note_paths(entries):
+    return [(number, entry.path if entry else None) for number, entry in entries]
 
-                    idx_in_page = i % 2
-                    if idx_in_page == 0:
-                        packet = io.BytesIO()
-                        c = canvas.Canvas(packet, pagesize=A4)
 
-                    row = idx_in_page
-                    x = h_margin
-                    y = page_h - v_margin - (row + 1) * img_h - row * v_margin
+def resolve_note_files(source_index, note_numbers):
+    """오답노트 번호 -> 이미지 경로 (없으면 None) 목록"""
+    return _note_paths(resolve_note_entries(source_index, note_numbers))
 
-                    x_offset = cfg.get("x_offset1", 0) if idx_in_page == 0 else cfg.get("x_offset2", 0)
-                    y_offset = cfg.get("y_offset1", -50) if idx_in_page == 0 else cfg.get("y_offset2", 10)
 
-                    try:
-                        img = ImageReader(img_file)
-                        iw, ih = img.getSize()
-                        ratio = min(target_w / iw, target_h / ih)
-                        draw_w = iw * ratio
-                        draw_h = ih * ratio
-                        draw_x = x + (target_w - draw_w) / 2 + x_offset
-                        draw_y = y + (target_h - draw_h) / 2 + y_offset
-                        c.drawImage(img, draw_x, draw_y, width=draw_w, height=draw_h)
-                    except Exception as e:
-                        log_callback(f"⚠️ 이미지 삽입 실패: {img_file} ({e})")
-                        continue
+def build_user_pdf(config, user):
+    """학생 한 명의 PDF 생성 (프로세스 풀 작업 단위, 결과와 로그를 dict 로 반환)"""
+    logs = []
+    result = {"name": user["name"], "pdf_path": None, "ok": False, "logs": logs}
+    # 워커 프로세스마다 따로 수집하고 결과와 함께 돌려보냄 (꺼져 있으면 비용 없음)
+    tracer = Tracer(is_trace_enabled(config))
+    student_span = tracer.span("student", name=user["name"])
+    try:
+        student_span.__enter__()
+        source_dir = config.get("source_dir", "")
+        # 템플릿은 프로세스별로 한 번만 파싱하고 (경로+mtime 캐시) 출력 파일마다 공유 XObject 하나로 등록
+        with tracer.span("template_load"):
+            template = load_template(config.get("template_dir", ""))
+        cfg = config
+        image_dpi = cfg.get("image_dpi", 200)
+        image_cache_dir = cfg.get("image_cache_dir") or DEFAULT_IMAGE_CACHE_DIR
+        # 칸 위치/크기는 설정마다 한 번만 계산된 표를 사용 (설정 창 미리보기와 같은 계산)
+        layout = compute_layout(cfg)
+        target_w, target_h = layout.slots[0].width, layout.slots[0].height
+
+        pdf_path = output_pdf_path(cfg, user)
+        os.makedirs(os.path.dirname(pdf_path), exist_ok=True)
 
-                    if idx_in_page == 1 or i == len(user["note_numbers"]) - 1:
-                        c.save()
-                        packet.seek(0)
-                        overlay_pdf = PdfReader(packet)
-                        base_page_copy = deepcopy(template_page)
-                        base_page_copy.merge_page(overlay_pdf.pages[0])
-                        writer.add_page(base_page_copy)
+        note_files = user.get("note_files")
+        if note_files is None:
+            note_files = resolve_note_files(get_source_index(source_dir), user["note_numbers"])
 
-                with open(pdf_path, "wb") as f:
-                    writer.write(f)
-                log_callback(f"✅ PDF 다중생성 완료: {pdf_path}")
+        # 페이지 계획: 페이지 번호 -> [(칸, 줄인 이미지 경로, 크기, mtime)], 이미지가 하나도 없는 페이지는 만들지 않음
+        pages = {}
+        for i, (note_number, img_file) in enumerate(note_files):
+            if not note_number:
+                continue
 
+            if img_file is None:
+                logs.append(f"⚠️ 이미지 파일 없음: {os.path.join(source_dir, note_number)}.*")
+                continue
+
+            page_no, idx_in_page = divmod(i, layout.per_page)
+            try:
+                # 출력 크기에 맞게 줄인 이미지를 캐시에서 가져와 삽입 (원본 해상도 그대로 넣지 않음)
+                with tracer.span("image_prepare"):
+                    prepared = prepare_note_image(img_file, target_w, target_h, image_dpi, image_cache_dir)
+                    st = os.stat(prepared)
             except Exception as e:
-                log_callback(f"❌ 사용자 {user['name']} PDF 생성 실패: {e}")
+                logs.append(f"⚠️ 이미지 삽입 실패: {img_file} ({e})")
+                continue
+            if tracer.enabled:
+                tracer.count("images")
+                tracer.count("image_read_bytes", st.st_size)
+            pages.setdefault(page_no, []).append((idx_in_page, prepared, st.st_size, st.st_mtime_ns))
+        # 같은 이미지를 같은 칸에 그리는 페이지는 학생이 달라도 같은 키 (내용이 바뀐 이미지는 크기/mtime 으로 구분)
+        page_keys = [(layout.key, tuple(images)) for images in pages.values()]
 
-        QMessageBox.information(parent_widget, "알림", "선택된 사용자의 PDF 생성이 완료되었습니다.")
+        def render_overlays(keys):
+            """메모에 없는 페이지들을 캔버스 하나에 그린 뒤 한 번만 파싱해서 메모에 저장"""
+            packet = io.BytesIO()
+            c = canvas.Canvas(packet, pagesize=(layout.page_w, layout.page_h))
+            for _layout, images in keys:
+                for slot, prepared, _size, _mtime in images:
+                    try:
+                        with tracer.span("image_decode"):
+                            img = ImageReader(prepared)
+                            iw, ih = img.getSize()
+                        draw_x, draw_y, draw_w, draw_h = layout.place(slot, iw, ih)
+                        with tracer.span("overlay_render"):
+                            c.drawImage(img, draw_x, draw_y, width=draw_w, height=draw_h)
+                    except Exception as e:
+                        logs.append(f"⚠️ 이미지 삽입 실패: {prepared} ({e})")
+                c.showPage()
+            with tracer.span("overlay_parse"):
+                c.save()
+                packet_bytes = packet.tell()
+                packet.seek(0)
+                reader = PdfReader(packet)
+            rendered = {}
+            for key, page in zip(keys, reader.pages, strict=True):
+                memo.put(key, reader, page, packet_bytes)
+                rendered[key] = (reader, page)
+            return rendered
 
-        # 생성된 파일이 있는 폴더 열기
-        target_dir = os.path.abspath(cfg.get("target_dir", DEFAULT_DST))
+        memo = get_overlay_memo()
+        streaming = cfg.get("pdf_streaming", True)
+        # 임시 파일에 다 쓴 뒤 교체해서, 중간에 실패해도 이전 PDF 가 그대로 남음
+        tmp_path = f"{pdf_path}.{os.getpid()}.tmp"
         try:
-            if sys.platform == "win32":
-                os.startfile(target_dir)
-            elif sys.platform == "darwin":
-                subprocess.Popen(["open", target_dir])
-            else:
-                subprocess.Popen(["xdg-open", target_dir])
-            log_callback(f"📁 폴더 열기: {target_dir}")
-        except Exception as e:
-            log_callback(f"❌ 폴더를 여는 데 실패했습니다: {e}")
+            with open(tmp_path, "wb") as f:
+                # 스트리밍 모드: 완성된 페이지/객체를 바로 파일에 쓰고 메모리에서 해제
+                out = StreamingPdfWriter(f) if streaming else None
+                writer = out.writer if streaming else PdfWriter()
+                template_refs = template.register(writer)
+
+                # OVERLAY_CHUNK_PAGES 페이지씩: 메모에 없는 페이지만 모아서 그리고, 템플릿과 페이지별로 결합
+                for chunk_start in range(0, len(page_keys), OVERLAY_CHUNK_PAGES):
+                    chunk = page_keys[chunk_start : chunk_start + OVERLAY_CHUNK_PAGES]
+                    overlays = {}
+                    for key in chunk:
+                        if key not in overlays:
+                            hit = memo.get(key)
+                            if hit is not None:
+                                overlays[key] = hit
+                                tracer.count("overlay_memo_hits")
+                    misses = [key for key in dict.fromkeys(chunk) if key not in overlays]
+                    if misses:
+                        overlays.update(render_overlays(misses))
+                    for key in chunk:
+                        with tracer.span("page_merge"):
+                            template.add_page(writer, template_refs, overlays[key][1])
+                        tracer.count("pages")
+                        if streaming:
+                            with tracer.span("file_write"):
+                                out.flush()
+                    # 이 청크의 페이지는 다 썼으므로 오버레이 reader 의 복제 기록을 버림
+                    # (메모에 없는 reader 는 여기서 해제되고, id 가 재사용돼도 예전 기록과 섞이지 않음)
+                    for reader in {id(reader): reader for reader, _page in overlays.values()}.values():
+                        release_source(writer, reader)
+
+                with tracer.span("file_write"):
+                    if streaming:
+                        out.close()
+                    else:
+                        writer.write(f)
+                written = f.tell()
+            try:
+                os.replace(tmp_path, pdf_path)
+            except PermissionError as e:
+                raise OSError(f"기존 PDF 가 다른 프로그램에서 열려 있어 덮어쓸 수 없습니다: {pdf_path}") from e
+        except Exception:
+            # 쓰다 만 파일은 남기지 않음
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        fingerprint = user.get("fingerprint")
+        if fingerprint:
+            try:
+                write_manifest(pdf_path, fingerprint, cfg.get("manifest_dir") or DEFAULT_MANIFEST_DIR)
+            except OSError as e:
+                logs.append(f"⚠️ 생성 기록 저장 실패 (다음에 다시 생성됨): {e}")
+        logs.append(f"✅ PDF 다중생성 완료: {pdf_path}")
+        result["pdf_path"] = pdf_path
+        result["ok"] = True
+        tracer.count("pdf_written_bytes", written)
+        student_span.set(bytes_written=written)
 
     except Exception as e:
-        log_callback(f"❌ PDF 생성 중 오류 발생: {e}")
-        QMessageBox.critical(parent_widget, "오류", f"PDF 생성 중 오류가 발생했습니다: {e}")
+        logs.append(f"❌ 사용자 {user['name']} PDF 생성 실패: {e}")
+    finally:
+        student_span.__exit__(None, None, None)
+    if tracer.enabled:
+        result["trace"] = tracer.export()
+    return result
+
+
+def generate_pdfs(config, users, log_callback, workers=None, tracer=None, status_callback=None, cancel_event=None):
+    """선택된 학생들의 PDF 를 프로세스 풀로 병렬 생성, (성공 수, 실패 수) 반환
+
+    tracer 를 넘기지 않으면 추적이 켜져 있을 때 직접 만들어 끝난 뒤 요약/trace 파일을 남긴다.
+    status_callback(학생 번호, 상태, 메시지) 로 학생별 상태(running/done/failed/cancelled)를 알리고,
+    cancel_event 가 set 되면 아직 시작하지 않은 학생은 건너뛴다.
+    pdf_incremental 이 켜져 있으면 입력(오답노트/원본 이미지/레이아웃/템플릿)이 지난번과 같은 학생은
+    다시 만들지 않고 성공으로 센다.
+    """
+    # users 목록은 워커로 보낼 필요가 없으므로 설정에서 제외
+    job_config = {k: v for k, v in config.items() if k != "users"}
+    owns_tracer = tracer is None
+    if owns_tracer:
+        tracer = Tracer(is_trace_enabled(job_config))
+    job_config["trace_enabled"] = tracer.enabled
+    incremental = job_config.get("pdf_incremental", True)
+    # 원본 폴더 색인은 메인 프로세스에서 한 번만 갱신하고, 워커에는 찾은 경로만 전달
+    with tracer.span("source_lookup"):
+        source_index = get_source_index(job_config.get("source_dir", ""))
+        if incremental:
+            # 변경 판단이 원본 크기/mtime 에 달려 있으므로 오래된 색인을 쓰지 않음
+            source_index.refresh(force=True)
+        entries = [resolve_note_entries(source_index, user["note_numbers"]) for user in users]
+        users = [
+            dict(user, note_files=_note_paths(user_entries)) for user, user_entries in zip(users, entries, strict=True)
+        ]
+    if workers is None:
+        workers = resolve_worker_count(job_config)
+
+    success_count = 0
+    fail_count = 0
+    unchanged = 0
+
+    def notify(index, state, message=""):
+        if status_callback:
+            status_callback(index, state, message)
+
+    def cancelled():
+        return cancel_event is not None and cancel_event.is_set()
+
+    def handle(index, result):
+        nonlocal success_count, fail_count
+        for line in result["logs"]:
+            log_callback(line)
+        tracer.merge(result.get("trace"))
+        if result["ok"]:
+            success_count += 1
+            notify(index, "done", result.get("pdf_path", ""))
+        else:
+            fail_count += 1
+            errors = [line for line in result["logs"] if line.startswith("❌")]
+            notify(index, "failed", errors[-1] if errors else "")
+
+    work = list(enumerate(users))
+    if incremental:
+        # 입력 지문이 지난번 생성 기록과 같고 출력 파일도 그대로인 학생은 건너뜀
+        with tracer.span("manifest_check"):
+            template_digest = template_hash(job_config.get("template_dir", ""))
+            manifest_dir = job_config.get("manifest_dir") or DEFAULT_MANIFEST_DIR
+            work = []
+            for index, (user, user_entries) in enumerate(zip(users, entries, strict=True)):
+                user["fingerprint"] = input_fingerprint(job_config, user_entries, template_digest)
+                pdf_path = output_pdf_path(job_config, user)
+                if is_up_to_date(pdf_path, user["fingerprint"], manifest_dir):
+                    unchanged += 1
+                    success_count += 1
+                    notify(index, "done", f"변경 없음: {pdf_path}")
+                else:
+                    work.append((index, user))
+        if unchanged:
+            log_callback(f"⏭️ 변경 없음 {unchanged}명 건너뜀, 다시 생성 {len(work)}명")
+
+    pending = iter(work)
+    skipped = 0
+    if workers <= 1 or len(work) <= 1:
+        for index, user in pending:
+            if cancelled():
+                notify(index, "cancelled")
+                skipped += 1
+                break
+            notify(index, "running")
+            handle(index, build_user_pdf(job_config, user))
+    else:
+        log_callback(f"⚙️ PDF 병렬 생성 시작: {len(work)}명 / 워커 {workers}개")
+        executor = get_executor(workers)
+        futures = {}
+        # 미리 넣어 둔 학생은 워커가 빌 때까지 대기 상태로 두고, 실행 중 표시는 워커 수만큼만 함
+        waiting = deque()
+
+        def submit_next():
+            for index, user in pending:
+                futures[executor.submit(build_user_pdf, job_config, user)] = index
+                waiting.append(index)
+                return True
+            return False
+
+        def mark_running():
+            while waiting and len(futures) - len(waiting) < workers:
+                notify(waiting.popleft(), "running")
+
+        # 워커 수의 2배까지만 미리 넣어 두고 하나 끝날 때마다 다음 학생을 넣음 (취소하면 남은 학생은 넣지 않음)
+        for _ in range(workers * 2):
+            if not submit_next():
+                break
+        mark_running()
+        pool_broken = False
+        while futures:
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = futures.pop(future)
+                if index in waiting:
+                    waiting.remove(index)
+                try:
+                    handle(index, future.result())
+                except Exception as e:
+                    # 워커 프로세스 자체가 죽은 경우 풀을 버리고 다음 실행 때 새로 생성
+                    pool_broken = pool_broken or isinstance(e, BrokenProcessPool)
+                    handle(index, {"ok": False, "logs": [f"❌ 사용자 {users[index]['name']} PDF 생성 실패: {e}"]})
+                if not cancelled():
+                    submit_next()
+            mark_running()
+        if pool_broken:
+            shutdown_executor()
+
+    for index, _user in pending:
+        notify(index, "cancelled")
+        skipped += 1
+    if cancelled():
+        log_callback(f"⏹️ PDF 생성 취소: {skipped}명 건너뜀")
+    if owns_tracer:
+        report_trace(tracer, log_callback, "pdf_export")
+    return success_count, fail_count
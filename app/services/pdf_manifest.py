@@ -0,0 +1,91 @@
+import hashlib
+import json
+import os
+import threading
+
+from config import DEFAULT_MANIFEST_DIR, LAYOUT_KEYS
+from services.page_layout import compute_layout
+
+# 출력 형식(그리는 방법)이 바뀌면 올려서 예전 기록을 모두 무효화
+MANIFEST_VERSION = 2
+
+# (절대경로, mtime, 크기) -> 템플릿 내용 해시
+_template_hashes = {}
+_template_hashes_lock = threading.Lock()
+
+
+def template_hash(template_path):
+    """템플릿 파일 내용 해시 (파일이 바뀌지 않았으면 다시 읽지 않음), 파일이 없으면 빈 문자열"""
+    try:
+        st = os.stat(template_path)
+    except OSError:
+        return ""
+    key = (os.path.abspath(template_path), st.st_mtime_ns, st.st_size)
+    with _template_hashes_lock:
+        cached = _template_hashes.get(key)
+    if cached is None:
+        digest = hashlib.sha1()
+        with open(template_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        cached = digest.hexdigest()
+        with _template_hashes_lock:
+            _template_hashes[key] = cached
+    return cached
+
+
+def input_fingerprint(config, note_entries, template_digest):
+    """학생 PDF 한 개의 입력 지문: 오답노트 목록(+원본 크기/mtime), 레이아웃(칸 배치), 템플릿 해시
+
+    note_entries: (오답노트 번호, SourceEntry 또는 None) 목록
+    """
+    notes = [
+        [number, entry.path, entry.size, entry.mtime_ns] if entry is not None else [number, None]
+        for number, entry in note_entries
+    ]
+    payload = {
+        "version": MANIFEST_VERSION,
+        "notes": notes,
+        "layout": {key: config.get(key) for key in LAYOUT_KEYS},
+        # 3번째 칸부터의 오프셋 등 키 목록에 없는 값도 반영되도록 계산된 칸 위치까지 포함
+        "slots": compute_layout(config).key,
+        "template": template_digest,
+    }
+    raw = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def manifest_path(pdf_path, manifest_dir=DEFAULT_MANIFEST_DIR):
+    key = hashlib.sha1(os.path.normcase(os.path.abspath(pdf_path)).encode("utf-8")).hexdigest()
+    return os.path.join(manifest_dir, key[:2], key + ".json")
+
+
+def is_up_to_date(pdf_path, fingerprint, manifest_dir=DEFAULT_MANIFEST_DIR):
+    """기록된 입력 지문이 같고 출력 파일도 기록 당시 그대로(크기/mtime)이면 True"""
+    try:
+        with open(manifest_path(pdf_path, manifest_dir), encoding="utf-8") as f:
+            manifest = json.load(f)
+        st = os.stat(pdf_path)
+    except (OSError, ValueError):
+        return False
+    return (
+        isinstance(manifest, dict)
+        and manifest.get("fingerprint") == fingerprint
+        and manifest.get("size") == st.st_size
+        and manifest.get("mtime_ns") == st.st_mtime_ns
+    )
+
+
+def write_manifest(pdf_path, fingerprint, manifest_dir=DEFAULT_MANIFEST_DIR):
+    """새로 만든 PDF 의 입력 지문과 파일 크기/mtime 기록 (임시 파일에 쓰고 교체)"""
+    st = os.stat(pdf_path)
+    path = manifest_path(pdf_path, manifest_dir)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(
+            {"pdf_path": pdf_path, "fingerprint": fingerprint, "size": st.st_size, "mtime_ns": st.st_mtime_ns},
+            f,
+            ensure_ascii=False,
+        )
+    os.replace(tmp_path, path)
@@ -0,0 +1,77 @@
+from PyPDF2 import PdfWriter
+from PyPDF2.generic import DictionaryObject, IndirectObject, NameObject, NullObject, NumberObject
+
+
+def release_source(writer, reader):
+    """다 쓴 원본 PDF(오버레이 등)의 복제 기록을 버려 reader 를 해제할 수 있게 함
+
+    PdfWriter 는 복제 기록을 id(reader) 로 찾으므로, 기록을 남긴 채 reader 가 해제되면
+    같은 id 를 받은 다른 reader 의 객체가 예전 복제본으로 잘못 연결될 수 있다.
+    """
+    writer._id_translated.pop(id(reader), None)
+
+
+class StreamingPdfWriter:
+    """완성된 객체를 바로 파일에 써서 내보내는 PDF writer (메모리 사용량이 페이지 수와 무관)
+
+    객체 번호 매기기/복제는 PyPDF2 PdfWriter 에 맡기고, flush() 때마다 새로 생긴 객체를 파일에 쓴 뒤
+    메모리에서는 번호만 가진 자리표시자로 바꾼다. 페이지 트리/카탈로그/정보 객체는 close() 때 쓴다.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.writer = PdfWriter()
+        self._deferred = {self.writer._pages.idnum, self.writer._info.idnum, self.writer._root.idnum}
+        self._offsets = {}
+        self._flushed = 0
+        stream.write(self.writer.pdf_header + b"\n")
+        stream.write(b"%\xe2\xe3\xcf\xd3\n")
+
+    def _write_object(self, idnum, obj):
+        self._offsets[idnum] = self.stream.tell()
+        self.stream.write(f"{idnum} 0 obj\n".encode())
+        obj.write_to_stream(self.stream, None)
+        self.stream.write(b"\nendobj\n")
+
+    def flush(self):
+        """마지막 flush 이후 추가된 객체를 파일에 쓰고 메모리에서 해제"""
+        objects = self.writer._objects
+        for i in range(self._flushed, len(objects)):
+            idnum = i + 1
+            obj = objects[i]
+            if idnum in self._deferred or obj is None:
+                continue
+            self._write_object(idnum, obj)
+            # 이후 같은 원본 객체를 다시 복제하려 할 때 번호만 찾을 수 있도록 자리표시자로 교체
+            placeholder = NullObject()
+            placeholder.indirect_reference = IndirectObject(idnum, 0, self.writer)
+            objects[i] = placeholder
+        self._flushed = len(objects)
+
+    def close(self):
+        self.flush()
+        objects = self.writer._objects
+        for idnum in sorted(self._deferred):
+            self._write_object(idnum, objects[idnum - 1])
+
+        xref_location = self.stream.tell()
+        size = len(objects) + 1
+        self.stream.write(f"xref\n0 {size}\n".encode())
+        self.stream.write(b"0000000000 65535 f \n")
+        for idnum in range(1, size):
+            offset = self._offsets.get(idnum)
+            if offset is None:
+                self.stream.write(b"0000000000 65535 f \n")
+            else:
+                self.stream.write(f"{offset:0>10} 00000 n \n".encode())
+
+        trailer = DictionaryObject(
+            {
+                NameObject("/Size"): NumberObject(size),
+                NameObject("/Root"): self.writer._root,
+                NameObject("/Info"): self.writer._info,
+            }
+        )
+        self.stream.write(b"trailer\n")
+        trailer.write_to_stream(self.stream, None)
+        self.stream.write(f"\nstartxref\n{xref_location}\n%%EOF\n".encode())
@@ -0,0 +1,127 @@
+import os
+
+from PyPDF2 import PageObject, PdfReader
+from PyPDF2.generic import (
+    ArrayObject,
+    DecodedStreamObject,
+    DictionaryObject,
+    FloatObject,
+    IndirectObject,
+    NameObject,
+)
+
+TEMPLATE_XOBJECT_NAME = "/CopyTemplate"
+# 새 페이지에 템플릿 첫 페이지에서 그대로 옮길 페이지 속성 (투명 그룹, 회전, 보이는 영역)
+# 주석(/Annots)은 한 페이지에만 속하므로 add_page 에서 페이지마다 복제
+TEMPLATE_PAGE_KEYS = ("/Group", "/Rotate", "/CropBox")
+
+# (절대경로, mtime, 크기) -> PdfTemplate, 템플릿 파일이 바뀌면 키가 달라져 자동으로 다시 파싱
+_template_cache = {}
+
+
+class PdfTemplate:
+    """템플릿 PDF 첫 페이지를 한 번만 파싱해 두고, 출력 PDF 마다 공유 Form XObject 로 찍어내는 객체"""
+
+    def __init__(self, template_path):
+        self.reader = PdfReader(template_path)
+        page = self.reader.pages[0]
+        self.mediabox = ArrayObject(FloatObject(v) for v in page.mediabox)
+        self.width = float(page.mediabox.width)
+        self.height = float(page.mediabox.height)
+        # 상속 속성(/Rotate, /CropBox)은 PdfReader 가 페이지마다 펼쳐 두므로 페이지에서 바로 읽음
+        self.page_attrs = {key: page[key] for key in TEMPLATE_PAGE_KEYS if key in page}
+        self.annots = page.get("/Annots")
+
+        contents = page.get_contents()
+        form = DecodedStreamObject()
+        form.set_data(contents.get_data() if contents is not None else b"")
+        form = form.flate_encode()
+        form.update(
+            {
+                NameObject("/Type"): NameObject("/XObject"),
+                NameObject("/Subtype"): NameObject("/Form"),
+                NameObject("/BBox"): self.mediabox,
+                NameObject("/Resources"): page.get("/Resources", DictionaryObject()),
+            }
+        )
+        self.form = form
+
+        # 모든 페이지가 같이 참조하는 "템플릿 그리기" 스트림
+        invoke = DecodedStreamObject()
+        invoke.set_data(f"q {TEMPLATE_XOBJECT_NAME} Do Q\n".encode())
+        self.invoke = invoke
+
+    def register(self, writer):
+        """writer 에 템플릿 Form XObject 와 호출 스트림을 한 번 등록하고, 페이지 추가에 쓸 상태를 반환"""
+        return {
+            "form": writer._add_object(self.form.clone(writer)),
+            "invoke": writer._add_object(self.invoke.clone(writer)),
+            "page_attrs": {
+                NameObject(key): value.clone(writer) if hasattr(value, "clone") else value
+                for key, value in self.page_attrs.items()
+            },
+            # reportlab 이미지 XObject 이름(내용 해시) -> writer 참조
+            # (오버레이를 여러 번 나눠 파싱해도 이미지는 한 번만 기록)
+            "xobjects": {},
+        }
+
+    def add_page(self, writer, refs, overlay_page=None):
+        """템플릿(공유 XObject) + 오버레이 내용으로 새 페이지를 writer 에 추가"""
+        form_ref = refs["form"]
+        invoke_ref = refs["invoke"]
+        shared_xobjects = refs["xobjects"]
+        # add_blank_page 는 writer 에 등록된 복제본이 아닌 원본을 돌려주므로 add_page 의 반환값을 사용
+        page = writer.add_page(PageObject.create_blank_page(writer, self.width, self.height))
+        page[NameObject("/MediaBox")] = self.mediabox
+        page.update(refs["page_attrs"])
+        if self.annots is not None:
+            # 주석은 한 페이지에만 속하므로 페이지마다 새로 복제 (/P 는 템플릿 페이지를 가리키므로 뺌)
+            annots = ArrayObject()
+            for annot in self.annots.get_object():
+                # 원본 참조가 없는 사본을 복제해야 페이지마다 새 객체가 됨 (외형 스트림 등 하위 객체는 공유)
+                fields = DictionaryObject({key: value for key, value in annot.get_object().items() if key != "/P"})
+                annots.append(writer._add_object(fields.clone(writer)))
+            page[NameObject("/Annots")] = annots
+
+        # 리소스는 페이지마다 새 dict 로 만들고 값만 복제 (공유 객체를 직접 수정하지 않음)
+        resources = DictionaryObject()
+        xobjects = DictionaryObject({NameObject(TEMPLATE_XOBJECT_NAME): form_ref})
+        contents = ArrayObject([invoke_ref])
+        if overlay_page is not None:
+            overlay_resources = overlay_page.get("/Resources")
+            if overlay_resources is not None:
+                for key, value in overlay_resources.get_object().items():
+                    if key == "/XObject":
+                        for name, xobject in value.get_object().items():
+                            ref = shared_xobjects.get(name)
+                            if ref is None:
+                                ref = shared_xobjects[name] = xobject.clone(writer)
+                            xobjects[NameObject(name)] = ref
+                    else:
+                        resources[NameObject(key)] = value.clone(writer) if hasattr(value, "clone") else value
+            overlay_contents = overlay_page.get("/Contents")
+            if overlay_contents is not None:
+                streams = overlay_contents.get_object()
+                for stream in streams if isinstance(streams, ArrayObject) else [overlay_contents]:
+                    ref = stream.clone(writer)
+                    if not isinstance(ref, IndirectObject):
+                        ref = writer._add_object(ref)
+                    contents.append(ref)
+
+        resources[NameObject("/XObject")] = xobjects
+        page[NameObject("/Resources")] = resources
+        page[NameObject("/Contents")] = contents
+        return page
+
+
+def load_template(template_path):
+    """템플릿을 캐시에서 가져오거나 새로 파싱 (경로 + mtime 기준 무효화)"""
+    stat = os.stat(template_path)
+    key = (os.path.abspath(template_path), stat.st_mtime_ns, stat.st_size)
+    template = _template_cache.get(key)
+    if template is None:
+        # 최신 템플릿 하나만 유지
+        _template_cache.clear()
+        template = PdfTemplate(template_path)
+        _template_cache[key] = template
+    return template
@@ -0,0 +1,144 @@
+import codecs
+import csv
+import json
+import os
+
+EXPORT_HEADERS = ["이름", "오답노트 제목", "오답노트 번호"]
+EXPORT_SHEET_TITLE = "사용자 데이터"
+
+
+def parse_note_numbers(text):
+    """'1001, 1002' 형태의 오답노트 번호 문자열 -> 번호 목록"""
+    if isinstance(text, (list, tuple)):
+        return [str(num).strip() for num in text if str(num).strip()]
+    return [num.strip() for num in str(text or "").split(",") if num.strip()]
+
+
+def _cell_text(value):
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)  # 엑셀 숫자 셀 1001.0 -> "1001"
+    return str(value).strip()
+
+
+def _row_to_student(row):
+    row = tuple(row) + (None,) * (3 - len(row))
+    return {"name": _cell_text(row[0]), "note_title": _cell_text(row[1]), "note_numbers": _cell_text(row[2])}
+
+
+def iter_students_excel(file_path):
+    """엑셀(첫 행은 헤더: 이름, 오답노트 제목, 오답노트 번호)에서 학생을 한 행씩 읽기 (읽기 전용 스트리밍 모드)"""
+    import openpyxl
+
+    wb = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        for row in wb.active.iter_rows(min_row=2, max_col=3, values_only=True):
+            if row and row[0] is not None and str(row[0]).strip():
+                yield _row_to_student(row)
+    finally:
+        wb.close()
+
+
+def _detect_csv_encoding(file_path, chunk_size=1024 * 1024):
+    """UTF-8(BOM 포함)로 끝까지 읽히면 utf-8-sig, 아니면 한글 엑셀 기본 저장 형식인 cp949"""
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    try:
+        with open(file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(chunk_size), b""):
+                decoder.decode(chunk)
+            decoder.decode(b"", final=True)
+    except UnicodeDecodeError:
+        return "cp949"
+    return "utf-8-sig"
+
+
+def iter_students_csv(file_path):
+    """CSV(첫 행은 헤더)에서 학생을 한 행씩 읽기"""
+    with open(file_path, newline="", encoding=_detect_csv_encoding(file_path)) as f:
+        reader = csv.reader(f)
+        next(reader, None)
+        for row in reader:
+            if row and row[0].strip():
+                yield _row_to_student(row)
+
+
+def iter_students_file(file_path):
+    """확장자에 따라 엑셀/CSV 학생 목록을 한 행씩 읽기"""
+    if os.path.splitext(file_path)[1].lower() == ".csv":
+        return iter_students_csv(file_path)
+    return iter_students_excel(file_path)
+
+
+def read_students_file(file_path):
+    """엑셀 또는 CSV 학생 목록 전체 읽기"""
+    return list(iter_students_file(file_path))
+
+
+def write_students_file(file_path, users, progress_callback=None, progress_every=5000):
+    """학생 목록을 엑셀(쓰기 전용 스트리밍 모드) 또는 CSV(.csv, 엑셀에서 바로 열리는 UTF-8 BOM)로 저장
+
+    progress_callback(완료 행 수, 전체 행 수) 는 progress_every 행마다 호출, 저장한 행 수 반환
+    (콜백에서 예외를 던지면 중단하고 기존 파일은 건드리지 않음)
+    """
+    total = len(users)
+
+    def rows():
+        for i, user in enumerate(users, 1):
+            yield [user.get("name", ""), user.get("note_title", ""), user.get("note_numbers", "")]
+            if progress_callback and i % progress_every == 0:
+                progress_callback(i, total)
+
+    # 같은 폴더의 임시 파일에 다 쓴 뒤에만 교체하므로, 취소/오류 시에도 기존 파일은 그대로 남음
+    tmp_path = f"{file_path}.{os.getpid()}.tmp"
+    try:
+        if os.path.splitext(file_path)[1].lower() == ".csv":
+            with open(tmp_path, "w", newline="", encoding="utf-8-sig") as f:
+                writer = csv.writer(f)
+                writer.writerow(EXPORT_HEADERS)
+                writer.writerows(rows())
+        else:
+            import openpyxl
+
+            wb = openpyxl.Workbook(write_only=True)
+            sheet = wb.create_sheet(EXPORT_SHEET_TITLE)
+            sheet.append(EXPORT_HEADERS)
+            for row in rows():
+                sheet.append(row)
+            wb.save(tmp_path)
+        try:
+            os.replace(tmp_path, file_path)
+        except PermissionError as e:
+            raise OSError(f"기존 파일이 다른 프로그램에서 열려 있어 덮어쓸 수 없습니다: {file_path}") from e
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    if progress_callback:
+        progress_callback(total, total)
+    return total
+
+
+def read_students_text(text):
+    """JSON 배열 또는 '이름<TAB>제목<TAB>번호' 줄 단위 텍스트에서 학생 목록 읽기"""
+    text = text.strip()
+    if not text:
+        return []
+    if text.startswith("["):
+        return [
+            {
+                "name": str(u.get("name", "")),
+                "note_title": str(u.get("note_title", "")),
+                "note_numbers": u.get("note_numbers", ""),
+            }
+            for u in json.loads(text)
+            if u.get("name")
+        ]
+    users = []
+    for line in text.splitlines():
+        parts = line.rstrip("\r").split("\t")
+        if not parts[0].strip():
+            continue
+        parts += [""] * (3 - len(parts))
+        users.append({"name": parts[0].strip(), "note_title": parts[1].strip(), "note_numbers": parts[2].strip()})
+    return users
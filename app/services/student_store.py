@@ -0,0 +1,99 @@
+import sqlite3
+
+from config import STUDENT_DB_FILE, remove_config_keys
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS students (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    note_title TEXT NOT NULL DEFAULT '',
+    note_numbers TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS idx_students_name ON students(name);
+CREATE INDEX IF NOT EXISTS idx_students_note_title ON students(note_title);
+"""
+
+
+def _note_numbers_text(value):
+    if isinstance(value, (list, tuple)):
+        return ", ".join(str(v) for v in value)
+    return str(value or "")
+
+
+def _row_values(user):
+    return (
+        str(user.get("name", "") or ""),
+        str(user.get("note_title", "") or ""),
+        _note_numbers_text(user.get("note_numbers")),
+    )
+
+
+class StudentStore:
+    """학생 목록 저장소 (SQLite), 경로/레이아웃 설정(prevConfig.json)과 분리
+
+    저장은 바뀐 행만 UPDATE/INSERT 하고 삭제된 행만 DELETE 하며, 한 번의 트랜잭션으로 처리한다.
+    """
+
+    def __init__(self, path=STUDENT_DB_FILE):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        # 데스크톱 단일 사용자라서 WAL + NORMAL 로도 충분히 안전하고 커밋이 빠름
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+
+    def count(self):
+        return self.conn.execute("SELECT COUNT(*) FROM students").fetchone()[0]
+
+    def load_all(self):
+        """학생 dict 목록 (id 포함, 추가된 순서)"""
+        return [
+            {"id": row_id, "name": name, "note_title": title, "note_numbers": numbers}
+            for row_id, name, title, numbers in self.conn.execute(
+                "SELECT id, name, note_title, note_numbers FROM students ORDER BY id"
+            )
+        ]
+
+    def save_changes(self, upserts, deleted_ids=()):
+        """바뀐 행 저장 + 삭제, 'id' 가 None 인 행은 새로 추가하고 upserts 순서대로 id 목록 반환"""
+        ids = []
+        with self.conn:
+            if deleted_ids:
+                self.conn.executemany("DELETE FROM students WHERE id = ?", [(row_id,) for row_id in deleted_ids])
+            for user in upserts:
+                values = _row_values(user)
+                if user.get("id") is None:
+                    cursor = self.conn.execute(
+                        "INSERT INTO students (name, note_title, note_numbers) VALUES (?, ?, ?)", values
+                    )
+                    ids.append(cursor.lastrowid)
+                else:
+                    self.conn.execute(
+                        "UPDATE students SET name = ?, note_title = ?, note_numbers = ? WHERE id = ?",
+                        (*values, user["id"]),
+                    )
+                    ids.append(user["id"])
+        return ids
+
+    def replace_all(self, users):
+        with self.conn:
+            self.conn.execute("DELETE FROM students")
+            self.conn.executemany(
+                "INSERT INTO students (name, note_title, note_numbers) VALUES (?, ?, ?)",
+                [_row_values(user) for user in users if user.get("name")],
+            )
+
+    def close(self):
+        self.conn.close()
+
+
+def open_student_store(config=None, path=STUDENT_DB_FILE):
+    """학생 저장소 열기, 예전 버전처럼 설정 파일에 학생 목록(users)이 있으면 DB 로 옮기고 설정에서는 뺌"""
+    store = StudentStore(path)
+    if config is not None and "users" in config:
+        users = config.pop("users") or []
+        if users and store.count() == 0:
+            store.replace_all(users)
+        # 설정 전체를 다시 저장하면 기본값/실행 옵션까지 파일에 남으므로 users 삭제만 반영
+        remove_config_keys(("users",))
+    return store
@@ -0,0 +1,13 @@
+from config import DEFAULT_THUMBNAIL_DIR
+from services.image_cache import downscale_to_cache
+
+THUMBNAIL_SIZE = 160  # px, 긴 변 기준
+
+
+def make_thumbnail(img_file, max_px=THUMBNAIL_SIZE, cache_dir=DEFAULT_THUMBNAIL_DIR):
+    """원본 이미지의 썸네일 경로 반환 (경로+크기+mtime 기준 디스크 캐시, 없으면 만들어서 저장)
+
+    GUI 와 상관없는 순수 함수라서 스레드 풀에서 그대로 호출한다.
+    작은 원본도 캐시에 저장해 두어 Qt 가 못 읽는 형식이어도 썸네일은 항상 PNG/JPEG 이다.
+    """
+    return downscale_to_cache(img_file, max_px, max_px, cache_dir, jpeg_quality=85, optimize=False, keep_small=False)
@@ -0,0 +1,14 @@
+import pytest
+
+import config
+
+
+@pytest.fixture
+def config_file(tmp_path, monkeypatch):
+    """임시 폴더의 prevConfig.json 을 쓰도록 모듈 상태 초기화"""
+    path = tmp_path / "prevConfig.json"
+    monkeypatch.setattr(config, "CONFIG_FILE", str(path))
+    monkeypatch.setattr(config, "_config_data", None)
+    monkeypatch.setattr(config, "_config_stamp", None)
+    monkeypatch.setattr(config, "_save_timer", None)
+    return path
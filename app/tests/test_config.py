@@ -0,0 +1,35 @@
+import json
+
+import config
+
+
+def read_json(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_save_config_merges_partial_updates(config_file):
+    config_file.write_text(json.dumps({"source_dir": "src", "h_margin": 10}), encoding="utf-8")
+    config.save_config({"h_margin": 30})
+    config.save_config({"trace_enabled": True})
+    config.flush_config()
+
+    assert read_json(config_file) == {"source_dir": "src", "h_margin": 30, "trace_enabled": True}
+    loaded = config.load_previous_config()
+    assert loaded["h_margin"] == 30
+    assert loaded["configured"] is True
+
+
+def test_remove_config_keys_deletes_from_file(config_file):
+    config_file.write_text(json.dumps({"source_dir": "src", "users": [{"name": "a"}]}), encoding="utf-8")
+    config.remove_config_keys(("users",))
+    config.flush_config()
+
+    assert read_json(config_file) == {"source_dir": "src"}
+    assert "users" not in config.load_previous_config()
+
+
+def test_remove_config_keys_without_match_does_not_write(config_file):
+    config.remove_config_keys(("users",))
+    config.flush_config()
+    assert not config_file.exists()
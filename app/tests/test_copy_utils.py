@@ -0,0 +1,29 @@
+import os
+
+from utils.copy_utils import copy_images
+from utils.source_index import get_source_index
+
+
+def write(path, data, mtime_ns=None):
+    with open(path, "wb") as f:
+        f.write(data)
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_copy_skips_unchanged_and_recopies_file_edited_in_place(tmp_path):
+    src = tmp_path / "src"
+    dst = tmp_path / "dst"
+    src.mkdir()
+    write(src / "1001.jpg", b"old", 1_000_000_000_000_000_000)
+    logs = []
+
+    assert copy_images(["1001"], str(src), str(dst), logs.append)["copied"] == 1
+    assert copy_images(["1001"], str(src), str(dst), logs.append)["skipped"] == 1
+
+    # 색인이 아직 새로 고쳐지지 않은 상태에서 원본을 제자리 수정해도 다시 복사해야 함
+    get_source_index(str(src))
+    write(src / "1001.jpg", b"new content", 1_000_000_100_000_000_000)
+    summary = copy_images(["1001"], str(src), str(dst), logs.append)
+    assert summary["copied"] == 1
+    assert (dst / "1001.jpg").read_bytes() == b"new content"
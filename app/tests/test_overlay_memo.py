@@ -0,0 +1,38 @@
+from services.overlay_memo import OverlayMemo
+
+
+class FakeReader:
+    pass
+
+
+def test_reader_bytes_counted_once_and_freed_with_last_page():
+    memo = OverlayMemo(max_bytes=100)
+    reader = FakeReader()
+    memo.put("a", reader, "page-a", 40)
+    memo.put("b", reader, "page-b", 40)
+    assert memo.size_bytes == 40
+
+    # 새 reader 가 들어오며 용량을 넘으면 오래된 페이지부터 빠지고, reader 의 페이지가 모두 빠져야 용량이 줄어듦
+    memo.put("c", FakeReader(), "page-c", 70)
+    assert memo.get("a") is None
+    assert memo.get("b") is None
+    assert memo.get("c")[1] == "page-c"
+    assert memo.size_bytes == 70
+
+
+def test_recently_used_page_survives_eviction():
+    memo = OverlayMemo(max_bytes=100)
+    memo.put("a", FakeReader(), "page-a", 40)
+    memo.put("b", FakeReader(), "page-b", 40)
+    memo.get("a")
+    memo.put("c", FakeReader(), "page-c", 40)
+    assert memo.get("a") is not None
+    assert memo.get("b") is None
+    assert len(memo) == 2
+
+
+def test_reader_larger_than_limit_is_not_kept():
+    memo = OverlayMemo(max_bytes=10)
+    memo.put("a", FakeReader(), "page-a", 20)
+    assert len(memo) == 0
+    assert memo.size_bytes == 0
@@ -0,0 +1,46 @@
+import pytest
+
+from config import DEFAULT_CONFIG
+from services.page_layout import MAX_GRID_COLS, MAX_GRID_ROWS, compute_layout
+
+
+def layout_for(rows, cols, **overrides):
+    return compute_layout({**DEFAULT_CONFIG, "grid_rows": rows, "grid_cols": cols, **overrides})
+
+
+def overlaps(a, b):
+    return a.x < b.x + b.width and b.x < a.x + a.width and a.y < b.y + b.height and b.y < a.y + a.height
+
+
+def test_default_grid_keeps_legacy_positions():
+    layout = layout_for(2, 1)
+    c = DEFAULT_CONFIG
+    # 칸 배치 도입 전과 같은 위치 (칸 왼쪽 아래 + x_offsetN / y_offsetN)
+    cell_h = (layout.page_h - 3 * c["v_margin"]) / 2
+    top_y = layout.page_h - c["v_margin"] - cell_h
+    assert layout.slots[0] == (c["h_margin"] + c["x_offset1"], top_y + c["y_offset1"], c["target_w"], c["target_h"])
+    assert layout.slots[1] == (
+        c["h_margin"] + c["x_offset2"],
+        top_y - c["v_margin"] - cell_h + c["y_offset2"],
+        c["target_w"],
+        c["target_h"],
+    )
+
+
+@pytest.mark.parametrize("rows", range(1, MAX_GRID_ROWS + 1))
+@pytest.mark.parametrize("cols", range(1, MAX_GRID_COLS + 1))
+def test_boxes_stay_on_page_without_overlap(rows, cols):
+    layout = layout_for(rows, cols)
+    for slot in layout.slots:
+        assert 0 <= slot.x and slot.x + slot.width <= layout.page_w
+        assert 0 <= slot.y and slot.y + slot.height <= layout.page_h
+    for i, slot in enumerate(layout.slots):
+        assert not any(overlaps(slot, other) for other in layout.slots[i + 1 :])
+
+
+def test_offsets_apply_only_to_the_grid_they_were_tuned_for():
+    untuned = layout_for(3, 2, x_offset1=30)
+    tuned = layout_for(3, 2, x_offset1=30, slot_offsets_grid="3x2")
+    assert tuned.slots[0].x - untuned.slots[0].x == 30
+    # 2x1 에 맞춘 기본 y_offset1 도 함께 적용됨
+    assert tuned.slots[0].y - untuned.slots[0].y == DEFAULT_CONFIG["y_offset1"]
@@ -0,0 +1,101 @@
+import os
+
+import pytest
+from PIL import Image
+from reportlab.lib.pagesizes import A4
+from reportlab.pdfgen import canvas
+
+from config import DEFAULT_CONFIG
+from services.pdf_generator import generate_pdfs
+
+SKIPPED_MESSAGE = "변경 없음"
+
+
+def write_template(path, text="template"):
+    c = canvas.Canvas(str(path), pagesize=A4)
+    c.drawString(40, 800, text)
+    c.save()
+
+
+def make_config(tmp_path, **overrides):
+    template_path = tmp_path / "template.pdf"
+    write_template(template_path)
+    source_dir = tmp_path / "src"
+    source_dir.mkdir()
+    for n in range(3):
+        Image.new("RGB", (400, 200), (60 * n, 100, 200)).save(source_dir / f"{1000 + n}.png")
+    return dict(
+        DEFAULT_CONFIG,
+        source_dir=str(source_dir),
+        target_dir=str(tmp_path / "out"),
+        template_dir=str(template_path),
+        image_cache_dir=str(tmp_path / "cache"),
+        manifest_dir=str(tmp_path / "manifest"),
+        pdf_incremental=True,
+        **overrides,
+    )
+
+
+def export(config):
+    """학생 한 명 PDF 생성 -> 마지막 상태 메시지 (건너뛰었으면 '변경 없음: ...')"""
+    statuses = []
+    user = {"name": "kim", "note_title": "t", "note_numbers": ["1000", "1001"]}
+    result = generate_pdfs(config, [user], lambda _line: None, workers=1, status_callback=lambda *s: statuses.append(s))
+    assert result == (1, 0)
+    _index, state, message = statuses[-1]
+    assert state == "done"
+    return message
+
+
+def bump_mtime(path):
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 2_000_000_000))
+
+
+def test_unchanged_inputs_are_skipped(tmp_path):
+    config = make_config(tmp_path)
+    pdf_path = export(config)
+    mtime_ns = os.stat(pdf_path).st_mtime_ns
+    assert export(config) == f"{SKIPPED_MESSAGE}: {pdf_path}"
+    assert os.stat(pdf_path).st_mtime_ns == mtime_ns
+
+
+def touch_note(config):
+    bump_mtime(os.path.join(config["source_dir"], "1000.png"))
+
+
+def resize_note(config):
+    # 크기만 달라지고 mtime 은 같게 맞춤
+    path = os.path.join(config["source_dir"], "1001.png")
+    old = os.stat(path)
+    Image.new("RGB", (500, 300), (0, 0, 0)).save(path)
+    os.utime(path, ns=(old.st_atime_ns, old.st_mtime_ns))
+    assert os.path.getsize(path) != old.st_size
+
+
+def change_layout(config):
+    config["target_w"] += 10
+
+
+def change_template(config):
+    write_template(config["template_dir"], "new template")
+    bump_mtime(config["template_dir"])
+
+
+@pytest.mark.parametrize("change", [touch_note, resize_note, change_layout, change_template])
+def test_changed_inputs_are_rebuilt(tmp_path, change):
+    config = make_config(tmp_path)
+    export(config)
+    assert export(config).startswith(SKIPPED_MESSAGE)
+    change(config)
+    assert not export(config).startswith(SKIPPED_MESSAGE)
+    # 다시 만든 뒤에는 새 입력 기준으로 다시 건너뜀
+    assert export(config).startswith(SKIPPED_MESSAGE)
+
+
+def test_output_pdf_modified_outside_is_rebuilt(tmp_path):
+    config = make_config(tmp_path)
+    pdf_path = export(config)
+    with open(pdf_path, "ab") as f:
+        f.write(b"\n")
+    assert not export(config).startswith(SKIPPED_MESSAGE)
@@ -0,0 +1,54 @@
+from PIL import Image
+from PyPDF2 import PdfReader
+from reportlab.lib.pagesizes import A4
+from reportlab.pdfgen import canvas
+
+from config import DEFAULT_CONFIG
+from services.pdf_generator import OVERLAY_CHUNK_PAGES, build_user_pdf
+
+
+def make_inputs(tmp_path, image_count=5):
+    template_path = tmp_path / "template.pdf"
+    c = canvas.Canvas(str(template_path), pagesize=A4)
+    c.drawString(40, 800, "template")
+    c.rect(20, 20, 555, 760)
+    c.save()
+
+    source_dir = tmp_path / "src"
+    source_dir.mkdir()
+    for n in range(image_count):
+        Image.new("RGB", (400, 200), (40 * n, 100, 200)).save(source_dir / f"{1000 + n}.png")
+    return str(template_path), str(source_dir)
+
+
+def page_signature(page):
+    """페이지 내용 스트림 + 참조하는 XObject 데이터 (객체 번호/배치와 무관하게 비교)"""
+    contents = page["/Contents"]
+    streams = contents if isinstance(contents, list) else [contents]
+    data = b"".join(stream.get_object().get_data() for stream in streams)
+    xobjects = page["/Resources"]["/XObject"]
+    return data, {name: ref.get_object().get_data() for name, ref in xobjects.items()}, list(page.mediabox)
+
+
+def test_streaming_writer_matches_normal_writer(tmp_path):
+    template_path, source_dir = make_inputs(tmp_path)
+    # 청크 경계를 넘도록 페이지 수를 잡고, 같은 이미지를 여러 페이지에서 재사용
+    numbers = [str(1000 + i % 5) for i in range((OVERLAY_CHUNK_PAGES + 3) * 2)]
+    results = {}
+    for streaming in (True, False):
+        config = dict(
+            DEFAULT_CONFIG,
+            source_dir=source_dir,
+            target_dir=str(tmp_path / f"out_{streaming}"),
+            template_dir=template_path,
+            image_cache_dir=str(tmp_path / "cache"),
+            pdf_streaming=streaming,
+        )
+        result = build_user_pdf(config, {"name": "kim", "note_title": "t", "note_numbers": numbers})
+        assert result["ok"], result["logs"]
+        results[streaming] = PdfReader(result["pdf_path"], strict=True)
+
+    streamed, normal = results[True], results[False]
+    assert len(streamed.pages) == len(normal.pages) == OVERLAY_CHUNK_PAGES + 3
+    for streamed_page, normal_page in zip(streamed.pages, normal.pages, strict=True):
+        assert page_signature(streamed_page) == page_signature(normal_page)
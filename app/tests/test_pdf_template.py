@@ -0,0 +1,64 @@
+import io
+
+from PyPDF2 import PdfReader, PdfWriter
+from PyPDF2.generic import ArrayObject, DictionaryObject, FloatObject, NameObject, NumberObject, TextStringObject
+from reportlab.lib.pagesizes import A4
+from reportlab.pdfgen import canvas
+
+from services.pdf_template import PdfTemplate
+
+
+def make_template(path):
+    packet = io.BytesIO()
+    c = canvas.Canvas(packet, pagesize=A4)
+    c.drawString(40, 800, "template")
+    c.save()
+    packet.seek(0)
+
+    writer = PdfWriter()
+    page = writer.add_page(PdfReader(packet).pages[0])
+    page[NameObject("/Rotate")] = NumberObject(90)
+    page[NameObject("/CropBox")] = ArrayObject(FloatObject(v) for v in (10, 10, 500, 800))
+    page[NameObject("/Group")] = DictionaryObject(
+        {
+            NameObject("/Type"): NameObject("/Group"),
+            NameObject("/S"): NameObject("/Transparency"),
+            NameObject("/CS"): NameObject("/DeviceRGB"),
+        }
+    )
+    annot = DictionaryObject(
+        {
+            NameObject("/Type"): NameObject("/Annot"),
+            NameObject("/Subtype"): NameObject("/Text"),
+            NameObject("/Rect"): ArrayObject(FloatObject(v) for v in (50, 50, 80, 80)),
+            NameObject("/Contents"): TextStringObject("memo"),
+        }
+    )
+    page[NameObject("/Annots")] = ArrayObject([writer._add_object(annot)])
+    with open(path, "wb") as f:
+        writer.write(f)
+
+
+def test_template_page_attributes_survive(tmp_path):
+    template_path = tmp_path / "template.pdf"
+    make_template(template_path)
+    template = PdfTemplate(str(template_path))
+
+    writer = PdfWriter()
+    refs = template.register(writer)
+    for _ in range(2):
+        template.add_page(writer, refs)
+    out = io.BytesIO()
+    writer.write(out)
+    out.seek(0)
+
+    pages = PdfReader(out).pages
+    for page in pages:
+        assert page["/Rotate"] == 90
+        assert page["/Group"]["/S"] == "/Transparency"
+        assert [float(v) for v in page["/CropBox"]] == [10, 10, 500, 800]
+        (annot,) = page["/Annots"]
+        assert annot.get_object()["/Contents"] == "memo"
+        assert "/P" not in annot.get_object()
+    # 주석은 페이지마다 따로 복제됨
+    assert pages[0]["/Annots"][0].idnum != pages[1]["/Annots"][0].idnum
@@ -0,0 +1,110 @@
+import json
+import sqlite3
+
+import pytest
+
+import config
+from services.student_store import StudentStore, open_student_store
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = StudentStore(str(tmp_path / "students.db"))
+    yield store
+    store.close()
+
+
+def read_json(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_save_changes_inserts_new_rows_and_updates_dirty_rows(store):
+    ids = store.save_changes(
+        [
+            {"id": None, "name": "kim", "note_title": "a", "note_numbers": ["1", "2"]},
+            {"id": None, "name": "lee", "note_title": "b", "note_numbers": "3"},
+        ]
+    )
+    assert len(set(ids)) == 2
+    assert store.load_all() == [
+        {"id": ids[0], "name": "kim", "note_title": "a", "note_numbers": "1, 2"},
+        {"id": ids[1], "name": "lee", "note_title": "b", "note_numbers": "3"},
+    ]
+
+    # 바뀐 행만 넘겨도 나머지 행은 그대로, 새 행은 뒤에 추가됨
+    new_ids = store.save_changes(
+        [
+            {"id": ids[1], "name": "lee", "note_title": "c", "note_numbers": "4"},
+            {"id": None, "name": "park", "note_title": "", "note_numbers": ""},
+        ]
+    )
+    assert new_ids[0] == ids[1]
+    assert [(user["name"], user["note_title"]) for user in store.load_all()] == [
+        ("kim", "a"),
+        ("lee", "c"),
+        ("park", ""),
+    ]
+
+
+def test_save_changes_deletes_removed_rows(store):
+    ids = store.save_changes([{"id": None, "name": name} for name in ("kim", "lee", "park")])
+    store.save_changes([{"id": ids[2], "name": "park", "note_title": "t"}], deleted_ids={ids[0], ids[1]})
+    assert store.load_all() == [{"id": ids[2], "name": "park", "note_title": "t", "note_numbers": ""}]
+
+
+def test_save_changes_is_one_transaction(store):
+    ids = store.save_changes([{"id": None, "name": name} for name in ("kim", "lee")])
+
+    def upserts():
+        yield {"id": None, "name": "park"}
+        raise sqlite3.OperationalError("disk I/O error")
+
+    with pytest.raises(sqlite3.OperationalError):
+        store.save_changes(upserts(), deleted_ids=[ids[0]])
+    # 실패하면 삭제/추가 모두 되돌려짐
+    assert [user["name"] for user in store.load_all()] == ["kim", "lee"]
+
+
+def test_changes_survive_reopen(tmp_path):
+    path = str(tmp_path / "students.db")
+    store = StudentStore(path)
+    store.save_changes([{"id": None, "name": "kim", "note_numbers": "1"}])
+    store.close()
+    store = StudentStore(path)
+    assert [(user["name"], user["note_numbers"]) for user in store.load_all()] == [("kim", "1")]
+    store.close()
+
+
+def test_open_student_store_migrates_users_once(config_file, tmp_path):
+    users = [{"name": "kim", "note_title": "t", "note_numbers": "1, 2"}]
+    config_file.write_text(json.dumps({"source_dir": "src", "users": users}), encoding="utf-8")
+    db_path = str(tmp_path / "students.db")
+
+    store = open_student_store(config.load_previous_config(), db_path)
+    config.flush_config()
+    assert [user["name"] for user in store.load_all()] == ["kim"]
+    # 설정 파일에는 users 삭제만 반영되고 기본값은 쓰지 않음
+    assert read_json(config_file) == {"source_dir": "src"}
+
+    # DB 를 비운 뒤 다시 열어도 예전 학생 목록이 되살아나지 않음
+    store.replace_all([])
+    store.close()
+    store = open_student_store(config.load_previous_config(), db_path)
+    assert store.load_all() == []
+    store.close()
+
+
+def test_open_student_store_keeps_existing_db_rows(config_file, tmp_path):
+    db_path = str(tmp_path / "students.db")
+    store = StudentStore(db_path)
+    store.save_changes([{"id": None, "name": "lee"}])
+    store.close()
+    config_file.write_text(json.dumps({"users": [{"name": "kim"}]}), encoding="utf-8")
+
+    # DB 에 이미 학생이 있으면 예전 설정의 목록으로 덮어쓰지 않고 설정에서만 지움
+    store = open_student_store(config.load_previous_config(), db_path)
+    config.flush_config()
+    assert [user["name"] for user in store.load_all()] == ["lee"]
+    assert read_json(config_file) == {}
+    store.close()
@@ -0,0 +1,47 @@
+from PySide6.QtCore import QPersistentModelIndex
+
+from ui.student_table import COL_NAME, StudentTableModel
+
+
+def visible_names(model):
+    return [student["name"] for student in model.visible_students()]
+
+
+def test_search_after_merge_finds_rows_that_were_hidden():
+    model = StudentTableModel()
+    model.set_students(
+        [
+            {"name": "kim", "note_title": "ab", "note_numbers": "1"},
+            {"name": "lee", "note_title": "xy", "note_numbers": "2"},
+        ]
+    )
+    model.set_search("ab", column=2)
+    assert visible_names(model) == ["kim"]
+
+    # 검색에 가려진 lee 의 제목이 검색어에 맞게 바뀜
+    model.merge_students([{"name": "lee", "note_title": "abc", "note_numbers": "2"}])
+    model.set_search("abc", column=2)
+    assert visible_names(model) == ["lee"]
+
+
+def test_narrowing_search_keeps_filtering_visible_rows():
+    model = StudentTableModel()
+    model.set_students([{"name": name, "note_title": "", "note_numbers": ""} for name in ("park", "pam", "kim")])
+    model.set_search("pa", column=1)
+    model.set_search("par", column=1)
+    assert visible_names(model) == ["park"]
+    model.set_search("", column=1)
+    assert visible_names(model) == ["park", "pam", "kim"]
+
+
+def test_search_keeps_indexes_of_rows_that_stay_visible():
+    model = StudentTableModel()
+    model.set_students([{"name": name, "note_title": "", "note_numbers": ""} for name in ("kim", "park", "pam")])
+    park = QPersistentModelIndex(model.index(1, COL_NAME))
+    kim = QPersistentModelIndex(model.index(0, COL_NAME))
+    model.set_search("pa", column=1)
+    # 뷰의 선택/현재 셀이 계속 보이는 행을 따라감
+    assert park.isValid() and park.row() == 0 and park.data() == "park"
+    assert not kim.isValid()
+    model.set_search("", column=1)
+    assert park.row() == 1 and park.data() == "park"
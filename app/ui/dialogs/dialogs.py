@@ -111,6 +111,7 @@ class PathDialog(QDialog):
         self.dst_input.setText(self.config.get("target_dir", DEFAULT_DST))
 
     def confirm_config(self):
+        # 경로 값만 기존 설정에 병합 (다른 설정은 유지)
         save_config(
             {
                 "source_dir": self.src_input.text(),
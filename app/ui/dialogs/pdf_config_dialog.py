@@ -1,4 +1,6 @@
 from PySide6.QtWidgets import (
+    QCheckBox,
+    QComboBox,
     QDialog,
     QVBoxLayout,
     QLineEdit,
@@ -11,17 +13,25 @@ from PySide6.QtWidgets import (
     QSpinBox,
     QGraphicsView,
     QGraphicsScene,
-    QGraphicsRectItem,
+    QGraphicsPixmapItem,
     QWidget,
 )
-from PySide6.QtCore import Qt, QRectF
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QPen, QColor, QBrush, QPainter
 from config import load_previous_config, save_config
+from services.page_layout import LEGACY_GRID, MAX_GRID_COLS, MAX_GRID_ROWS, compute_layout, grid_name, slot_offset_keys
+from ui.preview_images import sample_note_pixmaps, template_pixmap
+from ui.thumbnail_loader import ThumbnailLoader
+
+# 미리보기에 넣을 샘플 이미지의 최대 크기(px), 박스보다 조금 크게 읽어 두면 확대해도 충분함
+PREVIEW_SAMPLE_SIZE = 480
+# 슬라이더를 끄는 동안 들어오는 값 변경을 한 프레임에 한 번만 반영
+PREVIEW_INTERVAL_MS = 16
 
 
 # pdf 설정
 class DialogPdfConfig(QDialog):
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, thumbnails=None):
         super().__init__(parent)
         self.setWindowTitle("PDF 이미지 설정")
         self.resize(700, 500)  # 크기 키움 (미리보기 공간 확보)
@@ -50,6 +60,22 @@ class DialogPdfConfig(QDialog):
         line.setFrameShadow(QFrame.Sunken)
         self.form_layout.addRow(line)
 
+        # --- 구분 제목 ---
+        self.form_layout.addRow(QLabel("페이지당 이미지 배치 (세로 칸 x 가로 칸)"))
+
+        self.grid_rows_input = self.create_slider_spinbox_group(
+            "세로 칸 수 (grid_rows):", self.prev_config.get("grid_rows", 2), 1, MAX_GRID_ROWS
+        )
+        self.grid_cols_input = self.create_slider_spinbox_group(
+            "가로 칸 수 (grid_cols):", self.prev_config.get("grid_cols", 1), 1, MAX_GRID_COLS
+        )
+
+        # --- 구분선 ---
+        line_grid = QFrame()
+        line_grid.setFrameShape(QFrame.HLine)
+        line_grid.setFrameShadow(QFrame.Sunken)
+        self.form_layout.addRow(line_grid)
+
         # --- 구분 제목 ---
         self.form_layout.addRow(QLabel("좌우/상하 여백 설정"))
 
@@ -70,18 +96,39 @@ class DialogPdfConfig(QDialog):
         # --- 구분 제목 ---
         self.form_layout.addRow(QLabel("이미지 위치 미세 조정 (x: 오른쪽+, y: 위로+)"))
 
-        # 오프셋 설정 슬라이더 + 스핀박스
-        self.target_x_offset1 = self.create_slider_spinbox_group(
-            "이미지1 좌우(x-offset):", self.prev_config.get("x_offset1", 0), -200, 200
+        # 칸별 오프셋: 칸을 고른 뒤 그 칸의 값을 조정 (칸 번호 -> [x, y])
+        # 오프셋은 맞춘 배치에서만 의미가 있으므로 배치마다 따로 기억하고, 처음 고른 배치는 0 부터 시작
+        saved_grid = self.prev_config.get("slot_offsets_grid", grid_name(*LEGACY_GRID))
+        self.grid_offsets = {
+            saved_grid: {
+                slot: [self.prev_config.get(key, 0) for key in slot_offset_keys(slot)]
+                for slot in range(MAX_GRID_ROWS * MAX_GRID_COLS)
+            }
+        }
+        self.slot_offsets = self.current_grid_offsets()
+        self._loading_slot = False
+        self.slot_combo = QComboBox()
+        self.form_layout.addRow("조정할 이미지:", self.slot_combo)
+        self.slot_x_offset_input = self.create_slider_spinbox_group(
+            "좌우(x-offset):", self.slot_offsets[0][0], -200, 200
         )
-        self.target_y_offset1 = self.create_slider_spinbox_group(
-            "이미지1 상하(y-offset):", self.prev_config.get("y_offset1", -50), -200, 200
+        self.slot_y_offset_input = self.create_slider_spinbox_group(
+            "상하(y-offset):", self.slot_offsets[0][1], -200, 200
         )
-        self.target_x_offset2 = self.create_slider_spinbox_group(
-            "이미지2 좌우(x-offset):", self.prev_config.get("x_offset2", 0), -200, 200
+
+        # --- 구분선 ---
+        line3 = QFrame()
+        line3.setFrameShape(QFrame.HLine)
+        line3.setFrameShadow(QFrame.Sunken)
+        self.form_layout.addRow(line3)
+
+        # PDF 생성 동시 작업 수 (0 = CPU 코어 수만큼 자동)
+        self.pdf_workers_input = self.create_slider_spinbox_group(
+            "동시 작업 수 (0=자동):", self.prev_config.get("pdf_workers", 0), 0, 32
         )
-        self.target_y_offset2 = self.create_slider_spinbox_group(
-            "이미지2 상하(y-offset):", self.prev_config.get("y_offset2", 10), -200, 200
+        # 삽입 이미지 해상도 (0 = 원본 그대로)
+        self.image_dpi_input = self.create_slider_spinbox_group(
+            "이미지 해상도 DPI (0=원본):", self.prev_config.get("image_dpi", 200), 0, 600
         )
 
         self.left_layout.addLayout(self.form_layout)
@@ -96,32 +143,51 @@ class DialogPdfConfig(QDialog):
 
         # 오른쪽 미리보기 부분
         self.preview_layout = QVBoxLayout()
-        self.preview_label = QLabel("미리보기 (대략적인 위치)")
-        self.preview_layout.addWidget(self.preview_label)
-
-        # 그래픽스 뷰 생성
-        self.scene = QGraphicsScene()
+        preview_header = QHBoxLayout()
+        self.preview_label = QLabel("미리보기")
+        self.show_real_checkbox = QCheckBox("실제 템플릿/이미지 표시")
+        self.show_real_checkbox.setChecked(True)
+        preview_header.addWidget(self.preview_label)
+        preview_header.addStretch()
+        preview_header.addWidget(self.show_real_checkbox)
+        self.preview_layout.addLayout(preview_header)
+
+        # 그래픽스 뷰 생성 (장면 항목은 한 번 만들고 값이 바뀌면 위치만 옮김)
+        self.scene = QGraphicsScene(self)
         self.view = QGraphicsView(self.scene)
         self.view.setRenderHint(QPainter.Antialiasing)
+        self.view.setRenderHint(QPainter.SmoothPixmapTransform)
         self.preview_layout.addWidget(self.view)
+        self.setup_preview_items()
+        self.preview_timer = QTimer(self)
+        self.preview_timer.setSingleShot(True)
+        self.preview_timer.setInterval(PREVIEW_INTERVAL_MS)
+        self.preview_timer.timeout.connect(self.update_preview)
+        # 원본 폴더 색인 갱신(폴더 스캔)은 백그라운드에서 하고, 끝나면 샘플 이미지를 다시 읽음
+        self.thumbnails = thumbnails if thumbnails is not None else ThumbnailLoader(self)
+        self.thumbnails.index_refreshed.connect(self.on_index_refreshed)
 
         # 메인 레이아웃에 미리보기 추가
         self.main_layout.addLayout(self.preview_layout, 1)  # 비율 1
 
         self.setLayout(self.main_layout)
 
-        # 모든 위젯 초기화 후 미리보기 업데이트
+        # 모든 위젯 초기화 후 칸 목록 채우고 미리보기 업데이트
+        self.load_real_preview()
+        self.update_slot_combo()
         self.update_preview()
 
-        # 모든 슬라이더 값 변경 시 미리보기 업데이트 연결
-        self.target_w_input.valueChanged.connect(self.update_preview)
-        self.target_h_input.valueChanged.connect(self.update_preview)
-        self.h_margin_input.valueChanged.connect(self.update_preview)
-        self.v_margin_input.valueChanged.connect(self.update_preview)
-        self.target_x_offset1.valueChanged.connect(self.update_preview)
-        self.target_y_offset1.valueChanged.connect(self.update_preview)
-        self.target_x_offset2.valueChanged.connect(self.update_preview)
-        self.target_y_offset2.valueChanged.connect(self.update_preview)
+        # 모든 슬라이더 값 변경 시 미리보기 업데이트 예약
+        self.target_w_input.valueChanged.connect(self.schedule_preview)
+        self.target_h_input.valueChanged.connect(self.schedule_preview)
+        self.h_margin_input.valueChanged.connect(self.schedule_preview)
+        self.v_margin_input.valueChanged.connect(self.schedule_preview)
+        self.show_real_checkbox.toggled.connect(self.load_real_preview)
+        self.grid_rows_input.valueChanged.connect(self.update_slot_combo)
+        self.grid_cols_input.valueChanged.connect(self.update_slot_combo)
+        self.slot_combo.currentIndexChanged.connect(self.load_slot_offsets)
+        self.slot_x_offset_input.valueChanged.connect(self.store_slot_offsets)
+        self.slot_y_offset_input.valueChanged.connect(self.store_slot_offsets)
 
     def create_slider_spinbox_group(self, label, default_value, min_val, max_val):
         container = QWidget()
@@ -150,71 +216,184 @@ class DialogPdfConfig(QDialog):
 
         return spinbox  # ✅ 스핀박스를 리턴 (값 저장/로드용)
 
-    def update_preview(self):
-        self.scene.clear()
-        page_w, page_h = 595, 842  # A4 pt
-        self.scene.setSceneRect(0, 0, page_w, page_h)
+    # -------------------- 칸별 오프셋 --------------------
+    def slot_count(self):
+        return self.grid_rows_input.value() * self.grid_cols_input.value()
 
-        # 페이지 테두리
-        border_pen = QPen(QColor(150, 150, 150))
-        border_pen.setStyle(Qt.DashLine)
-        self.scene.addRect(0, 0, page_w, page_h, border_pen)
+    def current_grid_name(self):
+        return grid_name(self.grid_rows_input.value(), self.grid_cols_input.value())
+
+    def current_grid_offsets(self):
+        """지금 배치의 칸별 오프셋 (처음 고른 배치면 모두 0)"""
+        return self.grid_offsets.setdefault(
+            self.current_grid_name(), {slot: [0, 0] for slot in range(MAX_GRID_ROWS * MAX_GRID_COLS)}
+        )
 
+    def update_slot_combo(self):
+        """칸 수가 바뀌면 그 배치의 오프셋으로 바꾸고 선택 목록을 다시 만든 뒤 (가능하면 같은 칸 유지) 미리보기 갱신"""
+        self.slot_offsets = self.current_grid_offsets()
+        current = max(0, self.slot_combo.currentIndex())
+        self.slot_combo.blockSignals(True)
+        self.slot_combo.clear()
+        self.slot_combo.addItems([f"이미지 {slot + 1}" for slot in range(self.slot_count())])
+        self.slot_combo.setCurrentIndex(min(current, self.slot_count() - 1))
+        self.slot_combo.blockSignals(False)
+        self.load_slot_offsets()
+
+    def load_slot_offsets(self):
+        # 스핀박스 값을 바꾸는 동안 store_slot_offsets 가 다른 칸에 저장하지 않도록 표시
+        x_offset, y_offset = self.slot_offsets[max(0, self.slot_combo.currentIndex())]
+        self._loading_slot = True
+        self.slot_x_offset_input.setValue(x_offset)
+        self.slot_y_offset_input.setValue(y_offset)
+        self._loading_slot = False
+        self.schedule_preview()
+
+    def store_slot_offsets(self):
+        if self._loading_slot:
+            return
+        self.slot_offsets[max(0, self.slot_combo.currentIndex())] = [
+            self.slot_x_offset_input.value(),
+            self.slot_y_offset_input.value(),
+        ]
+        self.schedule_preview()
+
+    def layout_config(self):
+        """지금 입력된 레이아웃 값 (저장 형식 그대로, 사용하는 칸의 오프셋만)"""
         cfg = {
             "target_w": self.target_w_input.value(),
             "target_h": self.target_h_input.value(),
             "h_margin": self.h_margin_input.value(),
             "v_margin": self.v_margin_input.value(),
-            "x_offset1": self.target_x_offset1.value(),
-            "y_offset1": self.target_y_offset1.value(),
-            "x_offset2": self.target_x_offset2.value(),
-            "y_offset2": self.target_y_offset2.value(),
+            "grid_rows": self.grid_rows_input.value(),
+            "grid_cols": self.grid_cols_input.value(),
+            "slot_offsets_grid": self.current_grid_name(),
         }
+        for slot in range(self.slot_count()):
+            x_key, y_key = slot_offset_keys(slot)
+            cfg[x_key], cfg[y_key] = self.slot_offsets[slot]
+        return cfg
+
+    # -------------------- 미리보기 --------------------
+    def setup_preview_items(self):
+        """페이지 테두리/템플릿 항목 생성 (칸 항목은 필요한 만큼 _ensure_slot_items 에서 추가)"""
+        layout = compute_layout(self.layout_config())
+        self.scene.setSceneRect(0, 0, layout.page_w, layout.page_h)
+
+        self.template_item = QGraphicsPixmapItem()
+        self.template_item.setTransformationMode(Qt.SmoothTransformation)
+        self.template_item.setZValue(-2)
+        self.scene.addItem(self.template_item)
 
-        target_w = cfg["target_w"]
-        target_h = cfg["target_h"]
-        h_margin = cfg["h_margin"]
-        v_margin = cfg["v_margin"]
-        x_offset1 = cfg["x_offset1"]
-        y_offset1 = cfg["y_offset1"]
-        x_offset2 = cfg["x_offset2"]
-        y_offset2 = cfg["y_offset2"]
-
-        img_h = (page_h - (2 + 1) * v_margin) / 2
-
-        # PDF 기준 y 계산
-        pdf_positions = [
-            {
-                "x": h_margin + x_offset1,
-                "y": page_h - v_margin - (0 + 1) * img_h - 0 * v_margin + y_offset1,
-            },
-            {
-                "x": h_margin + x_offset2,
-                "y": page_h - v_margin - (1 + 1) * img_h - 1 * v_margin + y_offset2,
-            },
-        ]
-
-        pen = QPen(Qt.black)
-        brush = QBrush(QColor(100, 150, 255, 100))
+        # 페이지 테두리
+        border_pen = QPen(QColor(150, 150, 150))
+        border_pen.setStyle(Qt.DashLine)
+        self.scene.addRect(0, 0, layout.page_w, layout.page_h, border_pen)
+
+        self.slot_pen = QPen(Qt.black)
+        self.slot_brush = QBrush(QColor(100, 150, 255, 100))
+        self.selected_slot_brush = QBrush(QColor(255, 150, 50, 120))
+        # 실제 이미지를 깔았을 때는 이미지가 보이도록 옅게
+        self.real_slot_brush = QBrush(QColor(100, 150, 255, 40))
+        self.real_selected_slot_brush = QBrush(QColor(255, 150, 50, 60))
+        self.slot_items = []  # 칸별 (박스, 샘플 이미지, 번호)
+        self.sample_pixmaps = []
+        self._sample_request = 0
+
+    def _ensure_slot_items(self, count):
+        while len(self.slot_items) < count:
+            sample_item = QGraphicsPixmapItem()
+            sample_item.setTransformationMode(Qt.SmoothTransformation)
+            sample_item.setZValue(-1)
+            self.scene.addItem(sample_item)
+            rect_item = self.scene.addRect(0, 0, 0, 0, self.slot_pen, self.slot_brush)
+            label_item = self.scene.addSimpleText(str(len(self.slot_items) + 1))
+            label_item.setZValue(1)
+            self.slot_items.append((rect_item, sample_item, label_item))
+
+    def load_real_preview(self):
+        """템플릿 첫 페이지(한 번 그려 둔 이미지)와 원본 폴더의 샘플 이미지를 미리보기 뒤에 깔기"""
+        show_real = self.show_real_checkbox.isChecked()
+        pixmap, page_size = template_pixmap(self.prev_config.get("template_dir", "")) if show_real else (None, None)
+        if pixmap is None:
+            self.template_item.setVisible(False)
+        else:
+            # 템플릿 페이지도 PDF 처럼 왼쪽 아래 기준으로 맞춤
+            self.template_item.setPixmap(pixmap)
+            self.template_item.setScale(page_size.width() / pixmap.width())
+            self.template_item.setPos(0, self.scene.sceneRect().height() - page_size.height())
+            self.template_item.setVisible(True)
+        self.sample_pixmaps = []
+        self._sample_request = 0
+        source_dir = self.prev_config.get("source_dir", "")
+        if show_real and source_dir:
+            self.thumbnails.refresh_index(source_dir)
+        self.schedule_preview()
+
+    def on_index_refreshed(self, source_dir):
+        if source_dir != self.prev_config.get("source_dir", "") or not self.show_real_checkbox.isChecked():
+            return
+        # 이미 읽은 이미지는 캐시에 있으므로 새로 생긴 것만 디코딩함
+        self.sample_pixmaps = []
+        self._sample_request = 0
+        self.schedule_preview()
+
+    def schedule_preview(self):
+        if not self.preview_timer.isActive():
+            self.preview_timer.start()
 
-        for pos in pdf_positions:
-            qt_x = pos["x"]
-            qt_y = page_h - pos["y"] - target_h  # PDF → Qt 좌표 변환
-            self.scene.addRect(qt_x, qt_y, target_w, target_h, pen, brush)
+    def update_preview(self):
+        # PDF 생성과 같은 칸 배치 표를 사용하고, 장면 항목은 새로 만들지 않고 위치/크기만 바꿈
+        layout = compute_layout(self.layout_config())
+        page_h = layout.page_h
+        count = layout.per_page
+        self._ensure_slot_items(count)
+        show_real = self.show_real_checkbox.isChecked()
+        if show_real and self._sample_request < count:
+            # 칸 수가 늘었을 때만 더 읽음 (원본 폴더에 이미지가 적어도 매번 다시 찾지 않음)
+            self._sample_request = count
+            source_dir = self.prev_config.get("source_dir", "")
+            self.sample_pixmaps = sample_note_pixmaps(source_dir, count, PREVIEW_SAMPLE_SIZE)
+        if show_real:
+            brush, selected_brush = self.real_slot_brush, self.real_selected_slot_brush
+        else:
+            brush, selected_brush = self.slot_brush, self.selected_slot_brush
+        selected = self.slot_combo.currentIndex()
+
+        for slot, (rect_item, sample_item, label_item) in enumerate(self.slot_items):
+            visible = slot < count
+            rect_item.setVisible(visible)
+            label_item.setVisible(visible)
+            pixmap = self.sample_pixmaps[slot] if show_real and slot < len(self.sample_pixmaps) else None
+            sample_item.setVisible(visible and pixmap is not None)
+            if not visible:
+                continue
+            rect = layout.slots[slot]
+            qt_y = page_h - rect.y - rect.height  # PDF → Qt 좌표 변환
+            rect_item.setRect(rect.x, qt_y, rect.width, rect.height)
+            rect_item.setBrush(selected_brush if slot == selected else brush)
+            label_item.setPos(rect.x + 4, qt_y + 2)
+            if pixmap is not None:
+                if sample_item.pixmap().cacheKey() != pixmap.cacheKey():
+                    sample_item.setPixmap(pixmap)
+                x, y, w, h = layout.place(slot, pixmap.width(), pixmap.height())
+                sample_item.setScale(w / pixmap.width())
+                sample_item.setPos(x, page_h - y - h)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.view.fitInView(self.scene.sceneRect(), Qt.KeepAspectRatio)
 
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
         self.view.fitInView(self.scene.sceneRect(), Qt.KeepAspectRatio)
 
     def _save_config(self):
+        # 레이아웃 값만 기존 설정에 병합 (다른 설정은 유지)
         new_config = {
-            **self.prev_config,  # 기존 값 유지
-            "h_margin": int(self.h_margin_input.text()),
-            "v_margin": int(self.v_margin_input.text()),
-            "target_w": int(self.target_w_input.text()),
-            "target_h": int(self.target_h_input.text()),
-            "x_offset1": int(self.target_x_offset1.text()),
-            "y_offset1": int(self.target_y_offset1.text()),
-            "x_offset2": int(self.target_x_offset2.text()),
-            "y_offset2": int(self.target_y_offset2.text()),
+            **self.layout_config(),
+            "pdf_workers": int(self.pdf_workers_input.text()),
+            "image_dpi": int(self.image_dpi_input.text()),
         }
-        save_config(new_config)  # ✅ 파일에 저장
+        save_config(new_config)  # ✅ 잠시 뒤 파일에 저장
         self.accept()
@@ -0,0 +1,39 @@
+from PySide6.QtCore import QTimer
+from PySide6.QtWidgets import QPlainTextEdit
+
+LOG_PANEL_MAX_BLOCKS = 5000
+
+
+class LogPanel(QPlainTextEdit):
+    """로그 표시 영역: 같은 이벤트 루프 차례에 들어온 줄은 한 번에 붙이고, 오래된 줄은 버림"""
+
+    def __init__(self, parent=None, max_blocks=LOG_PANEL_MAX_BLOCKS):
+        super().__init__(parent)
+        self.setReadOnly(True)
+        self.setMaximumBlockCount(max_blocks)
+        self._pending = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(0)
+        self._flush_timer.timeout.connect(self.flush)
+
+    def append_line(self, line):
+        self._pending.append(line)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def flush(self):
+        if not self._pending:
+            return
+        text = "\n".join(self._pending)
+        self._pending.clear()
+        scrollbar = self.verticalScrollBar()
+        at_bottom = scrollbar.value() >= scrollbar.maximum() - 4
+        self.appendPlainText(text)
+        # 사용자가 위로 스크롤해서 보고 있을 때는 위치를 유지
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
+
+    def clear(self):
+        self._pending.clear()
+        super().clear()
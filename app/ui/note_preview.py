@@ -0,0 +1,132 @@
+from PySide6.QtCore import QSize, Qt, QUrl
+from PySide6.QtGui import QDesktopServices, QIcon
+from PySide6.QtWidgets import QLabel, QListView, QListWidget, QListWidgetItem, QStyle, QVBoxLayout, QWidget
+
+from services.student_io import parse_note_numbers
+from utils.source_index import IMAGE_EXTENSIONS, get_source_index
+
+# 번호가 아주 많은 학생도 패널이 느려지지 않도록 앞쪽만 표시
+MAX_PREVIEW_NOTES = 60
+PATH_ROLE = Qt.UserRole
+
+
+class NotePreviewPanel(QWidget):
+    """학생 한 명의 오답노트 이미지 썸네일 목록 (썸네일은 ThumbnailLoader 가 백그라운드에서 준비)"""
+
+    def __init__(self, thumbnails, parent=None):
+        super().__init__(parent)
+        self.thumbnails = thumbnails
+        self._items = {}  # 원본 경로 -> [(QListWidgetItem, mtime_ns)]
+        self.row = None  # 표시 중인 StudentRow
+        self.source_dir = ""
+        self._index_generation = None  # 표시에 사용한 원본 색인 상태 (바뀌면 다시 표시)
+        self._waiting_index = False  # 색인 갱신 결과를 기다리는 중
+        self._shown_scanning = False  # "확인 중" 으로 표시했음
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.title_label = QLabel("오답노트 미리보기")
+        self.title_label.setWordWrap(True)
+        layout.addWidget(self.title_label)
+
+        self.list_widget = QListWidget()
+        self.list_widget.setViewMode(QListView.IconMode)
+        self.list_widget.setIconSize(QSize(thumbnails.max_px, thumbnails.max_px))
+        self.list_widget.setResizeMode(QListView.Adjust)
+        self.list_widget.setMovement(QListView.Static)
+        self.list_widget.setUniformItemSizes(True)
+        self.list_widget.setWordWrap(True)
+        self.list_widget.setToolTip("더블클릭하면 원본 이미지를 엽니다.")
+        layout.addWidget(self.list_widget)
+
+        style = self.style()
+        self._loading_icon = style.standardIcon(QStyle.SP_FileIcon)
+        self._missing_icon = style.standardIcon(QStyle.SP_MessageBoxWarning)
+
+        self.thumbnails.thumbnail_ready.connect(self.on_thumbnail_ready)
+        self.thumbnails.index_refreshed.connect(self.on_index_refreshed)
+        self.list_widget.itemDoubleClicked.connect(self.open_image)
+
+    def show_student(self, row, source_dir):
+        """StudentRow 의 오답노트 번호를 원본 폴더에서 찾아 표시 (None 이면 비움)
+
+        지금 가진 색인으로 바로 표시하고, 색인 갱신(폴더 스캔)은 백그라운드에 맡긴 뒤 바뀌었으면 다시 표시한다.
+        """
+        self.thumbnails.cancel_pending()
+        self.row = row
+        self.source_dir = source_dir
+        self._waiting_index = row is not None and bool(source_dir)
+        if self._waiting_index:
+            self.thumbnails.refresh_index(source_dir)
+        self._render()
+
+    def _render(self):
+        self.list_widget.clear()
+        self._items.clear()
+        row = self.row
+        if row is None:
+            self._index_generation = None
+            self._shown_scanning = False
+            self.title_label.setText("오답노트 미리보기")
+            return
+
+        numbers = parse_note_numbers(row.note_numbers)
+        # 스캔은 refresh_index 가 백그라운드에서 하므로 여기서는 폴더를 읽지 않음
+        index = get_source_index(self.source_dir, refresh=False) if self.source_dir else None
+        scanning = self._shown_scanning = index is not None and not index.scanned and self._waiting_index
+        self._index_generation = index.generation if index is not None else None
+        title = f"{row.name or '(이름 없음)'} - {len(numbers)}개"
+        if len(numbers) > MAX_PREVIEW_NOTES:
+            title += f" (앞 {MAX_PREVIEW_NOTES}개만 표시)"
+        if scanning:
+            title += " (원본 폴더 확인 중)"
+        elif index is None or not index.scanned:
+            title += " (원본 폴더를 읽을 수 없음)"
+        self.title_label.setText(title)
+
+        self.list_widget.setUpdatesEnabled(False)
+        for number in numbers[:MAX_PREVIEW_NOTES]:
+            entry = index.lookup(number, IMAGE_EXTENSIONS) if index is not None else None
+            item = QListWidgetItem(number)
+            item.setTextAlignment(Qt.AlignHCenter)
+            if scanning:
+                item.setIcon(self._loading_icon)
+            elif entry is None:
+                item.setIcon(self._missing_icon)
+                item.setToolTip(f"{number}: 원본 폴더에 이미지가 없습니다.")
+            else:
+                item.setData(PATH_ROLE, entry.path)
+                item.setToolTip(entry.path)
+                self._items.setdefault(entry.path, []).append((item, entry.mtime_ns))
+                self._apply_thumbnail(item, entry.path, entry.mtime_ns)
+            self.list_widget.addItem(item)
+        self.list_widget.setUpdatesEnabled(True)
+
+    def refresh(self):
+        """표시 중인 학생을 다시 표시 (번호가 수정된 경우)"""
+        self.show_student(self.row, self.source_dir)
+
+    def on_index_refreshed(self, source_dir):
+        if self.row is None or source_dir != self.source_dir:
+            return
+        self._waiting_index = False
+        if self._shown_scanning or get_source_index(source_dir, refresh=False).generation != self._index_generation:
+            self._render()
+
+    def _apply_thumbnail(self, item, path, mtime_ns):
+        pixmap = self.thumbnails.thumbnail(path, mtime_ns)
+        if pixmap is not None:
+            item.setIcon(QIcon(pixmap))
+        elif self.thumbnails.failed(path, mtime_ns):
+            item.setIcon(self._missing_icon)
+        else:
+            item.setIcon(self._loading_icon)
+
+    def on_thumbnail_ready(self, path):
+        for item, mtime_ns in self._items.get(path, ()):
+            self._apply_thumbnail(item, path, mtime_ns)
+
+    def open_image(self, item):
+        path = item.data(PATH_ROLE)
+        if path:
+            QDesktopServices.openUrl(QUrl.fromLocalFile(path))
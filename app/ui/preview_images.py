@@ -0,0 +1,74 @@
+import os
+
+from PySide6.QtCore import QSize, QSizeF, Qt
+from PySide6.QtGui import QImageReader, QPixmap
+from PySide6.QtPdf import QPdfDocument
+
+from utils.source_index import get_source_index
+
+# 미리보기용 템플릿 래스터 배율 (1 = 72dpi), 확대해서 봐도 글자가 읽히는 정도
+TEMPLATE_RENDER_SCALE = 2.0
+SAMPLE_CACHE_SIZE = 32
+
+# (절대경로, mtime, 크기) -> (QPixmap, 페이지 크기(pt)), 템플릿이 바뀌면 키가 달라져 다시 그림
+_template_cache = {}
+# (경로, mtime, 최대 크기) -> QPixmap
+_sample_cache = {}
+
+
+def _file_key(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return os.path.abspath(path), st.st_mtime_ns, st.st_size
+
+
+def template_pixmap(template_path):
+    """템플릿 첫 페이지 이미지와 페이지 크기(QSizeF, pt), 한 번 그린 결과를 재사용 (없거나 실패하면 (None, None))"""
+    key = _file_key(template_path) if template_path else None
+    if key is None:
+        return None, None
+    cached = _template_cache.get(key)
+    if cached is None:
+        document = QPdfDocument()
+        if document.load(template_path) != QPdfDocument.Error.None_ or document.pageCount() < 1:
+            return None, None
+        page_size = document.pagePointSize(0)
+        image = document.render(
+            0,
+            QSize(round(page_size.width() * TEMPLATE_RENDER_SCALE), round(page_size.height() * TEMPLATE_RENDER_SCALE)),
+        )
+        document.close()
+        if image.isNull():
+            return None, None
+        # 최신 템플릿 하나만 유지
+        _template_cache.clear()
+        cached = _template_cache[key] = (QPixmap.fromImage(image), QSizeF(page_size))
+    return cached
+
+
+def sample_note_pixmaps(source_dir, count, max_size):
+    """원본 폴더의 앞쪽 이미지 count 개를 max_size(px) 안으로 줄여 읽은 QPixmap 목록 (디코딩 단계에서 축소)
+
+    폴더는 다시 읽지 않고 지금 가진 색인을 사용하므로, 색인 갱신은 ThumbnailLoader.refresh_index 로 따로 요청한다.
+    """
+    if not source_dir:
+        return []
+    pixmaps = []
+    for entry in get_source_index(source_dir, refresh=False).image_entries(count):
+        key = (entry.path, entry.mtime_ns, max_size)
+        pixmap = _sample_cache.get(key)
+        if pixmap is None:
+            reader = QImageReader(entry.path)
+            size = reader.size()
+            if size.isValid() and max(size.width(), size.height()) > max_size:
+                reader.setScaledSize(size.scaled(max_size, max_size, Qt.KeepAspectRatio))
+            image = reader.read()
+            if image.isNull():
+                continue
+            if len(_sample_cache) >= SAMPLE_CACHE_SIZE:
+                _sample_cache.clear()
+            pixmap = _sample_cache[key] = QPixmap.fromImage(image)
+        pixmaps.append(pixmap)
+    return pixmaps
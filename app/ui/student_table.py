@@ -0,0 +1,497 @@
+from operator import attrgetter
+
+from PySide6.QtCore import QAbstractTableModel, QEvent, QModelIndex, QRect, Qt, Signal
+from PySide6.QtGui import QColor
+from PySide6.QtWidgets import QLineEdit, QStyle, QStyledItemDelegate
+
+COL_CHECK = 0
+COL_NAME = 1
+COL_TITLE = 2
+COL_NUMBERS = 3
+COL_STATUS = 4
+HEADER_LABELS = ["", "이름", "오답노트 제목", "오답노트 번호", "상태"]
+
+_ROOT_INDEX = QModelIndex()
+MODIFIED_COLOR = QColor(255, 255, 200)
+FOLDER_BUTTON_SIZE = 24
+
+# 작업 상태 열 (services.jobs 의 상태 값 -> 표시 문구 / 글자색)
+STATUS_LABELS = {
+    "queued": "대기",
+    "running": "진행 중",
+    "done": "완료",
+    "failed": "실패",
+    "cancelled": "취소",
+}
+STATUS_COLORS = {
+    "done": QColor(0, 128, 0),
+    "failed": QColor(200, 0, 0),
+    "cancelled": QColor(128, 128, 128),
+}
+
+# 검색 색인에서 열 구분자 (검색어에 들어갈 수 없는 문자라서 열 경계를 넘는 일치가 없음)
+SEARCH_SEPARATOR = "\x1f"
+
+# 체크 열 정렬은 선택 집합이 필요해서 모델에서 따로 처리
+SORT_KEYS = {
+    COL_NAME: attrgetter("name"),
+    COL_TITLE: attrgetter("note_title"),
+    COL_NUMBERS: attrgetter("note_numbers"),
+}
+
+
+class StudentRow:
+    """테이블 한 행 (학생 1명), 행마다 위젯을 만들지 않도록 문자열만 보관"""
+
+    __slots__ = ("id", "db_id", "name", "note_title", "note_numbers", "search_keys")
+
+    def __init__(self, row_id, name="", note_title="", note_numbers="", db_id=None):
+        self.id = row_id
+        self.db_id = db_id  # 학생 저장소(SQLite)의 id, 아직 저장하지 않은 행은 None
+        self.name = name
+        self.note_title = note_title
+        self.note_numbers = note_numbers
+        self.refresh_search_keys()
+
+    def refresh_search_keys(self):
+        """검색 색인 (미리 소문자로 바꾼 문자열), 순서는 검색 콤보 순서와 같음: 전체, 이름, 제목, 번호"""
+        name = self.name.lower()
+        title = self.note_title.lower()
+        numbers = self.note_numbers.lower()
+        self.search_keys = (SEARCH_SEPARATOR.join((name, title, numbers)), name, title, numbers)
+
+    def to_dict(self):
+        return {"name": self.name, "note_title": self.note_title, "note_numbers": self.note_numbers}
+
+
+def _as_text(value):
+    if isinstance(value, (list, tuple)):
+        return ", ".join(str(v) for v in value)
+    return str(value or "")
+
+
+class StudentTableModel(QAbstractTableModel):
+    """학생 목록 모델 (전체 행 + 검색으로 보이는 행), 체크박스는 CheckStateRole 로 표시
+
+    뷰에는 보이는 행만 노출하므로 숨김 행에 대한 비용이 없다.
+    체크 상태는 행 id 집합(checked_ids)과 '보이면서 체크된 행 수'로 관리해서
+    전체 선택 체크박스 상태를 행을 훑지 않고 바로 계산한다.
+    """
+
+    student_edited = Signal(int)  # 수정된 행의 id
+    check_changed = Signal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._visible = []
+        self._query = ("", 0)  # (소문자 검색어, 검색 열)
+        # 보이는 행이 검색어에 맞는 행 전부인지 (아니면 이어 입력한 검색도 전체 행에서 다시 찾음)
+        self._visible_complete = True
+        self._next_id = 1
+        self.modified_ids = set()
+        self.removed_db_ids = set()
+        self.checked_ids = set()
+        self._visible_checked = 0
+        self.statuses = {}  # 행 id -> (상태, 메시지), 마지막 작업 결과
+
+    # -------------------- 데이터 적재 --------------------
+    def _new_row(self, user=None):
+        user = user or {}
+        row = StudentRow(
+            self._next_id,
+            _as_text(user.get("name", "")),
+            _as_text(user.get("note_title", "")),
+            _as_text(user.get("note_numbers", "")),
+            user.get("id"),
+        )
+        self._next_id += 1
+        return row
+
+    def _set_visible(self, rows):
+        self._visible = rows
+        checked_ids = self.checked_ids
+        self._visible_checked = sum(1 for row in rows if row.id in checked_ids) if checked_ids else 0
+
+    def set_students(self, users, search=None):
+        """전체 학생 교체 (모델 리셋 한 번), search=(검색어, 열) 을 주면 같은 패스에서 검색 필터도 적용"""
+        self.beginResetModel()
+        if search is not None:
+            self._query = (search[0].lower(), search[1])
+        self._rows = [self._new_row(user) for user in users]
+        self.modified_ids.clear()
+        self.removed_db_ids.clear()
+        self.checked_ids.clear()
+        self.statuses.clear()
+        self._set_visible(self._apply_filter(self._rows))
+        self._visible_complete = True
+        self.endResetModel()
+        self.check_changed.emit()
+
+    def add_student(self, user=None):
+        """행 추가 (검색 중이어도 새 행은 보이도록 맨 뒤에 노출), 추가된 보이는 행 번호 반환"""
+        row = self._new_row(user)
+        position = len(self._visible)
+        self.beginInsertRows(_ROOT_INDEX, position, position)
+        self._rows.append(row)
+        self._visible.append(row)
+        self.endInsertRows()
+        self.modified_ids.add(row.id)
+        self.check_changed.emit()
+        return position
+
+    def add_students(self, users):
+        """여러 행을 한 번에 추가 (저장 대상으로 표시), 검색 중이면 검색어에 맞는 행만 보임"""
+        rows = [self._new_row(user) for user in users]
+        if rows:
+            self._append_rows(rows)
+
+    def _append_rows(self, rows):
+        visible = self._apply_filter(rows)
+        if visible:
+            position = len(self._visible)
+            self.beginInsertRows(_ROOT_INDEX, position, position + len(visible) - 1)
+            self._visible.extend(visible)
+        self._rows.extend(rows)
+        if visible:
+            self.endInsertRows()
+        self.modified_ids.update(row.id for row in rows)
+        self.check_changed.emit()
+
+    def merge_students(self, users):
+        """이름 기준 병합 (한 번 훑기): 새 이름은 추가, 제목/번호가 다르면 갱신, 같으면 건너뜀
+
+        바뀐 행만 뷰에 알리고 저장 대상으로 표시한다. {"added", "updated", "skipped"} 개수 반환
+        """
+        by_name = {row.name: row for row in self._rows}
+        added = []
+        added_ids = set()
+        updated = []
+        updated_count = 0
+        skipped = 0
+        for user in users:
+            name = _as_text(user.get("name", ""))
+            if not name:
+                skipped += 1
+                continue
+            title = _as_text(user.get("note_title", ""))
+            numbers = _as_text(user.get("note_numbers", ""))
+            row = by_name.get(name)
+            if row is None:
+                row = StudentRow(self._next_id, name, title, numbers)
+                self._next_id += 1
+                by_name[name] = row
+                added.append(row)
+                added_ids.add(row.id)
+            elif row.note_title == title and row.note_numbers == numbers:
+                skipped += 1
+            else:
+                row.note_title = title
+                row.note_numbers = numbers
+                row.refresh_search_keys()
+                updated_count += 1
+                if row.id not in added_ids:  # 같은 파일 안에서 이름이 겹친 새 행은 추가로 반영됨
+                    updated.append(row)
+
+        if updated:
+            updated_ids = {row.id for row in updated}
+            self.modified_ids |= updated_ids
+            positions = [i for i, row in enumerate(self._visible) if row.id in updated_ids]
+            if positions:
+                self.dataChanged.emit(self.index(positions[0], COL_NAME), self.index(positions[-1], COL_NUMBERS))
+            if len(positions) < len(updated):
+                # 검색에 가려진 행이 바뀌어 이제 검색어에 맞을 수 있음
+                self._visible_complete = False
+        if added:
+            self._append_rows(added)
+        return {"added": len(added), "updated": updated_count, "skipped": skipped}
+
+    def replace_students(self, users):
+        """전체 학생을 새 목록으로 교체하고, 기존 저장 행은 삭제 대상 / 새 행은 저장 대상으로 표시"""
+        removed = {row.db_id for row in self._rows if row.db_id is not None} | self.removed_db_ids
+        self.set_students(users)
+        self.removed_db_ids = removed
+        self.modified_ids = {row.id for row in self._rows}
+
+    def remove_students(self, rows):
+        """StudentRow 목록 삭제 (보이는 행은 연속 구간 단위로 뷰에 알림)"""
+        remove_ids = {row.id for row in rows}
+        if not remove_ids:
+            return
+        positions = [i for i, row in enumerate(self._visible) if row.id in remove_ids]
+        self._visible_checked -= sum(1 for i in positions if self._visible[i].id in self.checked_ids)
+        while positions:
+            end = positions.pop()
+            start = end
+            while positions and positions[-1] == start - 1:
+                start = positions.pop()
+            self.beginRemoveRows(_ROOT_INDEX, start, end)
+            del self._visible[start : end + 1]
+            self.endRemoveRows()
+        self._rows = [row for row in self._rows if row.id not in remove_ids]
+        self.modified_ids -= remove_ids
+        self.removed_db_ids.update(row.db_id for row in rows if row.db_id is not None)
+        self.checked_ids -= remove_ids
+        for row_id in remove_ids:
+            self.statuses.pop(row_id, None)
+        self.check_changed.emit()
+
+    def students(self):
+        """저장/내보내기용 dict 목록 (전체 행, 현재 정렬 순서)"""
+        return [row.to_dict() for row in self._rows]
+
+    def visible_students(self):
+        """검색 결과로 보이는 학생 dict 목록"""
+        return [row.to_dict() for row in self._visible]
+
+    def checked_students(self):
+        return [row.to_dict() for row in self.checked_rows()]
+
+    def pending_changes(self):
+        """저장할 변경사항: (수정/추가된 행 목록, 삭제된 저장소 id 집합)"""
+        modified_ids = self.modified_ids
+        changed = [row for row in self._rows if row.id in modified_ids] if modified_ids else []
+        return changed, set(self.removed_db_ids)
+
+    def checked_rows(self):
+        """체크된 행 (보이지 않는 행 포함, 현재 정렬 순서)"""
+        if not self.checked_ids:
+            return []
+        return [row for row in self._rows if row.id in self.checked_ids]
+
+    def checked_count(self):
+        return len(self.checked_ids)
+
+    def visible_checked_count(self):
+        return self._visible_checked
+
+    def row_at(self, position):
+        return self._visible[position]
+
+    def total_count(self):
+        return len(self._rows)
+
+    def visible_count(self):
+        return len(self._visible)
+
+    # -------------------- 검색 / 체크 --------------------
+    def _apply_filter(self, rows):
+        text, column = self._query
+        if not text:
+            return list(rows)
+        return [row for row in rows if text in row.search_keys[column]]
+
+    def set_search(self, text, column=0):
+        """검색어로 보이는 행 갱신 (column: 0 전체, 1 이름, 2 제목, 3 번호)
+
+        같은 열에서 이전 검색어를 이어서 입력한 경우에는 지금 보이는 행 안에서만 다시 찾는다.
+        모델을 리셋하지 않고 레이아웃 변경으로 알리므로, 계속 보이는 행의 선택/현재 셀/스크롤 위치는 유지된다.
+        """
+        text = text.lower()
+        prev_text, prev_column = self._query
+        narrowing = self._visible_complete and prev_text and column == prev_column and text.startswith(prev_text)
+        self.layoutAboutToBeChanged.emit()
+        old_persistent = self.persistentIndexList()
+        old_ids = [self._visible[index.row()].id for index in old_persistent]
+        self._query = (text, column)
+        self._set_visible(self._apply_filter(self._visible if narrowing else self._rows))
+        self._visible_complete = True
+        # 검색 결과에서 빠진 행의 인덱스는 무효로 바꿈
+        positions = {row.id: i for i, row in enumerate(self._visible)}
+        self.changePersistentIndexList(
+            old_persistent,
+            [
+                self.index(positions[row_id], index.column()) if row_id in positions else QModelIndex()
+                for row_id, index in zip(old_ids, old_persistent, strict=True)
+            ],
+        )
+        self.layoutChanged.emit()
+        self.check_changed.emit()
+
+    def set_visible_checked(self, checked):
+        """보이는 행 전체 체크/해제 (집합 연산 + dataChanged 한 번)"""
+        visible_ids = {row.id for row in self._visible}
+        if checked:
+            self.checked_ids |= visible_ids
+            self._visible_checked = len(self._visible)
+        else:
+            self.checked_ids -= visible_ids
+            self._visible_checked = 0
+        if self._visible:
+            self.dataChanged.emit(
+                self.index(0, COL_CHECK), self.index(len(self._visible) - 1, COL_CHECK), [Qt.CheckStateRole]
+            )
+        self.check_changed.emit()
+
+    def set_note_numbers(self, position, text):
+        self.setData(self.index(position, COL_NUMBERS), text)
+
+    def set_status(self, row_id, state, message=""):
+        """행 id 의 작업 상태 표시, 다시 그리기는 상태 열만"""
+        self.statuses[row_id] = (state, message)
+        if self._visible:
+            self.dataChanged.emit(
+                self.index(0, COL_STATUS),
+                self.index(len(self._visible) - 1, COL_STATUS),
+                [Qt.DisplayRole, Qt.ToolTipRole, Qt.ForegroundRole],
+            )
+
+    def clear_modified(self):
+        self.modified_ids.clear()
+        self.removed_db_ids.clear()
+        if self._visible:
+            self.dataChanged.emit(
+                self.index(0, COL_NAME), self.index(len(self._visible) - 1, COL_NUMBERS), [Qt.BackgroundRole]
+            )
+
+    # -------------------- QAbstractTableModel --------------------
+    def rowCount(self, parent=_ROOT_INDEX):
+        return 0 if parent.isValid() else len(self._visible)
+
+    def columnCount(self, parent=_ROOT_INDEX):
+        return 0 if parent.isValid() else len(HEADER_LABELS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return HEADER_LABELS[section]
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        if index.column() == COL_CHECK:
+            return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsUserCheckable
+        if index.column() == COL_STATUS:
+            return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsEditable
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._visible[index.row()]
+        col = index.column()
+        if col == COL_CHECK:
+            if role == Qt.CheckStateRole:
+                return Qt.Checked if row.id in self.checked_ids else Qt.Unchecked
+            return None
+        if col == COL_STATUS:
+            status = self.statuses.get(row.id)
+            if status is None:
+                return None
+            state, message = status
+            if role == Qt.DisplayRole:
+                return STATUS_LABELS.get(state, state)
+            if role == Qt.ToolTipRole:
+                return message or None
+            if role == Qt.ForegroundRole:
+                return STATUS_COLORS.get(state)
+            return None
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            if col == COL_NAME:
+                return row.name
+            if col == COL_TITLE:
+                return row.note_title
+            return row.note_numbers
+        if role == Qt.BackgroundRole and row.id in self.modified_ids:
+            return MODIFIED_COLOR
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid():
+            return False
+        row = self._visible[index.row()]
+        col = index.column()
+        if col == COL_CHECK and role == Qt.CheckStateRole:
+            checked = Qt.CheckState(value) == Qt.Checked
+            if checked == (row.id in self.checked_ids):
+                return True
+            if checked:
+                self.checked_ids.add(row.id)
+                self._visible_checked += 1
+            else:
+                self.checked_ids.discard(row.id)
+                self._visible_checked -= 1
+            self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+            self.check_changed.emit()
+            return True
+        if col in (COL_CHECK, COL_STATUS) or role != Qt.EditRole:
+            return False
+        text = _as_text(value)
+        if text == self.data(index, Qt.EditRole):
+            return True  # 편집기를 열었다 닫기만 한 경우는 수정으로 보지 않음
+        if col == COL_NAME:
+            row.name = text
+        elif col == COL_TITLE:
+            row.note_title = text
+        else:
+            row.note_numbers = text
+        row.refresh_search_keys()
+        self.modified_ids.add(row.id)
+        self.dataChanged.emit(self.index(index.row(), COL_NAME), self.index(index.row(), COL_NUMBERS))
+        self.student_edited.emit(row.id)
+        return True
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        if column == COL_CHECK:
+            checked_ids = self.checked_ids
+
+            def key(row):
+                return row.id not in checked_ids  # 체크된 행이 먼저
+
+        else:
+            key = SORT_KEYS.get(column)
+            if key is None:
+                return
+        self.layoutAboutToBeChanged.emit()
+        old_persistent = self.persistentIndexList()
+        old_ids = [self._visible[index.row()].id for index in old_persistent]
+        # 안정 정렬이라 보이는 행만 따로 정렬해도 전체 정렬 후 다시 거른 결과와 순서가 같음 (필터 재실행 불필요)
+        reverse = order == Qt.DescendingOrder
+        self._rows.sort(key=key, reverse=reverse)
+        self._visible.sort(key=key, reverse=reverse)
+        positions = {row.id: i for i, row in enumerate(self._visible)}
+        self.changePersistentIndexList(
+            old_persistent,
+            [
+                self.index(positions[row_id], index.column())
+                for row_id, index in zip(old_ids, old_persistent, strict=True)
+            ],
+        )
+        self.layoutChanged.emit()
+
+
+class NoteNumberDelegate(QStyledItemDelegate):
+    """오답노트 번호 열: 텍스트 편집 + 오른쪽 폴더 아이콘 (클릭 시 folder_clicked(보이는 행 번호))"""
+
+    folder_clicked = Signal(int)
+
+    def _button_rect(self, rect):
+        size = min(FOLDER_BUTTON_SIZE, rect.height())
+        return QRect(rect.right() - size + 1, rect.top() + (rect.height() - size) // 2, size, size)
+
+    def paint(self, painter, option, index):
+        button = self._button_rect(option.rect)
+        text_option = type(option)(option)
+        text_option.rect = option.rect.adjusted(0, 0, -button.width(), 0)
+        super().paint(painter, text_option, index)
+        widget = option.widget
+        style = widget.style() if widget else None
+        if style:
+            icon = style.standardIcon(QStyle.SP_DirIcon)
+            icon.paint(painter, button.adjusted(4, 4, -4, -4))
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() in (QEvent.MouseButtonPress, QEvent.MouseButtonRelease, QEvent.MouseButtonDblClick):
+            if self._button_rect(option.rect).contains(event.position().toPoint()):
+                if event.type() == QEvent.MouseButtonRelease:
+                    self.folder_clicked.emit(index.row())
+                return True
+        return super().editorEvent(event, model, option, index)
+
+    def createEditor(self, parent, option, index):
+        editor = QLineEdit(parent)
+        editor.setFrame(False)
+        return editor
+
+    def updateEditorGeometry(self, editor, option, index):
+        editor.setGeometry(option.rect.adjusted(0, 0, -FOLDER_BUTTON_SIZE, 0))
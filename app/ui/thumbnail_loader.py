@@ -0,0 +1,128 @@
+from collections import OrderedDict
+
+from PySide6.QtCore import QObject, QRunnable, QThread, QThreadPool, Signal
+from PySide6.QtGui import QImage, QPixmap
+
+from config import DEFAULT_THUMBNAIL_DIR
+from services.thumbnail_cache import THUMBNAIL_SIZE, make_thumbnail
+from utils.source_index import get_source_index
+
+# 메모리에 들고 있을 썸네일 픽셀 용량 상한 (160px 썸네일 약 700장)
+THUMBNAIL_MEMORY_BYTES = 64 * 1024 * 1024
+THUMBNAIL_THREADS = 4
+
+
+class _ThumbnailTask(QRunnable):
+    def __init__(self, loader, key, max_px, cache_dir):
+        super().__init__()
+        self.loader = loader
+        self.key = key
+        self.max_px = max_px
+        self.cache_dir = cache_dir
+
+    def run(self):
+        try:
+            image = QImage(make_thumbnail(self.key[0], self.max_px, self.cache_dir))
+        except Exception:
+            image = QImage()
+        self.loader._loaded.emit(self.key, image)
+
+
+class _IndexRefreshTask(QRunnable):
+    """원본 폴더 색인 갱신 (폴더가 크거나 네트워크 공유면 오래 걸리므로 GUI 스레드에서 하지 않음)"""
+
+    def __init__(self, loader, source_dir):
+        super().__init__()
+        self.loader = loader
+        self.source_dir = source_dir
+
+    def run(self):
+        try:
+            get_source_index(self.source_dir)
+        except OSError:
+            pass
+        self.loader._index_done.emit(self.source_dir)
+
+
+class ThumbnailLoader(QObject):
+    """오답노트 이미지 썸네일: 메모리 LRU -> 디스크 캐시 -> 백그라운드 생성 순으로 찾음
+
+    thumbnail() 은 바로 쓸 수 있는 QPixmap 이 없으면 생성을 예약하고 None 을 돌려준다.
+    준비되면 thumbnail_ready(원본 경로) 로 알리므로 GUI 스레드는 디코딩을 기다리지 않는다.
+    """
+
+    thumbnail_ready = Signal(str)
+    index_refreshed = Signal(str)  # 원본 폴더 경로
+    _loaded = Signal(object, QImage)  # 작업 스레드 -> GUI 스레드
+    _index_done = Signal(str)
+
+    def __init__(
+        self, parent=None, cache_dir=DEFAULT_THUMBNAIL_DIR, max_px=THUMBNAIL_SIZE, max_bytes=THUMBNAIL_MEMORY_BYTES
+    ):
+        super().__init__(parent)
+        self.cache_dir = cache_dir
+        self.max_px = max_px
+        self.max_bytes = max_bytes
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(max(1, min(THUMBNAIL_THREADS, QThread.idealThreadCount())))
+        self._pixmaps = OrderedDict()  # (경로, mtime_ns) -> QPixmap
+        self._bytes = 0
+        self._pending = set()
+        self._failed = set()
+        self._refreshing = set()  # 색인 갱신을 예약한 원본 폴더
+        self._loaded.connect(self._on_loaded)
+        self._index_done.connect(self._on_index_done)
+
+    def thumbnail(self, path, mtime_ns):
+        """(경로, mtime) 의 썸네일 QPixmap, 아직 없으면 None (실패한 이미지는 failed() 로 확인)"""
+        key = (path, mtime_ns)
+        pixmap = self._pixmaps.get(key)
+        if pixmap is not None:
+            self._pixmaps.move_to_end(key)
+            return pixmap
+        if key not in self._pending and key not in self._failed:
+            self._pending.add(key)
+            self._pool.start(_ThumbnailTask(self, key, self.max_px, self.cache_dir))
+        return None
+
+    def failed(self, path, mtime_ns):
+        return (path, mtime_ns) in self._failed
+
+    def refresh_index(self, source_dir):
+        """원본 폴더 색인을 백그라운드에서 갱신하고 끝나면 index_refreshed 로 알림 (이미 예약돼 있으면 무시)"""
+        if source_dir in self._refreshing:
+            return
+        self._refreshing.add(source_dir)
+        # 썸네일보다 먼저 실행 (색인이 있어야 어떤 이미지를 보여줄지 알 수 있음)
+        self._pool.start(_IndexRefreshTask(self, source_dir), 1)
+
+    def cancel_pending(self):
+        """아직 시작하지 않은 요청 취소 (다른 학생으로 넘어갔을 때), 실행 중인 것은 끝나면 캐시에만 들어감"""
+        self._pool.clear()
+        self._pending.clear()
+        # 대기 중이던 색인 갱신도 취소되므로 다시 예약할 수 있게 함 (실행 중인 것이 끝나 한 번 더 알려도 무방)
+        self._refreshing.clear()
+
+    def wait(self):
+        self._pool.waitForDone()
+
+    def _on_loaded(self, key, image):
+        self._pending.discard(key)
+        if image.isNull():
+            self._failed.add(key)
+        elif key not in self._pixmaps:
+            pixmap = QPixmap.fromImage(image)
+            self._pixmaps[key] = pixmap
+            self._bytes += self._cost(pixmap)
+            while self._bytes > self.max_bytes and len(self._pixmaps) > 1:
+                _old_key, old = self._pixmaps.popitem(last=False)
+                self._bytes -= self._cost(old)
+        self.thumbnail_ready.emit(key[0])
+
+    def _on_index_done(self, source_dir):
+        self._refreshing.discard(source_dir)
+        self.index_refreshed.emit(source_dir)
+
+    @staticmethod
+    def _cost(pixmap):
+        return pixmap.width() * pixmap.height() * 4
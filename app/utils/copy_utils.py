@@ -1,22 +1,108 @@
+import hashlib
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
+from utils.source_index import get_source_index
+from utils.trace_utils import Tracer, is_trace_enabled, report_trace
 
-def copy_images(file_names, source_dir, target_dir, log_callback):
+# 네트워크 공유/FAT 계열은 mtime 정밀도가 2초라서 그 이내 차이는 같은 파일로 취급
+MTIME_TOLERANCE_NS = 2_000_000_000
+DEFAULT_COPY_WORKERS = 8
+
+
+def _file_hash(path, chunk_size=1024 * 1024):
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def is_unchanged(src_path, src_stat, dst_path, verify_hash=False):
+    """대상 파일이 원본과 같으면 True (크기 + mtime, verify_hash 면 크기 + 내용 해시)"""
+    try:
+        st = os.stat(dst_path)
+    except OSError:
+        return False
+    if st.st_size != src_stat.st_size:
+        return False
+    if verify_hash:
+        return _file_hash(src_path) == _file_hash(dst_path)
+    return abs(st.st_mtime_ns - src_stat.st_mtime_ns) <= MTIME_TOLERANCE_NS
+
+
+def _copy_one(entry, target_dir, verify_hash, tracer):
+    dst_path = os.path.join(target_dir, entry.name)
+    with tracer.span("copy_check", cat="copy"):
+        # 색인의 크기/mtime 은 최대 stale_after 초 전 값이라 (제자리 수정은 폴더 mtime 이 안 바뀜) 원본을 다시 확인
+        src_stat = os.stat(entry.path)
+        unchanged = is_unchanged(entry.path, src_stat, dst_path, verify_hash)
+    if unchanged:
+        return "skipped"
+    with tracer.span("copy_file", cat="copy", name=entry.name, bytes=src_stat.st_size):
+        shutil.copy2(entry.path, dst_path)
+    tracer.count("copy_written_bytes", src_stat.st_size)
+    return "copied"
+
+
+def copy_images(
+    file_names,
+    source_dir,
+    target_dir,
+    log_callback,
+    workers=DEFAULT_COPY_WORKERS,
+    verify_hash=False,
+    verbose=False,
+    tracer=None,
+):
+    """이미지 일괄 복사 (스레드 풀, 변경 없는 파일은 건너뜀), 복사/건너뜀/없음/실패 개수 dict 반환"""
+    owns_tracer = tracer is None
+    if owns_tracer:
+        tracer = Tracer(is_trace_enabled())
     if not os.path.exists(target_dir):
         os.makedirs(target_dir, exist_ok=True)
         log_callback(f"📁 대상 폴더 생성: {target_dir}")
 
-    for name in file_names:
-        matched_file = next(
-            (f for f in os.listdir(source_dir) if os.path.splitext(f)[0] == name), None
-        )
-        if matched_file:
-            shutil.copy2(
-                os.path.join(source_dir, matched_file),
-                os.path.join(target_dir, matched_file),
-            )
-            log_callback(f"✅ 복사됨: {matched_file}")
+    summary = {"copied": 0, "skipped": 0, "missing": 0, "failed": 0}
+
+    # 원본 폴더는 한 번만 스캔 (이름 -> 파일 색인), 중복 이름은 한 번만 복사
+    with tracer.span("source_lookup", cat="copy"):
+        index = get_source_index(source_dir)
+    entries = []
+    for name in dict.fromkeys(file_names):
+        entry = index.lookup(name)
+        if entry:
+            entries.append(entry)
         else:
+            summary["missing"] += 1
             log_callback(f"⚠️ 없음: {name}.*")
 
+    total = len(entries)
+    if total:
+        # 로그는 호출한 스레드에서만 남기고 (GUI 안전), 진행률은 약 10% 단위로 묶어서 보고
+        report_every = max(1, total // 10)
+        done = 0
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, total))) as executor:
+            futures = {executor.submit(_copy_one, entry, target_dir, verify_hash, tracer): entry for entry in entries}
+            for future in as_completed(futures):
+                entry = futures[future]
+                try:
+                    status = future.result()
+                except Exception as e:
+                    status = "failed"
+                    log_callback(f"❌ 복사 실패: {entry.name} ({e})")
+                summary[status] += 1
+                if verbose and status == "copied":
+                    log_callback(f"✅ 복사됨: {entry.name}")
+                done += 1
+                if done % report_every == 0 and done < total:
+                    log_callback(f"📦 복사 진행: {done}/{total}")
+
+    log_callback(
+        f"✅ 복사 완료: 복사 {summary['copied']}개 / 건너뜀 {summary['skipped']}개 / "
+        f"없음 {summary['missing']}개 / 실패 {summary['failed']}개"
+    )
+    if owns_tracer:
+        report_trace(tracer, log_callback, "copy")
+    return summary
@@ -1,11 +1,135 @@
+import atexit
+import os
+import queue
+import sys
+import threading
+import time
 from datetime import datetime
 
 LOG_FILE = "app.log"
+LOG_MAX_BYTES = 5 * 1024 * 1024
+LOG_BACKUP_COUNT = 3
+LOG_FLUSH_INTERVAL = 0.5  # 초, 이 시간 동안 모인 로그를 한 번에 씀
 
+_STOP = object()
 
-def append_log(text_edit, message):
+
+def format_log(message):
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    full_message = f"[{timestamp}] {message}"
-    text_edit.append(full_message)
-    with open(LOG_FILE, "a", encoding="utf-8") as f:
-        f.write(full_message + "\n")
+    return f"[{timestamp}] {message}"
+
+
+class BufferedLogWriter:
+    """로그 파일 기록 전용 백그라운드 스레드 (모아서 쓰기 + 크기 기준 교체)
+
+    write() 는 큐에 넣기만 하므로 호출한 스레드(GUI)를 막지 않는다. 파일은 열어 둔 채로
+    LOG_FLUSH_INTERVAL 동안 모인 줄을 한 번에 쓰고, max_bytes 를 넘으면
+    app.log -> app.log.1 -> ... -> app.log.{backup_count} 로 밀어낸다.
+    """
+
+    def __init__(
+        self,
+        path=LOG_FILE,
+        max_bytes=LOG_MAX_BYTES,
+        backup_count=LOG_BACKUP_COUNT,
+        flush_interval=LOG_FLUSH_INTERVAL,
+    ):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.flush_interval = flush_interval
+        self._queue = queue.SimpleQueue()
+        self._stream = None
+        self._size = 0
+        self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        self._thread.start()
+
+    def write(self, line):
+        self._queue.put(line)
+
+    def close(self, timeout=2.0):
+        """남은 로그를 모두 쓰고 스레드 종료"""
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join(timeout)
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is _STOP:
+                break
+            lines = [item]
+            deadline = time.monotonic() + self.flush_interval
+            while True:
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                lines.append(item)
+            self._write_lines(lines)
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+
+    def _write_lines(self, lines):
+        data = "".join(line + "\n" for line in lines).encode("utf-8")
+        try:
+            if self._stream is None:
+                self._stream = open(self.path, "ab")
+                self._size = self._stream.tell()
+            self._stream.write(data)
+            self._stream.flush()
+            self._size += len(data)
+            if self.max_bytes and self._size >= self.max_bytes:
+                self._rotate()
+        except OSError as e:
+            # 로그 기록 실패로 작업이 멈추지 않도록 알리기만 함
+            print(f"로그 파일 기록 실패: {e}", file=sys.stderr)
+            if self._stream is not None:
+                self._stream.close()
+                self._stream = None
+
+    def _rotate(self):
+        self._stream.close()
+        self._stream = None
+        if self.backup_count <= 0:
+            os.remove(self.path)
+            return
+        for i in range(self.backup_count - 1, 0, -1):
+            src = f"{self.path}.{i}"
+            if os.path.exists(src):
+                os.replace(src, f"{self.path}.{i + 1}")
+        os.replace(self.path, f"{self.path}.1")
+
+
+_writer = None
+_writer_lock = threading.Lock()
+
+
+def get_log_writer():
+    """공용 로그 파일 writer (처음 호출할 때 생성, 프로그램 종료 시 남은 로그를 씀)"""
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = BufferedLogWriter()
+            atexit.register(_writer.close)
+        return _writer
+
+
+def close_log_writer():
+    global _writer
+    with _writer_lock:
+        writer, _writer = _writer, None
+    if writer is not None:
+        writer.close()
+
+
+def append_log(log_panel, message):
+    """로그 패널(LogPanel)에 표시하고 파일 기록은 백그라운드 writer 에 맡김"""
+    full_message = format_log(message)
+    log_panel.append_line(full_message)
+    get_log_writer().write(full_message)
@@ -0,0 +1,129 @@
+import heapq
+import os
+import threading
+import time
+from collections import namedtuple
+
+# 같은 이름(확장자 제외)의 파일이 여러 개일 때 이미지 확장자 우선순위
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp")
+
+SourceEntry = namedtuple("SourceEntry", ["path", "name", "ext", "size", "mtime_ns"])
+
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+
+class SourceIndex:
+    """원본 폴더의 파일명(확장자 제외) -> 실제 파일 정보 색인 (os.scandir 한 번으로 구성)"""
+
+    def __init__(self, source_dir, stale_after=30.0):
+        self.source_dir = source_dir
+        self.stale_after = stale_after
+        self._entries = {}  # 파일명 -> SourceEntry
+        self._by_stem = {}  # 확장자 제외 이름 -> {소문자 확장자: SourceEntry}
+        self._dir_mtime_ns = None
+        self._scanned_at = 0.0
+        self._lock = threading.Lock()
+        self.generation = 0  # 스캔 결과 색인 내용이 바뀔 때마다 증가
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def scanned(self):
+        """한 번이라도 스캔했으면 True (아직이면 lookup 결과가 비어 있음)"""
+        return self._dir_mtime_ns is not None
+
+    def invalidate(self):
+        with self._lock:
+            self._dir_mtime_ns = None
+
+    def refresh(self, force=False):
+        """폴더가 바뀌었을 때만 다시 스캔하고, 달라진 파일만 색인에 반영"""
+        with self._lock:
+            try:
+                dir_mtime_ns = os.stat(self.source_dir).st_mtime_ns
+            except OSError:
+                if self._entries:
+                    self.generation += 1
+                self._entries.clear()
+                self._by_stem.clear()
+                self._dir_mtime_ns = None
+                return
+            # 폴더 mtime 은 파일 추가/삭제/이름변경에만 바뀌므로, 내용 수정 반영을 위해 일정 시간 후엔 다시 스캔
+            fresh = time.monotonic() - self._scanned_at < self.stale_after
+            if not force and fresh and dir_mtime_ns == self._dir_mtime_ns:
+                return
+
+            seen = set()
+            changed = False
+            with os.scandir(self.source_dir) as it:
+                for entry in it:
+                    try:
+                        if not entry.is_file():
+                            continue
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    seen.add(entry.name)
+                    old = self._entries.get(entry.name)
+                    if old is not None and old.size == st.st_size and old.mtime_ns == st.st_mtime_ns:
+                        continue
+                    stem, ext = os.path.splitext(entry.name)
+                    new = SourceEntry(entry.path, entry.name, ext, st.st_size, st.st_mtime_ns)
+                    self._entries[entry.name] = new
+                    self._by_stem.setdefault(stem, {})[ext.lower()] = new
+                    changed = True
+
+            for name in [n for n in self._entries if n not in seen]:
+                changed = True
+                removed = self._entries.pop(name)
+                stem = os.path.splitext(name)[0]
+                exts = self._by_stem.get(stem)
+                if exts is not None:
+                    exts.pop(removed.ext.lower(), None)
+                    if not exts:
+                        del self._by_stem[stem]
+
+            if changed or self._dir_mtime_ns is None:
+                self.generation += 1
+            self._dir_mtime_ns = dir_mtime_ns
+            self._scanned_at = time.monotonic()
+
+    def lookup(self, stem, extensions=None):
+        """이름(확장자 제외)으로 파일 찾기
+
+        extensions 가 주어지면 그 확장자만 순서대로 찾고, 없으면 이미지 확장자를 우선해 아무 파일이나 반환
+        """
+        exts = self._by_stem.get(stem)
+        if not exts:
+            return None
+        for ext in extensions or IMAGE_EXTENSIONS:
+            entry = exts.get(ext)
+            if entry is not None:
+                return entry
+        if extensions is None:
+            return next(iter(exts.values()))
+        return None
+
+    def image_entries(self, limit=None):
+        """이미지 파일 항목을 파일명 순으로 (limit 개까지)"""
+        with self._lock:
+            entries = (entry for entry in self._entries.values() if entry.ext.lower() in IMAGE_EXTENSIONS)
+            # 미리보기처럼 앞쪽 몇 개만 필요할 때는 전체를 정렬하지 않음
+            if limit is not None:
+                return heapq.nsmallest(limit, entries, key=lambda entry: entry.name)
+            return sorted(entries, key=lambda entry: entry.name)
+
+
+def get_source_index(source_dir, refresh=True):
+    """폴더별 공유 색인 반환 (복사/PDF 생성이 같은 색인을 사용)"""
+    key = os.path.normcase(os.path.abspath(source_dir))
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = SourceIndex(source_dir)
+            _indexes[key] = index
+    if refresh:
+        index.refresh()
+    return index
@@ -0,0 +1,150 @@
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+
+TRACE_ENV = "COPYCOPYWA_TRACE"
+TRACE_DIR = "trace"
+
+
+def is_trace_enabled(config=None):
+    """환경변수(COPYCOPYWA_TRACE=1) 또는 설정값(trace_enabled)으로 추적 여부 결정"""
+    if os.environ.get(TRACE_ENV, "").lower() in ("1", "true", "yes", "on"):
+        return True
+    return bool(config and config.get("trace_enabled", False))
+
+
+class _NullSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def set(self, **args):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("tracer", "name", "cat", "args", "ts", "start")
+
+    def __init__(self, tracer, name, cat, args):
+        self.tracer = tracer
+        self.name = name
+        self.cat = cat
+        self.args = args
+
+    def __enter__(self):
+        self.ts = time.time_ns() // 1000
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        dur = (time.perf_counter_ns() - self.start) // 1000
+        self.tracer._add_event(self.name, self.cat, self.ts, dur, self.args)
+        return False
+
+    def set(self, **args):
+        self.args.update(args)
+
+
+class Tracer:
+    """단계별 소요 시간/카운터 수집 (꺼져 있으면 span/count 가 아무 일도 하지 않음)
+
+    이벤트는 Chrome trace(chrome://tracing, Perfetto) 형식으로 저장할 수 있다.
+    """
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.events = []
+        self.counters = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def span(self, stage, /, cat="pdf", **args):
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, stage, cat, args)
+
+    def count(self, name, value=1):
+        if self.enabled:
+            with self._lock:
+                self.counters[name] += value
+
+    def _add_event(self, name, cat, ts, dur, args):
+        event = {
+            "name": name,
+            "cat": cat,
+            "ph": "X",
+            "ts": ts,
+            "dur": dur,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+        }
+        if args:
+            event["args"] = args
+        with self._lock:
+            self.events.append(event)
+
+    def export(self):
+        """다른 프로세스로 넘길 수 있는 형태 (dict)"""
+        return {"events": self.events, "counters": dict(self.counters)}
+
+    def merge(self, exported):
+        if not self.enabled or not exported:
+            return
+        with self._lock:
+            self.events.extend(exported.get("events", []))
+            for name, value in exported.get("counters", {}).items():
+                self.counters[name] += value
+
+    def stage_totals(self):
+        """단계 이름 -> (횟수, 합계 ms)"""
+        totals = defaultdict(lambda: [0, 0])
+        for event in self.events:
+            total = totals[event["name"]]
+            total[0] += 1
+            total[1] += event["dur"]
+        return {name: (count, dur / 1000) for name, (count, dur) in totals.items()}
+
+    def summary_lines(self):
+        lines = []
+        for name, (count, ms) in sorted(self.stage_totals().items(), key=lambda kv: -kv[1][1]):
+            lines.append(f"⏱️ {name}: {ms:.1f} ms ({count}회)")
+        for name, value in sorted(self.counters.items()):
+            if name.endswith("_bytes"):
+                lines.append(f"📊 {name}: {value / 1024 / 1024:.2f} MB")
+            else:
+                lines.append(f"📊 {name}: {value}")
+        return lines
+
+    def dump_chrome_trace(self, path=None, prefix="trace"):
+        """Chrome trace JSON 저장, 저장한 경로 반환"""
+        if path is None:
+            os.makedirs(TRACE_DIR, exist_ok=True)
+            path = os.path.join(TRACE_DIR, f"{prefix}_{time.strftime('%Y%m%d_%H%M%S')}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"traceEvents": self.events, "otherData": {"counters": dict(self.counters)}},
+                f,
+                ensure_ascii=False,
+            )
+        return path
+
+
+def report_trace(tracer, log_callback, prefix="trace"):
+    """추적이 켜져 있으면 단계별 요약을 로그로 남기고 Chrome trace 파일 저장"""
+    if not tracer.enabled:
+        return None
+    for line in tracer.summary_lines():
+        log_callback(line)
+    try:
+        path = tracer.dump_chrome_trace(prefix=prefix)
+    except OSError as e:
+        log_callback(f"❌ trace 파일 저장 실패: {e}")
+        return None
+    log_callback(f"📈 trace 저장: {os.path.abspath(path)}")
+    return path